@@ -1 +1,95 @@
-__path__ = __import__("pkgutil").extend_path(__path__, __name__)
\ No newline at end of file
+"""
+rithm: efficient and robust implementations of advanced algorithms.
+
+Importing rithm loads nothing but this file. The facade functions and the
+classes listed in __all__ are imported from their submodules the first time
+they are looked up, through a module level __getattr__ (PEP 562), and are then
+cached in this module. A script that only calls rithm.fib therefore never
+imports the sorters, and NumPy is only imported once a typed buffer or an
+ndarray is sorted or searched.
+
+Facade:
+- rithm.sort(array): sorts with the best sorter for the input's type and size
+- rithm.search(array, target): finds a target, or a batch of targets, in a
+  sorted array
+- rithm.fib(n): computes F(n), or F(n) for each n of a batch
+
+The classes are still importable from their full paths, and
+rithm.QuickSort is the same object as rithm.sorting.quick.QuickSort.
+
+Example:
+import rithm
+rithm.sort([3, 1, 2])                 # [1, 2, 3]
+rithm.search([1, 3, 3, 7], 3)         # 1
+rithm.fib(90)                         # 2880067194370816120
+rithm.QuickSort([3, 1, 2]).intro_sort()
+
+`python -m rithm.bench --import-only` checks that the import stays cheap.
+"""
+
+import os as _os
+import sys as _sys
+
+
+def _extend_path(path: list) -> list:
+    """
+    Does what pkgutil.extend_path(__path__, __name__) does for plain
+    directories: every rithm directory on sys.path becomes part of the
+    package. Importing pkgutil itself would pull in typing and re, which take
+    ten times longer than the rest of the import.
+    """
+    path = list(path)
+    for entry in _sys.path:
+        if isinstance(entry, str):
+            portion = _os.path.join(entry or _os.getcwd(), __name__)
+            if portion not in path and _os.path.isdir(portion):
+                path.append(portion)
+    return path
+
+
+__path__ = _extend_path(__path__)
+
+# Each public name and the module it is imported from on first use
+_LAZY = {
+    "sort": "rithm.facade",
+    "search": "rithm.facade",
+    "fib": "rithm.facade",
+    "BubbleSort": "rithm.sorting.bubble",
+    "ExternalSort": "rithm.sorting.external",
+    "MergeSort": "rithm.sorting.merge",
+    "ParallelSort": "rithm.sorting.parallel",
+    "QuickSort": "rithm.sorting.quick",
+    "RadixSort": "rithm.sorting.radix",
+    "SelectionSort": "rithm.sorting.selection",
+    "SortStats": "rithm.sorting.stats",
+    "asort": "rithm.sorting.aio",
+    "kway_merge": "rithm.sorting.merge",
+    "BinarySearch": "rithm.searching.binary",
+    "MappedBinarySearch": "rithm.searching.binary",
+    "SortedList": "rithm.searching.sorted_list",
+    "Fibonnaci": "rithm.recursion.fibonnaci",
+}
+# Subpackages that can be reached as attributes without importing them first
+_SUBPACKAGES = ("backend", "bench", "facade", "recursion", "searching", "sorting")
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY[name]), name)
+    elif name in _SUBPACKAGES:
+        from importlib import import_module
+
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find the name directly and skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBPACKAGES))
@@ -0,0 +1,25 @@
+"""
+Helpers for optional dependencies.
+
+Optional dependencies are imported the first time they are needed rather than
+when rithm is imported, so code that never uses them does not pay for them.
+"""
+
+_MISSING = object()
+_numpy = _MISSING
+
+
+def numpy():
+    """
+    Returns the numpy module, or None if it is not installed.
+
+    :return: The numpy module or None.
+    """
+    global _numpy
+    if _numpy is _MISSING:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        _numpy = np
+    return _numpy
@@ -0,0 +1,19 @@
+from .backend import (
+    BACKENDS,
+    get_backend,
+    is_vectorizable,
+    resolve,
+    set_backend,
+    use_backend,
+    use_numpy,
+)
+
+__all__ = [
+    "BACKENDS",
+    "get_backend",
+    "is_vectorizable",
+    "resolve",
+    "set_backend",
+    "use_backend",
+    "use_numpy",
+]
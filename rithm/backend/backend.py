@@ -0,0 +1,149 @@
+"""
+This module chooses between the pure Python and the NumPy implementations.
+
+The sorters and BinarySearch are written as plain Python loops, which is what
+lists need. NumPy arrays and typed buffers (`array.array`, `bytearray`,
+`memoryview`) instead hold fixed width numbers side by side in memory, and
+NumPy's C kernels (np.sort, np.partition, np.searchsorted) process them orders
+of magnitude faster than a Python loop stepping through them one boxed number
+at a time.
+
+Every sort and search method takes a backend argument:
+- "auto" (the default): NumPy for ndarrays and numeric typed buffers when
+  NumPy is installed, pure Python for everything else, including lists
+- "python": always the pure Python loops
+- "numpy": always NumPy, raising ImportError if it is not installed. Lists
+  are converted for the call, and their original elements are put back in
+  the sorted order, so the result holds the same objects as with "python"
+
+The default can be changed for the whole process with set_backend, or for a
+block of code with use_backend.
+
+Example:
+with use_backend("python"):
+    QuickSort(np.array([3, 1, 2])).intro_sort()  # runs the Python loops
+QuickSort(np.array([3, 1, 2])).intro_sort()  # runs ndarray.sort
+"""
+
+import sys
+from array import array as Array
+from contextlib import contextmanager
+from typing import Iterator
+
+from rithm._optional import numpy
+
+BACKENDS = ("auto", "python", "numpy")
+# Buffer element kinds NumPy can sort: bool, signed, unsigned and float
+_NUMERIC_KINDS = "biuf"
+
+_default = "auto"
+
+
+def get_backend() -> str:
+    """
+    :return: The process-wide default backend.
+    """
+    return _default
+
+
+def set_backend(name: str) -> None:
+    """
+    Sets the backend used by calls that do not pass one.
+
+    :param name: "auto", "python" or "numpy".
+
+    :return: None
+    """
+    global _default
+    _default = _check(name)
+
+
+@contextmanager
+def use_backend(name: str) -> Iterator[None]:
+    """
+    Sets the default backend for the duration of a with block.
+
+    :param name: "auto", "python" or "numpy".
+    """
+    global _default
+    previous = _default
+    _default = _check(name)
+    try:
+        yield
+    finally:
+        _default = previous
+
+
+def resolve(array, backend: str | None = None) -> str:
+    """
+    Decides which implementation handles the array.
+
+    :param array: The input of the sort or search.
+    :param backend: "auto", "python", "numpy", or None for the default.
+
+    :return: "python" or "numpy".
+    """
+    if backend is None:
+        backend = _default
+    if backend == "auto":
+        # Lists are the common case, so they are answered before anything else
+        if type(array) is list:
+            return "python"
+        return "numpy" if is_vectorizable(array) else "python"
+    if backend == "python":
+        return "python"
+    if backend == "numpy":
+        if numpy() is None:
+            raise ImportError("The numpy backend needs NumPy to be installed.")
+        return "numpy"
+    raise ValueError(f"Unknown backend: {backend!r}, expected one of {BACKENDS}.")
+
+
+def use_numpy(
+    array,
+    backend: str | None = None,
+    key=None,
+    stats=None,
+    debug: bool = False,
+) -> bool:
+    """
+    Decides whether a sort call goes to the NumPy kernels. Calls with a key
+    function, stats or debug output always run the Python loops, which are
+    the only ones that can call the key or report on their steps.
+
+    :param array: The input of the sort.
+    :param backend: "auto", "python", "numpy", or None for the default.
+    :param key: The key function of the call, if any.
+    :param stats: The SortStats of the call, if any.
+    :param debug: The debug flag of the call.
+
+    :return: True if the NumPy kernels should be used.
+    """
+    if key is not None or stats is not None or debug:
+        return False
+    return resolve(array, backend) == "numpy"
+
+
+def is_vectorizable(array) -> bool:
+    """
+    Checks whether the array is an ndarray or a typed buffer of numbers that
+    NumPy can view without copying.
+
+    :param array: The object to check.
+
+    :return: True if NumPy can sort and search the array in place.
+    """
+    # An ndarray can only exist once NumPy has been imported by someone
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(array, np.ndarray):
+        return array.dtype.kind in _NUMERIC_KINDS
+    if isinstance(array, (Array, bytearray, memoryview)):
+        np = numpy()
+        return np is not None and np.asarray(array).dtype.kind in _NUMERIC_KINDS
+    return False
+
+
+def _check(name: str) -> str:
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name!r}, expected one of {BACKENDS}.")
+    return name
@@ -0,0 +1,242 @@
+"""
+This module holds the NumPy kernels behind the "numpy" backend.
+
+ndarrays and typed buffers are viewed with np.asarray, which shares their
+memory, so in place operations write straight back into the caller's buffer
+and no copy of the data is made. Lists cannot be viewed, so their keys are
+converted to an ndarray, argsorted (or argpartitioned), and the original
+elements are gathered in that order. The gathered list holds the very same
+objects the pure Python sorters would have produced, e.g. ints stay ints even
+when NumPy would have converted them to floats.
+
+The keys of a list are only used when every one of them survives the
+conversion unchanged (see lossless). Otherwise, e.g. for ints beyond 2**53
+mixed with floats, or for strings and tuples, the order is computed by
+Python's sorted on the elements themselves, so the numpy backend never
+returns a different order than the python one.
+
+Reverse sorts are stable in the same way as sorted(reverse=True): equal
+elements keep their original order. For lists this is done by argsorting the
+keys back to front and mapping the indices back.
+"""
+
+from array import array as Array
+from typing import Sequence
+
+from rithm._optional import numpy
+from rithm.backend.backend import _NUMERIC_KINDS, is_vectorizable
+
+
+def sort(
+    array,
+    kind: str = "quicksort",
+    reverse: bool = False,
+    low: int = 0,
+    high: int | None = None,
+) -> None:
+    """
+    Sorts array[low:high + 1] in place.
+
+    :param array: A list, ndarray or typed buffer.
+    :param kind: The np.sort kind: "quicksort" (introsort), "stable" (Timsort,
+        or radix sort for small integers) or "heapsort".
+    :param reverse: If True, sorts in descending order.
+    :param low: The starting index of the slice to sort.
+    :param high: The ending index of the slice to sort. Defaults to the last
+        index of the array.
+
+    :return: None
+    """
+    if high is None:
+        high = len(array) - 1
+    if high <= low:
+        return
+
+    if is_vectorizable(array):
+        view = numpy().asarray(array)[low : high + 1]
+        view.sort(kind=kind)
+        if reverse:
+            view[:] = view[::-1]
+    else:
+        items = array[low : high + 1]
+        array[low : high + 1] = _gather(items, _argsort(items, reverse))
+
+
+def sorted_copy(array, kind: str = "quicksort", reverse: bool = False):
+    """
+    Returns a sorted copy of the array, leaving the array untouched.
+
+    :param array: A list, ndarray, typed buffer or any other sequence.
+    :param kind: The np.sort kind.
+    :param reverse: If True, sorts in descending order.
+
+    :return: A copy of the same type for ndarray, memoryview, `array.array`
+        and `bytearray` input, and a list otherwise.
+    """
+    if isinstance(array, (Array, bytearray)):
+        copy = array[:]
+        sort(copy, kind, reverse)
+        return copy
+    if is_vectorizable(array):
+        copy = numpy().sort(numpy().asarray(array), kind=kind)
+        if reverse:
+            copy = copy[::-1].copy()
+        # The pure Python sorters copy a memoryview into a memoryview too
+        return memoryview(copy) if isinstance(array, memoryview) else copy
+
+    items = array if isinstance(array, list) else list(array)
+    return _gather(items, _argsort(items, reverse))
+
+
+def select(array, k: int, low: int = 0, high: int | None = None):
+    """
+    Partially sorts array[low:high + 1] in place so that array[k] holds the
+    element it would hold if the slice was sorted, with no larger elements
+    before it and no smaller ones after it.
+
+    :param array: A list, ndarray or typed buffer.
+    :param k: The index of the element to select.
+    :param low: The starting index of the slice.
+    :param high: The ending index of the slice. Defaults to the last index.
+
+    :return: The k-th smallest element.
+    """
+    if high is None:
+        high = len(array) - 1
+    if not low <= k <= high:
+        raise IndexError("k is out of bounds.")
+
+    if is_vectorizable(array):
+        view = numpy().asarray(array)[low : high + 1]
+        view.partition(k - low)
+        return view[k - low].item()
+
+    items = array[low : high + 1]
+    order = _argpartition(items, k - low)
+    array[low : high + 1] = _gather(items, order)
+    return array[k]
+
+
+def smallest(array, k: int) -> list:
+    """
+    :return: A new list of the k smallest elements in ascending order.
+    """
+    np = numpy()
+    n = len(array)
+    k = min(k, n)
+    if k <= 0:
+        return []
+    if not is_vectorizable(array):
+        items = array if isinstance(array, list) else list(array)
+        if k < n:
+            # Back in index order, so equal elements keep their original order
+            items = _gather(items, sorted(_argpartition(items, k - 1)[:k]))
+        return _gather(items, _argsort(items, False))
+
+    values = np.array(array)
+    if k < n:
+        values.partition(k - 1)
+    return np.sort(values[:k]).tolist()
+
+
+def largest(array, k: int) -> list:
+    """
+    :return: A new list of the k largest elements in descending order.
+    """
+    np = numpy()
+    n = len(array)
+    k = min(k, n)
+    if k <= 0:
+        return []
+    if not is_vectorizable(array):
+        items = array if isinstance(array, list) else list(array)
+        if k < n:
+            items = _gather(items, sorted(_argpartition(items, n - k)[n - k :]))
+        return _gather(items, _argsort(items, True))
+
+    values = np.array(array)
+    if k < n:
+        values.partition(n - k)
+    return np.sort(values[n - k :])[::-1].tolist()
+
+
+def searchsorted(array, targets, side: str = "left"):
+    """
+    Finds the insertion points of the targets in the sorted array.
+
+    :param array: A sorted ndarray or typed buffer.
+    :param targets: One value or a sequence of values.
+    :param side: "left" for the lower bound, "right" for the upper bound.
+
+    :return: An int for a single target, otherwise an ndarray of indices.
+    """
+    indices = numpy().searchsorted(numpy().asarray(array), targets, side=side)
+    return int(indices) if indices.ndim == 0 else indices
+
+
+def is_sorted(array) -> bool:
+    """Checks that the array is in non-descending order, in one vector pass."""
+    view = numpy().asarray(array)
+    return bool((view[:-1] <= view[1:]).all())
+
+
+def lossless(values, dtype=None):
+    """
+    Converts values to a flat numeric ndarray, of dtype if given.
+
+    :param values: A list, ndarray, typed buffer or other sequence.
+    :param dtype: Optional dtype to convert to.
+
+    :return: The ndarray, or None if the values are not numbers or any of
+        them would change in the conversion.
+    """
+    np = numpy()
+    try:
+        # Casts that go wrong are detected below, so their warnings are muted
+        with np.errstate(all="ignore"):
+            converted = np.asarray(values, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if converted.ndim != 1 or converted.dtype.kind not in _NUMERIC_KINDS:
+        return None
+    source = getattr(values, "dtype", None)
+    if source is None and isinstance(values, (Array, bytearray, memoryview)):
+        source = np.asarray(values).dtype
+    if source is not None and (dtype is None or np.can_cast(source, dtype, "safe")):
+        return converted
+    # Python objects, or numbers cast to a narrower type, must survive the
+    # round trip exactly, which rules out e.g. 2**53 + 1 becoming a float
+    original = values.tolist() if hasattr(values, "tolist") else list(values)
+    return converted if converted.tolist() == original else None
+
+
+def _argsort(items: Sequence, reverse: bool):
+    """
+    Returns the stable sorting order of the items, as an ndarray of indices,
+    or as a list when their keys do not convert to NumPy without loss.
+    """
+    keys = lossless(items)
+    if keys is None:
+        return sorted(range(len(items)), key=items.__getitem__, reverse=reverse)
+    if not reverse:
+        return keys.argsort(kind="stable")
+    # Sorting the reversed keys keeps equal keys in reverse order, which the
+    # final flip turns back into their original order
+    return len(keys) - 1 - keys[::-1].argsort(kind="stable")[::-1]
+
+
+def _argpartition(items: Sequence, k: int):
+    """
+    Returns an order of the items that puts the k-th smallest at index k,
+    which is the full sorting order when their keys are not lossless.
+    """
+    keys = lossless(items)
+    if keys is None:
+        return _argsort(items, False)
+    return numpy().argpartition(keys, k)
+
+
+def _gather(items: Sequence, order) -> list:
+    if not isinstance(order, list):
+        order = order.tolist()
+    return [items[i] for i in order]
@@ -0,0 +1,3 @@
+from .bench import DISTRIBUTIONS, SIZES, compare, main, run
+
+__all__ = ["DISTRIBUTIONS", "SIZES", "compare", "main", "run"]
@@ -0,0 +1,5 @@
+import sys
+
+from rithm.bench import main
+
+sys.exit(main())
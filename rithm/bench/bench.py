@@ -0,0 +1,723 @@
+"""
+This module benchmarks every rithm algorithm across input sizes and shapes.
+
+Each case is timed on inputs of size n = 1e2 up to 1e7 drawn from six
+distributions:
+- random: uniform integers in [0, n)
+- sorted: 0, 1, ..., n - 1
+- reversed: n, n - 1, ..., 1
+- few-unique: uniform integers in [0, 10)
+- organ-pipe: ascending to the middle, then descending
+- nearly-sorted: sorted, with 1% of the elements swapped at random
+
+Every measurement reports:
+- seconds: the best of `repeat` runs, each on a fresh copy of the input
+- throughput: items per second, i.e. elements sorted, probes searched or
+  Fibonacci numbers produced
+- peak_bytes: the peak memory traced by tracemalloc during one extra run
+- allocations: the lists and buffers counted by SortStats, for the sorters
+  that accept stats=...
+- peak_ratio: for the buffer.* cases, which sort an array('q') with the pure
+  Python backend, the input's raw size plus peak_bytes, as a multiple of the
+  raw size. An in place sort with one scratch buffer comes out near 2
+- baseline_ratio: seconds relative to the builtin baseline of the group,
+  `sorted` for the sorters and `bisect` for the searches
+
+Cases have a size limit, so the quadratic sorters and the exponential fib are
+skipped rather than run for hours at 1e7. The exponential fib only runs for
+n <= 25, so it needs a small size such as --sizes 20. A case that raises, such as the
+recursive quick sort hitting the recursion limit on sorted input, records the
+error and the run carries on.
+
+Results are emitted as JSON, one record per (case, distribution, n), so two
+runs can be diffed between commits with --compare. The JSON also records the
+base case kernels and cutoffs QuickSort and MergeSort used for small slices.
+--tune first picks them by benchmarking with `rithm.sorting.small.tune`, so
+the rest of the run, and the recorded values, use the tuned base cases.
+
+Example:
+python -m rithm.bench --sizes 1e2,1e3 --only quick --json results.json
+python -m rithm.bench --sizes 1e2,1e3 --only quick --compare results.json
+python -m rithm.bench --tune --only quick,merge
+python -m rithm.bench --import-only
+
+Import time:
+Every run also times `import rithm` in fresh interpreters with -X importtime,
+and lists the modules the import loaded. The top level package only sets up
+its lazy facade, so the import must stay below --import-limit milliseconds
+and must not load any rithm submodule or NumPy. If it does, the run still
+completes, and then exits with status 1, so the check can guard CI against
+import time regressions. --import-only runs just this check.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array as Array
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+from rithm.recursion.fibonnaci import Fibonnaci
+from rithm.searching.binary import BinarySearch
+from rithm.sorting.bubble import BubbleSort
+from rithm.sorting.external import ExternalSort
+from rithm.sorting.merge import MergeSort
+from rithm.sorting.parallel import ParallelSort
+from rithm.sorting.quick import QuickSort
+from rithm.sorting.radix import RadixSort
+from rithm.sorting.selection import SelectionSort
+from rithm.sorting.small import (
+    SORTERS,
+    binary_insertion_sort,
+    cocktail_sort,
+    double_selection_sort,
+    get_base_case,
+    insertion_sort,
+    tune,
+)
+from rithm.sorting.stats import SortStats
+
+SIZES = (10**2, 10**3, 10**4, 10**5, 10**6, 10**7)
+# The default sweep stops at 1e5 so a plain run finishes in minutes
+DEFAULT_SIZES = (10**2, 10**3, 10**4, 10**5)
+# Probes per search case, drawn from the array so every lookup is a hit
+_PROBES = 10_000
+# Stop repeating a measurement once it has taken this many seconds in total
+_TIME_BUDGET = 1.0
+# Instrumented runs are much slower, so allocations are counted up to this size
+_STATS_LIMIT = 10**5
+_MODULUS = 10**9 + 7
+# `import rithm` may take at most this many milliseconds. It takes about 0.3 ms
+# from byte code, and a few ms when it has to be compiled first.
+IMPORT_LIMIT_MS = 5.0
+# Modules that `import rithm` must leave to the first use of the facade
+_LAZY_PREFIXES = ("rithm.", "numpy")
+
+
+def _random(n: int, rng: random.Random) -> list:
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def _sorted(n: int, rng: random.Random) -> list:
+    return list(range(n))
+
+
+def _reversed(n: int, rng: random.Random) -> list:
+    return list(range(n, 0, -1))
+
+
+def _few_unique(n: int, rng: random.Random) -> list:
+    return [rng.randrange(10) for _ in range(n)]
+
+
+def _organ_pipe(n: int, rng: random.Random) -> list:
+    half = n // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+def _nearly_sorted(n: int, rng: random.Random) -> list:
+    data = list(range(n))
+    for _ in range(max(1, n // 100)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+DISTRIBUTIONS: dict = {
+    "random": _random,
+    "sorted": _sorted,
+    "reversed": _reversed,
+    "few-unique": _few_unique,
+    "organ-pipe": _organ_pipe,
+    "nearly-sorted": _nearly_sorted,
+}
+
+
+class Case(object):
+    def __init__(
+        self,
+        name: str,
+        group: str,
+        prepare: Callable,
+        limit: int | None = None,
+        instrument: Callable | None = None,
+        baseline: bool = False,
+        typecode: str | None = None,
+    ) -> None:
+        """
+        A single benchmarked operation.
+
+        :param name: The name the case is reported under.
+        :param group: "sorting", "searching" or "fibonacci".
+        :param prepare: Function called as prepare(data, n) that does any
+            untimed setup, such as copying the input, and returns a
+            zero-argument function to time. For the Fibonacci cases data is
+            None and n is the index.
+        :param limit: The largest n the case is run for, or None for no limit.
+        :param instrument: Optional function called as instrument(data, stats)
+            that runs the case once with a SortStats.
+        :param baseline: If True, the other cases of the group are compared
+            against this one.
+        :param typecode: The array.array typecode the case copies its input
+            into, if it sorts a typed buffer rather than a list. Its peak
+            memory is then also reported relative to the raw buffer size.
+        """
+        self.name = name
+        self.group = group
+        self.prepare = prepare
+        self.limit = limit
+        self.instrument = instrument
+        self.baseline = baseline
+        self.typecode = typecode
+
+
+def _sorter(name: str, sort: Callable, limit: int | None = None, stats=True) -> Case:
+    """Builds a sorting case from sort(array, stats) that sorts a copy."""
+    return Case(
+        name,
+        "sorting",
+        lambda data, n: lambda copy=data[:]: sort(copy, None),
+        limit=limit,
+        instrument=(lambda data, s: sort(data[:], s)) if stats else None,
+    )
+
+
+def _buffer_sorter(name: str, sort: Callable) -> Case:
+    """Builds a sorting case from sort(array) that sorts an array('q') copy."""
+    return Case(
+        name,
+        "sorting",
+        lambda data, n: lambda copy=Array("q", data): sort(copy),
+        typecode="q",
+    )
+
+
+def _searcher(name: str, search: Callable, index: bool = False) -> Case:
+    """Builds a search case from search(searcher, probes) on the sorted data."""
+
+    def prepare(data: list, n: int) -> Callable:
+        searcher = BinarySearch(sorted(data), assume_sorted=True)
+        if index:
+            searcher.build_index()
+        rng = random.Random(n)
+        probes = [rng.choice(searcher.array) for _ in range(_PROBES)]
+        return lambda: search(searcher, probes)
+
+    return Case(name, "searching", prepare)
+
+
+def _search_loop(searcher: BinarySearch, probes: list) -> None:
+    for probe in probes:
+        searcher.search(probe)
+
+
+def _bisect_loop(searcher: BinarySearch, probes: list) -> None:
+    array = searcher.array
+    for probe in probes:
+        bisect_left(array, probe)
+
+
+def _fibonacci(name: str, run: Callable, limit: int | None = None) -> Case:
+    """Builds a Fibonacci case from run(n), clearing the shared cache first."""
+
+    def prepare(data: None, n: int) -> Callable:
+        Fibonnaci.clear_cache()
+        return lambda: run(n)
+
+    return Case(name, "fibonacci", prepare, limit=limit)
+
+
+def _consume(iterator: Iterable) -> None:
+    for _ in iterator:
+        pass
+
+
+def _quick_inplace(array: list, stats: SortStats | None) -> None:
+    QuickSort(array).inplace_sort(0, len(array) - 1, stats=stats)
+
+
+def _quick_intro(array: list, stats: SortStats | None) -> None:
+    QuickSort(array).intro_sort(stats=stats)
+
+
+def _cases() -> list:
+    return [
+        Case(
+            "sorted",
+            "sorting",
+            lambda data, n: lambda copy=data[:]: copy.sort(),
+            baseline=True,
+        ),
+        _sorter("quick.inplace_sort", _quick_inplace),
+        _sorter("quick.intro_sort", _quick_intro),
+        _sorter(
+            "quick.non_inplace_sort",
+            lambda a, s: QuickSort(a).non_inplace_sort(stats=s),
+            limit=10**6,
+        ),
+        _sorter("merge.sort", lambda a, s: MergeSort(a).sort(stats=s)),
+        _sorter(
+            "merge.bottom_up_sort", lambda a, s: MergeSort(a).bottom_up_sort(stats=s)
+        ),
+        _sorter(
+            "merge.adaptive_sort", lambda a, s: MergeSort(a).adaptive_sort(stats=s)
+        ),
+        _buffer_sorter(
+            "buffer.merge.sort", lambda a: MergeSort(a).sort(backend="python")
+        ),
+        _buffer_sorter(
+            "buffer.merge.bottom_up_sort",
+            lambda a: MergeSort(a).bottom_up_sort(backend="python"),
+        ),
+        _buffer_sorter(
+            "buffer.merge.adaptive_sort",
+            lambda a: MergeSort(a).adaptive_sort(backend="python"),
+        ),
+        _buffer_sorter(
+            "buffer.quick.intro_sort",
+            lambda a: QuickSort(a).intro_sort(backend="python"),
+        ),
+        _buffer_sorter(
+            "buffer.quick.non_inplace_sort",
+            lambda a: QuickSort(a).non_inplace_sort(backend="python"),
+        ),
+        _buffer_sorter(
+            "buffer.radix.sort", lambda a: RadixSort(a).sort(backend="python")
+        ),
+        _sorter("bubble.sort", lambda a, s: BubbleSort(a).sort(stats=s), 10**4),
+        _sorter("selection.sort", lambda a, s: SelectionSort(a).sort(stats=s), 10**4),
+        _sorter("small.insertion_sort", lambda a, s: insertion_sort(a), 10**4, False),
+        _sorter(
+            "small.binary_insertion_sort",
+            lambda a, s: binary_insertion_sort(a),
+            10**4,
+            False,
+        ),
+        _sorter("small.cocktail_sort", lambda a, s: cocktail_sort(a), 10**4, False),
+        _sorter(
+            "small.double_selection_sort",
+            lambda a, s: double_selection_sort(a),
+            10**4,
+            False,
+        ),
+        _sorter("radix.sort", lambda a, s: RadixSort(a).sort(), stats=False),
+        _sorter(
+            "parallel.sort", lambda a, s: ParallelSort(a).sort("merge"), stats=False
+        ),
+        _sorter(
+            "parallel.sample_sort",
+            lambda a, s: ParallelSort(a).sort("sample"),
+            stats=False,
+        ),
+        _sorter(
+            "external.sort", lambda a, s: _consume(ExternalSort(a).sort()), stats=False
+        ),
+        _searcher("bisect", _bisect_loop),
+        _searcher("binary.search", _search_loop),
+        _searcher("binary.search_indexed", _search_loop, index=True),
+        _searcher("binary.search_many", lambda s, probes: s.search_many(probes)),
+        _searcher(
+            "binary.lower_bound",
+            lambda s, probes: [s.lower_bound(probe) for probe in probes],
+        ),
+        _fibonacci("fib.fib", Fibonnaci.fib, limit=25),
+        _fibonacci("fib.fib_memo", Fibonnaci.fib_memo, limit=500),
+        _fibonacci("fib.fib_fast", Fibonnaci.fib_fast),
+        _fibonacci("fib.fib_matrix", Fibonnaci.fib_matrix, limit=10**6),
+        _fibonacci("fib.fib_mod", lambda n: Fibonnaci.fib_mod(n, _MODULUS)),
+        _fibonacci("fib.fib_cached", Fibonnaci.fib_cached),
+        _fibonacci("fib.fib_many", lambda n: Fibonnaci.fib_many(range(n)), limit=10**4),
+        _fibonacci(
+            "fib.fib_iter", lambda n: _consume(Fibonnaci.fib_iter(0, n)), limit=10**5
+        ),
+    ]
+
+
+def _items(case: Case, n: int) -> int:
+    """The number of items one run of the case processes."""
+    if case.group == "searching":
+        return _PROBES
+    if case.group == "fibonacci" and case.name not in ("fib.fib_many", "fib.fib_iter"):
+        return 1
+    return n
+
+
+def _time(case: Case, data: list | None, n: int, repeat: int) -> float:
+    """Returns the best time of up to `repeat` runs, each freshly prepared."""
+    best = float("inf")
+    spent = 0.0
+    for _ in range(repeat):
+        run = case.prepare(data, n)
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent > _TIME_BUDGET:
+            break
+    return best
+
+
+def _peak_bytes(case: Case, data: list | None, n: int) -> int:
+    """Returns the peak memory traced while running the case once."""
+    run = case.prepare(data, n)
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(
+    case: Case,
+    shape: str | None,
+    data: list | None,
+    n: int,
+    repeat: int,
+    memory: bool,
+) -> dict:
+    result = {"group": case.group, "case": case.name, "distribution": shape, "n": n}
+    try:
+        seconds = _time(case, data, n, repeat)
+        result["seconds"] = seconds
+        result["throughput"] = _items(case, n) / seconds if seconds else None
+        if memory:
+            result["peak_bytes"] = _peak_bytes(case, data, n)
+            if case.typecode is not None and n:
+                raw = n * Array(case.typecode).itemsize
+                result["peak_ratio"] = (raw + result["peak_bytes"]) / raw
+        if case.instrument is not None and n <= _STATS_LIMIT:
+            stats = SortStats()
+            case.instrument(data, stats)
+            result["allocations"] = stats.allocations
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    distributions: Iterable[str] | None = None,
+    only: Iterable[str] | None = None,
+    repeat: int = 3,
+    memory: bool = True,
+    seed: int = 0,
+    progress: Callable[[dict], None] | None = None,
+) -> list:
+    """
+    Runs the benchmark and returns one result dict per measurement.
+
+    :param sizes: The input sizes to run.
+    :param distributions: Names from DISTRIBUTIONS to run, or None for all.
+    :param only: If given, only cases whose name or group starts with one of
+        these prefixes are run. Baselines always run so ratios can be
+        computed.
+    :param repeat: The number of timed runs, of which the best is reported.
+    :param memory: If True, measures the peak memory with tracemalloc.
+    :param seed: Seed for the random input distributions.
+    :param progress: Optional function called with each result as it is made.
+
+    :return: A list of result dicts.
+    """
+    names = list(DISTRIBUTIONS) if distributions is None else list(distributions)
+    for name in names:
+        if name not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution: {name}")
+
+    prefixes = None if only is None else tuple(only)
+    cases = [
+        case
+        for case in _cases()
+        if prefixes is None
+        or case.baseline
+        or case.name.startswith(prefixes)
+        or case.group.startswith(prefixes)
+    ]
+    groups = {case.group for case in cases if not case.baseline}
+
+    results = []
+    for n in sizes:
+        n = int(n)
+        for group in ("sorting", "searching", "fibonacci"):
+            if group not in groups:
+                continue
+            members = [case for case in cases if case.group == group]
+            # Fibonacci numbers do not depend on an input distribution
+            shapes = [None] if group == "fibonacci" else names
+            for shape in shapes:
+                data = None
+                if shape is not None:
+                    data = DISTRIBUTIONS[shape](n, random.Random(seed))
+
+                baseline = None
+                for case in members:
+                    if case.limit is not None and n > case.limit:
+                        continue
+                    result = _measure(case, shape, data, n, repeat, memory)
+                    if case.baseline:
+                        baseline = result.get("seconds")
+                    elif baseline and "seconds" in result:
+                        result["baseline_ratio"] = result["seconds"] / baseline
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+    return results
+
+
+def import_time(module: str = "rithm", repeat: int = 5) -> dict:
+    """
+    Times importing a module in fresh interpreters with -X importtime.
+
+    :param module: The module to import.
+    :param repeat: The number of interpreters to start, of which the fastest
+        import is reported.
+
+    :return: A dict with the "module", its best import time in "seconds",
+        and the "modules" that importing it loaded.
+    """
+    # The interpreters must import this copy of rithm, wherever it lives
+    root = os.path.dirname(os.path.abspath(sys.modules["rithm"].__path__[0]))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (root, env.get("PYTHONPATH")) if path
+    )
+
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # Lines read "import time: self [us] | cumulative | name", children
+        # first and indented by two spaces per level, then the module itself
+        rows = []
+        for line in process.stderr.splitlines():
+            if line.startswith("import time:") and "[us]" not in line:
+                _, cumulative, name = line[len("import time:") :].split("|")
+                rows.append((int(cumulative), name.rstrip()))
+        end = max(i for i, (_, name) in enumerate(rows) if name == f" {module}")
+        start = end
+        while start > 0 and rows[start - 1][1].startswith("   "):
+            start -= 1
+        seconds = rows[end][0] / 1e6
+        if best is None or seconds < best["seconds"]:
+            best = {
+                "module": module,
+                "seconds": seconds,
+                "modules": [name.strip() for _, name in rows[start:end]],
+            }
+    return best
+
+
+def check_import(result: dict, limit_ms: float = IMPORT_LIMIT_MS) -> list:
+    """
+    Checks an import_time result against the limits of the lazy facade.
+
+    :param result: The result of import_time.
+    :param limit_ms: The slowest acceptable import, in milliseconds.
+
+    :return: A list of problems, empty if the import is fine.
+    """
+    problems = []
+    if result["seconds"] * 1e3 > limit_ms:
+        problems.append(
+            f"import {result['module']} took {result['seconds'] * 1e3:.2f} ms, "
+            f"over the limit of {limit_ms} ms"
+        )
+    eager = [name for name in result["modules"] if name.startswith(_LAZY_PREFIXES)]
+    if eager:
+        problems.append(
+            f"import {result['module']} loaded {', '.join(eager)}, which should "
+            "only be imported on first use"
+        )
+    return problems
+
+
+def compare(old: list, new: list) -> list:
+    """
+    Matches two result lists by (case, distribution, n).
+
+    :param old: Results of an earlier run, e.g. loaded from its JSON.
+    :param new: Results of the current run.
+
+    :return: A list of (case, distribution, n, old seconds, new seconds,
+        new / old) tuples for the measurements that both runs completed.
+    """
+    before = {
+        (r["case"], r["distribution"], r["n"]): r["seconds"]
+        for r in old
+        if "seconds" in r
+    }
+    matched = []
+    for r in new:
+        key = (r["case"], r["distribution"], r["n"])
+        if key in before and "seconds" in r:
+            matched.append(
+                (*key, before[key], r["seconds"], r["seconds"] / before[key])
+            )
+    return matched
+
+
+def _format(result: dict) -> str:
+    label = f"{result['case']:<24} {result['distribution'] or '-':<14} n={result['n']:<9.0e}"
+    if "error" in result:
+        return f"{label} {result['error']}"
+    line = f"{label} {result['seconds'] * 1e3:>10.3f} ms"
+    if result["throughput"]:
+        line += f" {result['throughput'] / 1e6:>9.3f} M/s"
+    if "peak_bytes" in result:
+        line += f" peak {result['peak_bytes'] / 1024:>10.1f} KiB"
+    if "peak_ratio" in result:
+        line += f" ({result['peak_ratio']:.2f}x raw)"
+    if "allocations" in result:
+        line += f" allocs {result['allocations']}"
+    if "baseline_ratio" in result:
+        line += f" {result['baseline_ratio']:.1f}x baseline"
+    return line
+
+
+def _sizes(text: str) -> list:
+    return [int(float(size)) for size in text.split(",") if size]
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m rithm.bench",
+        description="Benchmarks the rithm algorithms across sizes and inputs.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_sizes,
+        default=list(DEFAULT_SIZES),
+        help="comma separated sizes, e.g. 1e2,1e3,1e4,1e5,1e6,1e7",
+    )
+    parser.add_argument(
+        "--distributions",
+        type=lambda text: text.split(","),
+        default=None,
+        help="comma separated subset of: " + ", ".join(DISTRIBUTIONS),
+    )
+    parser.add_argument(
+        "--only",
+        type=lambda text: text.split(","),
+        default=None,
+        help="comma separated case or group prefixes, e.g. quick,searching",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc run"
+    )
+    parser.add_argument(
+        "--json", metavar="PATH", help="write the results as JSON, - for stdout"
+    )
+    parser.add_argument(
+        "--compare", metavar="PATH", help="compare with the JSON of an earlier run"
+    )
+    parser.add_argument(
+        "--tune",
+        action="store_true",
+        help="tune the QuickSort and MergeSort base cases before the run",
+    )
+    parser.add_argument(
+        "--import-limit",
+        type=float,
+        default=IMPORT_LIMIT_MS,
+        metavar="MS",
+        help="fail if `import rithm` takes longer than this many milliseconds",
+    )
+    parser.add_argument(
+        "--import-only",
+        action="store_true",
+        help="only time `import rithm` and check it against --import-limit",
+    )
+    args = parser.parse_args(argv)
+
+    # With JSON on stdout the progress lines go to stderr instead
+    stream = sys.stderr if args.json == "-" else sys.stdout
+    imported = import_time(repeat=args.repeat)
+    problems = check_import(imported, args.import_limit)
+    print(
+        f"{'import rithm':<24} {imported['seconds'] * 1e3:>10.3f} ms, "
+        f"{len(imported['modules'])} modules loaded",
+        file=stream,
+        flush=True,
+    )
+    for problem in problems:
+        print(f"Import regression: {problem}", file=stream, flush=True)
+    if args.import_only:
+        return 1 if problems else 0
+
+    if args.tune:
+        for sorter, tuned in tune(seed=args.seed).items():
+            print(
+                f"Tuned {sorter}: {tuned['kernel']} for slices of up to "
+                f"{tuned['cutoff']} elements",
+                file=stream,
+                flush=True,
+            )
+    results = run(
+        sizes=args.sizes,
+        distributions=args.distributions,
+        only=args.only,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        seed=args.seed,
+        progress=lambda result: print(_format(result), file=stream, flush=True),
+    )
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "base_cases": {
+            sorter: dict(zip(("kernel", "cutoff"), get_base_case(sorter)))
+            for sorter in SORTERS
+        },
+        "import": imported,
+        "results": results,
+    }
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            old_report = json.load(f)
+        old = old_report["results"]
+        print("\nCompared with", args.compare, file=stream)
+        # Reports written before the import check have no "import" entry
+        if "import" in old_report:
+            before = old_report["import"]["seconds"]
+            after = imported["seconds"]
+            print(
+                f"{'import rithm':<24} {'-':<14} {'':<11} "
+                f"{before * 1e3:>10.3f} -> {after * 1e3:>10.3f} ms "
+                f"({after / before:.2f}x)",
+                file=stream,
+            )
+        for case, shape, n, before, after, ratio in compare(old, results):
+            print(
+                f"{case:<24} {shape or '-':<14} n={n:<9.0e} "
+                f"{before * 1e3:>10.3f} -> {after * 1e3:>10.3f} ms ({ratio:.2f}x)",
+                file=stream,
+            )
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+from .facade import fib, search, sort
+
+__all__ = ["fib", "search", "sort"]
@@ -0,0 +1,189 @@
+"""
+This module implements rithm's flat facade: sort, search and fib pick the best
+of rithm's algorithms for the input they are given.
+
+The algorithms are imported inside the functions rather than at the top of
+the module, so each function only loads what it calls: rithm.fib never
+imports a sorter, and NumPy is only imported when a typed buffer or an
+ndarray arrives.
+
+sort:
+- ndarrays and numeric typed buffers, when NumPy is installed: NumPy's
+  stable sort, in C on the buffer itself
+- lists: list.sort, the C implementation of the Timsort that
+  MergeSort.adaptive_sort implements in Python
+- integer typed buffers of at least _RADIX_MIN elements: RadixSort. Above a
+  thousand elements its linear passes beat merging even for 40 bit keys, and
+  for small key ranges they win from about a hundred elements
+- smaller or non-integer typed buffers: MergeSort.adaptive_sort, which sorts
+  anything below its minimum run length with binary insertion alone
+- any other iterable is copied into a new list first, like sorted()
+
+All of them are stable, and lists and buffers are sorted in place.
+
+search:
+The array must be sorted, as for any binary search. A single target is looked
+up with bisect, or with np.searchsorted for an ndarray. A list or ndarray of
+targets is handed to BinarySearch.search_many, which searches the whole batch
+in one call instead of one call per target. Tuples are single targets, as
+sorted tuples are common keys. A list array is searched in Python unless a
+backend is passed: converting it to NumPy costs O(n) on every call.
+
+fib:
+A single n, an int or a NumPy integer, is computed with fast doubling, in
+O(log n) multiplications. A batch of n is computed with Fibonnaci.fib_many,
+which walks from one n to the next through the shared cache. With a modulus,
+every n of a batch is computed with fast doubling mod m, the same as a single
+n.
+
+Example:
+sort([3, 1, 2])                       # [1, 2, 3]
+sort(["bb", "a", "ccc"], key=len)     # ["a", "bb", "ccc"]
+search([1, 3, 3, 7], 3)               # 1
+search([1, 3, 3, 7], [7, 5, 1])       # [3, None, 0]
+fib(10), fib([10, 20]), fib(10, 7)    # 55, [55, 6765], 6
+"""
+
+import sys
+from array import array as Array
+from numbers import Integral
+from operator import index
+from typing import Callable, Iterable, MutableSequence, Sequence
+
+# Integer typed buffers at least this long are radix sorted
+_RADIX_MIN = 1024
+# array.array typecodes of integers
+_INTEGER_TYPECODES = "bBhHiIlLqQ"
+
+
+def sort(
+    array: Iterable,
+    key: Callable | None = None,
+    reverse: bool = False,
+    backend: str | None = None,
+) -> MutableSequence:
+    """
+    Sorts the array with the best sorter for its type and size. The sort is
+    stable.
+
+    :param array: The values to sort. Lists and typed buffers are sorted in
+        place, any other iterable is copied into a new list.
+    :param key: Optional function computing the key to sort each element by.
+    :param reverse: If True, sorts in descending order.
+    :param backend: "auto", "python" or "numpy", or None for the default
+        (see `rithm.backend`).
+
+    :return: The sorted list or buffer.
+    """
+    from rithm.backend import resolve
+    from rithm.sorting._buffer import is_buffer
+
+    if type(array) is not list and not is_buffer(array):
+        array = list(array)
+    if len(array) < 2:
+        return array
+
+    if resolve(array, backend) == "python":
+        if type(array) is list:
+            array.sort(key=key, reverse=reverse)
+            return array
+        if key is None and len(array) >= _RADIX_MIN and _is_integer_buffer(array):
+            from rithm.sorting._buffer import reverse as reverse_range
+            from rithm.sorting.radix import RadixSort
+
+            RadixSort(array).sort(backend="python")
+            if reverse:
+                # Equal integers cannot be told apart, so reversing the
+                # ascending order is a stable descending sort
+                reverse_range(array, 0, len(array) - 1)
+            return array
+
+    from rithm.sorting.merge import MergeSort
+
+    return MergeSort(array).adaptive_sort(key=key, reverse=reverse, backend=backend)
+
+
+def search(
+    array: Sequence, target, missing=None, backend: str | None = None
+) -> int | list | None:
+    """
+    Finds the first occurrence of a target, or of each of a batch of
+    targets, in a sorted array.
+
+    :param array: The sorted list or buffer to search.
+    :param target: The value to look for, or a list or ndarray of values.
+        A tuple is a single value.
+    :param missing: The value returned for targets not in the array.
+    :param backend: "auto", "python" or "numpy", or None for the default
+        (see `rithm.backend`). With the "auto" default, lists are searched
+        in Python.
+
+    :return: The index of the first occurrence of the target or `missing`,
+        or for a batch a list of them in the order of the targets.
+    """
+    from rithm.backend import get_backend
+    from rithm.searching.binary import BinarySearch
+
+    if backend is None and type(array) is list and get_backend() == "auto":
+        # The searcher lives for one call, so a list converted to an ndarray
+        # for a batch would never be searched again
+        backend = "python"
+    searcher = BinarySearch(array, assume_sorted=True, backend=backend)
+    if _is_batch(target):
+        return searcher.search_many(target, missing)
+
+    i = searcher.lower_bound(target)
+    return i if i < len(array) and array[i] == target else missing
+
+
+def fib(n: int | Iterable[int], mod: int | None = None) -> int | list:
+    """
+    Computes the Fibonacci number F(n), or F(n) for each n of a batch.
+
+    :param n: The index of the Fibonacci number, n >= 0, as an int or
+        NumPy integer, or an iterable of them.
+    :param mod: Optional modulus. If given, F(n) mod m is returned.
+
+    :return: F(n), or a list of F(n) in the order of the batch.
+    """
+    from rithm.recursion.fibonnaci import Fibonnaci
+
+    if isinstance(n, bool):
+        raise TypeError("n must be an integer, not a bool.")
+    if isinstance(n, Integral):
+        # NumPy integers become Python ints, which do not overflow
+        return Fibonnaci.fib_fast(index(n), mod)
+    if mod is None:
+        return Fibonnaci.fib_many(n)
+    return [Fibonnaci.fib_fast(k, mod) for k in n]
+
+
+def _is_integer_buffer(array) -> bool:
+    """Checks whether RadixSort can sort the typed buffer in place."""
+    if isinstance(array, bytearray):
+        return True
+    if isinstance(array, Array):
+        return array.typecode in _INTEGER_TYPECODES
+    # Native memoryview formats use the same codes
+    if isinstance(array, memoryview):
+        return array.format in _INTEGER_TYPECODES
+    return False
+
+
+def _is_batch(target) -> bool:
+    """Checks whether the target of a search is a batch of targets."""
+    if isinstance(target, list):
+        return True
+    # An ndarray can only exist once NumPy has been imported by someone
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(target, np.ndarray) and target.ndim > 0
+
+
+if __name__ == "__main__":
+    # Example usage
+    print(sort([3, 1, 2]))  # [1, 2, 3]
+    print(sort(["bb", "a", "ccc"], key=len))  # ['a', 'bb', 'ccc']
+    print(sort(Array("q", range(2000, 0, -1)))[:5])  # array('q', [1, 2, 3, 4, 5])
+    print(search([1, 3, 3, 7], 3))  # 1
+    print(search([1, 3, 3, 7], [7, 5, 1]))  # [3, None, 0]
+    print(fib(10), fib([10, 20]), fib(10, 7))  # 55 [55, 6765] 6
@@ -1,4 +1,69 @@
+"""
+This module implements ways of computing Fibonacci numbers.
+
+The Fibonacci sequence starts 0, 1 and each following number is the sum of the
+two before it: F(n) = F(n - 1) + F(n - 2).
+
+Time Complexity:
+- fib: O(phi^n), as the same values are recomputed over and over
+- fib_memo: O(n), but it recurses n levels deep
+- fib_fast and fib_matrix: O(log n) multiplications
+
+Fast doubling:
+F(2k) = F(k) * (2 * F(k + 1) - F(k))
+F(2k + 1) = F(k)^2 + F(k + 1)^2
+Starting from (F(0), F(1)) and reading the bits of n from the most significant
+end, each bit doubles k, and a 1 bit also steps it by one. This reaches
+(F(n), F(n + 1)) in log2(n) steps.
+
+e.g. n = 11 = 0b1011
+k: 0 -> 1 -> 2 -> 5 -> 11
+
+Matrix exponentiation:
+[[1, 1], [1, 0]]^n = [[F(n + 1), F(n)], [F(n), F(n - 1)]]
+The power is found by repeated squaring, which also takes O(log n) steps but
+does about twice the multiplications of fast doubling.
+
+Modular Fibonacci:
+With a modulus m every intermediate value is reduced mod m, so the numbers stay
+fixed width instead of growing to n * 0.694 bits. The sequence mod m repeats
+with a period called the Pisano period, e.g. 0, 1, 1, 2, 0, 2, 2, 1, ... for
+m = 3 has period 8. F(n) mod m therefore equals F(n mod period) mod m, and the
+period is cached so repeated queries for the same modulus skip most of the
+work. Finding the period means factoring m, so fib_mod only does so for n
+beyond the period and for moduli up to 2^40.
+
+Shared cache:
+fib_memo starts a new memo on every call. fib_cached, fib_many and fib_iter
+instead share one process-wide cache of (F(k), F(k + 1)) pairs. It holds at
+most cache_size pairs and evicts the least recently used one when full. A
+missing F(n) is found by walking forward from the nearest cached pair below n
+when it is close, and by fast doubling otherwise, so it never recurses.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from math import gcd
+from typing import Iterable, Iterator
+
+# Gaps up to this size are walked one addition at a time instead of doubling
+_WALK_LIMIT = 256
+# fib_mod only factors moduli up to this size to find their Pisano period, as
+# trial division takes O(sqrt(m)) steps: about 1M here, and 1.5G for 2^61 - 1
+_PISANO_LIMIT = 2**40
+
+
 class Fibonnaci:
+    _pisano_cache: dict = {}
+
+    # Maximum number of (F(k), F(k + 1)) pairs kept in the shared cache
+    cache_size: int = 1024
+    _cache: OrderedDict = OrderedDict()
+    # Cached k values in sorted order, to find the nearest pair below n
+    _cache_keys: list = []
+    _cache_lock = threading.Lock()
+
     @classmethod
     def fib(self, n: int, debug: bool = False) -> int:
         if n <= 1:
@@ -27,10 +92,311 @@ class Fibonnaci:
 
         return memo[n]
 
+    @classmethod
+    def fib_fast(self, n: int, mod: int | None = None) -> int:
+        """
+        Computes F(n) with the fast doubling method in O(log n)
+        multiplications and without recursion.
+
+        :param n: The index of the Fibonacci number, n >= 0.
+        :param mod: Optional modulus. If given, F(n) mod m is returned and
+            every intermediate value is kept below m.
+
+        :return: F(n), or F(n) mod m.
+        """
+        return self._fib_pair(n, mod)[0]
+
+    @classmethod
+    def _fib_pair(self, n: int, mod: int | None = None) -> tuple[int, int]:
+        """Returns (F(n), F(n + 1)) using fast doubling."""
+        if n < 0:
+            raise ValueError("n must be non-negative.")
+
+        a, b = 0, 1
+        for bit in bin(n)[2:]:
+            # Double: (F(k), F(k + 1)) -> (F(2k), F(2k + 1))
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            if mod is not None:
+                c %= mod
+                d %= mod
+            # Step: (F(2k), F(2k + 1)) -> (F(2k + 1), F(2k + 2))
+            if bit == "1":
+                c, d = d, c + d
+                if mod is not None:
+                    d %= mod
+            a, b = c, d
+        return a, b
+
+    @classmethod
+    def fib_matrix(self, n: int, mod: int | None = None) -> int:
+        """
+        Computes F(n) by raising [[1, 1], [1, 0]] to the nth power with
+        repeated squaring, in O(log n) matrix multiplications.
+
+        :param n: The index of the Fibonacci number, n >= 0.
+        :param mod: Optional modulus applied after every multiplication.
+
+        :return: F(n), or F(n) mod m.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative.")
+
+        def multiply(x, y):
+            product = (
+                x[0] * y[0] + x[1] * y[2],
+                x[0] * y[1] + x[1] * y[3],
+                x[2] * y[0] + x[3] * y[2],
+                x[2] * y[1] + x[3] * y[3],
+            )
+            if mod is not None:
+                return tuple(value % mod for value in product)
+            return product
+
+        # Matrices are stored row by row as (a, b, c, d)
+        result = (1, 0, 0, 1)
+        base = (1, 1, 1, 0)
+        while n:
+            if n & 1:
+                result = multiply(result, base)
+            base = multiply(base, base)
+            n >>= 1
+        return result[1] if mod is None else result[1] % mod
+
+    @classmethod
+    def pisano_period(self, m: int) -> int:
+        """
+        Finds the period of the Fibonacci sequence mod m. Periods are cached,
+        so each modulus is only worked out once.
+
+        The period of m is the lcm of the periods of its prime power factors,
+        and the period of p^k divides p^(k - 1) times the period of p. The
+        period of a prime p other than 2 and 5 divides p - 1 when p is 1 or 4
+        mod 5, and 2(p + 1) otherwise. Each bound is reduced to the exact
+        period by dividing out prime factors while F(d), F(d + 1) is still
+        0, 1 mod p^k. This costs O(sqrt(m)) for the factoring instead of the
+        O(m) of walking the sequence.
+
+        :param m: The modulus, m >= 1.
+
+        :return: The Pisano period of m.
+        """
+        if m < 1:
+            raise ValueError("The modulus must be positive.")
+        if m not in self._pisano_cache:
+            period = 1
+            for p, k in self._factorize(m).items():
+                if p == 2:
+                    bound = 3
+                elif p == 5:
+                    bound = 20
+                elif p % 5 in (1, 4):
+                    bound = p - 1
+                else:
+                    bound = 2 * (p + 1)
+                bound *= p ** (k - 1)
+                reduced = self._reduce_period(bound, p**k)
+                period = period * reduced // gcd(period, reduced)
+            self._pisano_cache[m] = period
+        return self._pisano_cache[m]
+
+    @classmethod
+    def _reduce_period(self, bound: int, m: int) -> int:
+        """Returns the smallest divisor d of bound with F(d), F(d + 1) = 0, 1 mod m."""
+        period = bound
+        for q in self._factorize(bound):
+            while period % q == 0 and self._fib_pair(period // q, m) == (0, 1 % m):
+                period //= q
+        return period
+
+    @staticmethod
+    def _factorize(n: int) -> dict:
+        """Factorizes n by trial division into a {prime: exponent} dict."""
+        factors = {}
+        d = 2
+        while d * d <= n:
+            while n % d == 0:
+                factors[d] = factors.get(d, 0) + 1
+                n //= d
+            d += 1 if d == 2 else 2
+        if n > 1:
+            factors[n] = factors.get(n, 0) + 1
+        return factors
+
+    @classmethod
+    def fib_mod(self, n: int, m: int) -> int:
+        """
+        Computes F(n) mod m, first reducing n by the cached Pisano period of m.
+        This suits many queries against the same modulus.
+
+        The period is only worked out when it can pay off: the period of m is
+        at most 6m, so a smaller n cannot be reduced by much, and moduli above
+        _PISANO_LIMIT take too long to factor. Both go straight to fast
+        doubling mod m, which takes O(log n) steps either way.
+
+        :param n: The index of the Fibonacci number, n >= 0.
+        :param m: The modulus, m >= 1.
+
+        :return: F(n) mod m.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative.")
+        if m in self._pisano_cache or (n >= 6 * m and m <= _PISANO_LIMIT):
+            n %= self.pisano_period(m)
+        return self.fib_fast(n, mod=m)
+
     @classmethod
     def fib_print(self, n: int) -> int:
-        for i in range(n + 1):
-            print(Fibonnaci.fib(i), end=" ")
+        for value in self.fib_iter(0, n + 1):
+            print(value, end=" ")
+
+    @classmethod
+    def fib_cached(self, n: int) -> int:
+        """
+        Computes F(n) through the shared, bounded LRU cache.
+
+        :param n: The index of the Fibonacci number, n >= 0.
+
+        :return: F(n).
+        """
+        return self._cached_pair(n)[0]
+
+    @classmethod
+    def fib_many(self, ns: Iterable[int]) -> list:
+        """
+        Computes F(n) for a batch of n. The distinct n are visited in sorted
+        order, and each one is reached from the one before it, so the table is
+        filled in a single sweep.
+
+        :param ns: The indices of the Fibonacci numbers.
+
+        :return: The Fibonacci numbers in the order of ns.
+        """
+        ns = list(ns)
+        values = {}
+        previous = None
+        for n in sorted(set(ns)):
+            if previous is not None and n - previous[0] <= _WALK_LIMIT:
+                k, a, b = previous
+                for _ in range(n - k):
+                    a, b = b, a + b
+                pair = (a, b)
+                self._store(n, pair)
+            else:
+                pair = self._cached_pair(n)
+            values[n] = pair[0]
+            previous = (n, *pair)
+        return [values[n] for n in ns]
+
+    @classmethod
+    def fib_iter(self, start: int, stop: int) -> Iterator[int]:
+        """
+        Lazily yields F(start), F(start + 1), ..., F(stop - 1). After the
+        first value each one costs a single addition.
+
+        :param start: The index of the first Fibonacci number.
+        :param stop: The index to stop before.
+
+        :return: An iterator over the Fibonacci numbers.
+        """
+        if start >= stop:
+            return
+        a, b = self._cached_pair(start)
+        for _ in range(start, stop):
+            yield a
+            a, b = b, a + b
+
+    @classmethod
+    def set_cache_size(self, size: int) -> None:
+        """
+        Sets the maximum number of pairs kept in the shared cache, evicting
+        the least recently used pairs if it is now too full.
+
+        :param size: The new cache size. 0 disables caching.
+        """
+        with self._cache_lock:
+            self.cache_size = size
+            self._evict()
+
+    @classmethod
+    def clear_cache(self) -> None:
+        """Empties the shared cache."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_keys.clear()
+
+    @classmethod
+    def _cached_pair(self, n: int) -> tuple[int, int]:
+        """Returns (F(n), F(n + 1)), using and updating the shared cache."""
+        if n < 0:
+            raise ValueError("n must be non-negative.")
+
+        with self._cache_lock:
+            if n in self._cache:
+                self._cache.move_to_end(n)
+                return self._cache[n]
+            i = bisect_right(self._cache_keys, n)
+            nearest = self._cache_keys[i - 1] if i else None
+            if nearest is not None and n - nearest <= _WALK_LIMIT:
+                start = (nearest, *self._cache[nearest])
+            else:
+                start = None
+
+        if start is None:
+            pair = self._fib_pair(n)
+        else:
+            k, a, b = start
+            for _ in range(n - k):
+                a, b = b, a + b
+            pair = (a, b)
+
+        self._store(n, pair)
+        return pair
+
+    @classmethod
+    def _store(self, n: int, pair: tuple[int, int]) -> None:
+        with self._cache_lock:
+            if self.cache_size <= 0:
+                return
+            if n in self._cache:
+                self._cache.move_to_end(n)
+                return
+            self._cache[n] = pair
+            insort(self._cache_keys, n)
+            self._evict()
+
+    @classmethod
+    def _evict(self) -> None:
+        """Drops least recently used pairs until the cache fits. Needs the lock."""
+        while len(self._cache) > max(self.cache_size, 0):
+            k, _ = self._cache.popitem(last=False)
+            del self._cache_keys[bisect_left(self._cache_keys, k)]
+
+
+def _benchmark(repeat: int = 5) -> None:
+    """Compares fib_fast and fib_matrix with fib_memo."""
+    import sys
+    import timeit
+
+    # fib_memo recurses n levels deep, so stay under the recursion limit
+    n = min(900, sys.getrecursionlimit() - 100)
+    for name in ("fib_memo", "fib_fast", "fib_matrix"):
+        method = getattr(Fibonnaci, name)
+        seconds = min(timeit.repeat(lambda: method(n), number=10, repeat=repeat)) / 10
+        print(f"{name}({n}): {seconds * 1e6:.1f}us")
+
+    for n in (10**5, 10**6):
+        for name in ("fib_fast", "fib_matrix"):
+            method = getattr(Fibonnaci, name)
+            seconds = min(timeit.repeat(lambda: method(n), number=1, repeat=repeat))
+            print(f"{name}({n}): {seconds * 1e3:.1f}ms")
+
+    seconds = min(
+        timeit.repeat(
+            lambda: Fibonnaci.fib_mod(10**18, 10**9 + 7), repeat=repeat, number=1
+        )
+    )
+    print(f"fib_mod(10**18, 10**9 + 7): {seconds * 1e6:.1f}us")
 
 
 if __name__ == "__main__":
@@ -40,3 +406,8 @@ if __name__ == "__main__":
     result = Fibonnaci.fib_memo(n, debug=True)
     print(f"The {n}th Fibonacci number is: {result}")
     Fibonnaci.fib_print(n)
+    print()
+    print(f"F(1000) mod 1000000007 = {Fibonnaci.fib_fast(1000, mod=10**9 + 7)}")
+    print(f"F(90), F(10), F(50) = {Fibonnaci.fib_many([90, 10, 50])}")
+
+    _benchmark()
@@ -1,3 +1,4 @@
 from .binary import BinarySearch
+from .mapped import MappedBinarySearch
 
-__all__ = ["BinarySearch"]
+__all__ = ["BinarySearch", "MappedBinarySearch"]
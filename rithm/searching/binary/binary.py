@@ -14,17 +14,197 @@ e.g. 1billion elements in simple search would take 1 billion comparisons,
 while in binary search it would take only about 30 comparisons. (log2(1 billion) ≈ 30)
 
 log2(32) = 5 # because 2^5 = 32
+
+Batch lookups:
+Calling search once per target pays the interpreter overhead of a Python call
+and a Python loop for every probe. search_many answers a whole batch at once.
+With NumPy installed it uses np.searchsorted, which runs the binary searches in
+C. Otherwise the probes are sorted and walked alongside the array in a single
+merge-style scan, galloping (doubling the step) from the previous position to
+each next probe. A batch of m probes then costs O(m log m + m log(n / m)).
+
+Eytzinger index:
+On large arrays each step of the classic loop jumps to a far away memory
+location, so almost every probe is a cache miss. build_index stores the array
+once more in Eytzinger (breadth-first) order: the root at slot 1 and the
+children of slot k at slots 2k and 2k + 1. The first few levels of the tree
+then share a handful of cache lines, and each step moves to a nearby slot. The
+search descends with k = 2k + (layout[k] < target), which has no branch on the
+comparison, and the lower bound is recovered by stripping the trailing right
+turns from k.
+
+sorted:    [1, 2, 3, 4, 5, 6, 7]
+eytzinger: [_, 4, 2, 6, 1, 3, 5, 7]
+
+Construction:
+Checking that the input is sorted takes a single O(n) pass, and the input is
+only sorted when that check fails. Callers that already hold a sorted list or
+buffer can pass assume_sorted=True to wrap it without checking or copying, or
+inplace=True to sort their list in place instead of into a copy. The searcher
+does not change after it is built. For values that are added and removed
+between lookups, use rithm.searching.sorted_list.SortedList instead.
+
+Bounds and ranges:
+search returns the index of whichever match it reaches first. lower_bound and
+upper_bound instead return the first index whose value is >= target and > target,
+which is where the run of matches starts and ends, and where the target would be
+inserted if it is missing. count and range are built on the two bounds.
+
+array = [1, 3, 3, 3, 7]
+lower_bound(3) = 1, upper_bound(3) = 4, count(3) = 3
+lower_bound(5) = upper_bound(5) = 4 (insertion point)
+range(2, 7) yields 3, 3, 3
+
+Async:
+A large search_many batch called from a coroutine blocks the event loop until
+it returns. asearch_many searches the batch in slices and yields to the loop
+between them, or hands the whole batch to an executor.
 """
 
+import asyncio
+import logging
+from array import array as Array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Executor
+from itertools import islice
+from operator import le
+from typing import Callable, Iterable, Iterator, Sequence
+
+from rithm._optional import numpy
+from rithm.backend import get_backend, is_vectorizable, resolve, vectorized
+from rithm.sorting._buffer import copy, is_buffer, scratch
+from rithm.sorting.merge import MergeSort
+
+_logger = logging.getLogger(__name__)
+# Targets searched by asearch_many between two yields to the event loop
+_ASYNC_BATCH = 10_000
+# With the "auto" backend, a list is only converted to an ndarray for batches
+# of at least len(array) / _NUMPY_BATCH_RATIO targets: the conversion is
+# O(n), and below this the merge scan finishes first
+_NUMPY_BATCH_RATIO = 8
+
 
 class BinarySearch(object):
-    def __init__(self, array: list) -> None:
-        # Ensure that the array is sorted for binary search to work correctly.
-        if array != sorted(array):
-            print("Input wasn't sorted, sorting it now.")
-        self.array: list = sorted(array)
+    def __init__(
+        self,
+        array: Sequence,
+        assume_sorted: bool = False,
+        inplace: bool = False,
+        logger: logging.Logger | None = None,
+        backend: str | None = None,
+    ) -> None:
+        """
+        :param array: The values to search.
+        :param assume_sorted: If True, the array is trusted to be sorted and is
+            used as is, without checking or copying it. Any indexable sequence
+            or buffer works.
+        :param inplace: If True, the array is used without copying it and is
+            sorted in place if it isn't sorted already. It must then have a
+            `sort` method, like a list, or be a typed buffer.
+        :param logger: Logger told when the input has to be sorted. Defaults
+            to this module's logger.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`). It is resolved once, here. With NumPy,
+            ndarrays and typed buffers are checked, sorted and searched with
+            vectorised kernels. With either backend they are copied into a
+            buffer of the same type rather than into a list.
+        """
+        self.backend = backend
+        self._vectorized = resolve(array, backend) == "numpy" and is_vectorizable(array)
+        if assume_sorted:
+            self.array = array
+        else:
+            # Ensure that the array is sorted for binary search to work correctly.
+            if self._vectorized:
+                is_sorted = vectorized.is_sorted(array)
+            else:
+                is_sorted = self._is_sorted(array)
+            if not is_sorted:
+                (logger or _logger).info("Input wasn't sorted, sorting it now.")
+
+            if inplace:
+                if self._vectorized and not is_sorted:
+                    vectorized.sort(array)
+                elif not is_sorted and is_buffer(array):
+                    MergeSort(array).adaptive_sort(backend="python")
+                elif not is_sorted:
+                    array.sort()
+                self.array = array
+            elif self._vectorized:
+                self.array = vectorized.sorted_copy(array)
+            elif is_buffer(array):
+                self.array = copy(array)
+                if not is_sorted:
+                    MergeSort(self.array).adaptive_sort(backend="python")
+            else:
+                self.array = list(array) if is_sorted else sorted(array)
+
+        self._layout = None
+        self._positions = None
+
+    @staticmethod
+    def _is_sorted(array: Sequence) -> bool:
+        """Checks in one O(n) pass that the array is in non-descending order."""
+        return all(map(le, array, islice(array, 1, None)))
+
+    def build_index(self) -> None:
+        """
+        Builds a static Eytzinger layout of the array that `search` uses from
+        then on.
+
+        The layout is stored in a buffer of the same type as the array for
+        typed buffers, in a compact `array.array` when the keys are all 64-bit
+        integers or all floats, and in a list otherwise. A second
+        array maps each layout slot back to its index in the sorted array.
+        Building takes O(n) time and O(n) extra space.
+
+        :return: None
+        """
+        array = self.array
+        n = len(array)
+        layout = scratch(array, n + 1)
+        positions = Array("q", bytes(8 * (n + 1)))
+
+        # An in-order walk of the implicit tree visits the slots in sorted
+        # order, so it assigns the sorted keys to them one after another
+        i = 0
+        k = 1
+        stack = []
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            layout[k] = array[i]
+            positions[k] = i
+            i += 1
+            k = 2 * k + 1
+
+        # Slot 0 is never read but must hold a value of the right type
+        layout[0] = layout[1] if n else 0
+        # Indexing a memoryview, even one of an ndarray, gives Python numbers
+        self._layout = memoryview(layout) if is_buffer(layout) else self._pack(layout)
+        self._positions = positions
+
+    @staticmethod
+    def _pack(values: list) -> Array | list:
+        """Packs the values into an array.array if they share a numeric type."""
+        if all(type(value) is int for value in values):
+            try:
+                return Array("q", values)
+            except OverflowError:
+                return values
+        if all(type(value) is float for value in values):
+            return Array("d", values)
+        return values
 
     def search(self, target: int) -> int:
+        if self._layout is not None:
+            return self._search_index(target)
+        if self._vectorized:
+            i = vectorized.searchsorted(self.array, target)
+            return i if i < len(self.array) and self.array[i] == target else None
+
         left = 0
         right = len(self.array) - 1
 
@@ -44,11 +224,276 @@ class BinarySearch(object):
 
         return None  # Target not found in the array
 
+    def _search_index(self, target) -> int | None:
+        """Searches the Eytzinger layout built by `build_index`."""
+        layout = self._layout
+        n = len(layout) - 1
+
+        # Go left or right on every level without branching on the result
+        k = 1
+        while k <= n:
+            k = 2 * k + (layout[k] < target)
+
+        # The path ends below the lower bound after one left turn followed by
+        # right turns only, so strip the trailing 1 bits and the 0 bit above
+        turns = ~k
+        k >>= (turns & -turns).bit_length()
+
+        if k and layout[k] == target:
+            return self._positions[k]
+        return None
+
+    def lower_bound(self, target) -> int:
+        """
+        Finds the first index whose value is not less than the target.
+
+        :param target: The value to look for.
+
+        :return: The index of the first occurrence of the target, or where it
+            would be inserted to keep the array sorted. O(log n).
+        """
+        if self._vectorized:
+            return vectorized.searchsorted(self.array, target, "left")
+        return bisect_left(self.array, target)
+
+    def upper_bound(self, target) -> int:
+        """
+        Finds the first index whose value is greater than the target.
+
+        :param target: The value to look for.
+
+        :return: The index just past the last occurrence of the target, or
+            where it would be inserted to keep the array sorted. O(log n).
+        """
+        if self._vectorized:
+            return vectorized.searchsorted(self.array, target, "right")
+        return bisect_right(self.array, target)
+
+    def count(self, target) -> int:
+        """
+        Counts the occurrences of the target in O(log n).
+
+        :param target: The value to count.
+
+        :return: The number of elements equal to the target.
+        """
+        return self.upper_bound(target) - self.lower_bound(target)
+
+    def range(self, lo, hi) -> Iterator:
+        """
+        Lazily iterates over the values v with lo <= v < hi.
+
+        The bounds are found in O(log n) and the values are then yielded one
+        by one straight from the array, so no copy of the slice is made.
+
+        :param lo: The inclusive lower bound.
+        :param hi: The exclusive upper bound.
+
+        :return: An iterator over the matching values in sorted order.
+        """
+        array = self.array
+        start = self.lower_bound(lo)
+        stop = max(start, self.lower_bound(hi))
+        for i in range(start, stop):
+            yield array[i]
+
+    def search_many(self, targets: Iterable, missing=None) -> list:
+        """
+        Searches for many targets in one pass.
+
+        Uses NumPy's searchsorted when NumPy is installed and both the array
+        and targets convert to flat numeric arrays of the array's dtype
+        without changing any value, unless the backend is "python".
+        Otherwise the targets are sorted and matched against the
+        array in a merge-style scan that gallops forward from one target to
+        the next.
+
+        ndarrays and typed buffers are viewed by NumPy for free. A list has
+        to be converted, in O(n), and with the "auto" backend this is only
+        done once a batch has at least len(array) / 8 targets. The converted
+        keys are kept, so later batches of any size use NumPy. The "numpy"
+        backend always converts.
+
+        :param targets: The values to search for.
+        :param missing: The value returned for targets not in the array.
+
+        :return: A list with, for each target in its original order, the index
+            of its first occurrence in the array or `missing`.
+        """
+        backend = self.backend if self.backend is not None else get_backend()
+        np = None if backend == "python" else numpy()
+        if np is None and backend == "numpy":
+            resolve(self.array, backend)
+        if np is not None and backend == "auto" and not self._numpy_is_cheap():
+            if not hasattr(targets, "__len__"):
+                targets = list(targets)
+            if len(targets) * _NUMPY_BATCH_RATIO < len(self.array):
+                np = None
+        if np is not None:
+            indices = self._search_many_numpy(np, targets, missing)
+            if indices is not None:
+                return indices
+
+        if not isinstance(targets, (list, tuple)):
+            targets = list(targets)
+
+        array = self.array
+        n = len(array)
+        result = [missing] * len(targets)
+        pos = 0
+
+        for i in sorted(range(len(targets)), key=targets.__getitem__):
+            target = targets[i]
+
+            # Gallop forward from the previous position to bracket the target,
+            # then binary search inside the bracket
+            lo = hi = pos
+            step = 1
+            while hi < n and array[hi] < target:
+                lo = hi + 1
+                hi = lo + step
+                step <<= 1
+            pos = bisect_left(array, target, lo, min(hi, n))
+
+            if pos < n and array[pos] == target:
+                result[i] = pos
+
+        return result
+
+    async def asearch_many(
+        self,
+        targets: Iterable,
+        missing=None,
+        executor: Executor | None = None,
+        batch_size: int = _ASYNC_BATCH,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> list:
+        """
+        search_many for asyncio code, which does not block the event loop.
+
+        Without an executor the targets are searched in batches on the event
+        loop's thread, awaiting asyncio.sleep(0) between batches so other
+        tasks can run. Cancelling stops it at the next batch. With an
+        executor the whole search_many call runs there instead.
+
+        :param targets: The values to search for.
+        :param missing: The value returned for targets not in the array.
+        :param executor: Optional concurrent.futures executor to search in.
+        :param batch_size: The number of targets searched between yields.
+        :param progress: Optional function called as progress(done, total)
+            after every batch.
+
+        :return: The same list search_many returns.
+        """
+        if not isinstance(targets, (list, tuple)):
+            targets = list(targets)
+        total = len(targets)
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                executor, self.search_many, targets, missing
+            )
+            if progress is not None:
+                progress(total, total)
+            return result
+
+        result = []
+        for start in range(0, total, batch_size):
+            result.extend(
+                self.search_many(targets[start : start + batch_size], missing)
+            )
+            if progress is not None:
+                progress(len(result), total)
+            await asyncio.sleep(0)
+        return result
+
+    def _search_many_numpy(self, np, targets: Iterable, missing) -> list | None:
+        """
+        Vectorised search_many. Returns None if the keys or the targets do not
+        convert to a flat numeric ndarray without changing a value, in which
+        case the caller falls back to the pure Python scan. searchsorted would
+        otherwise promote both sides to a common dtype, e.g. uint64 and int64
+        to float64, and compare rounded values.
+        """
+        keys = self._numpy_array(np)
+        if keys is None:
+            return None
+        if not hasattr(targets, "__len__"):
+            targets = list(targets)
+        probes = vectorized.lossless(targets, keys.dtype)
+        if probes is None:
+            return None
+        if len(keys) == 0:
+            return [missing] * len(probes)
+
+        indices = np.searchsorted(keys, probes, side="left")
+        found = keys[np.minimum(indices, len(keys) - 1)] == probes
+        found &= indices < len(keys)
+        return [
+            index if hit else missing
+            for index, hit in zip(indices.tolist(), found.tolist())
+        ]
+
+    def _numpy_is_cheap(self) -> bool:
+        """
+        Checks whether search_many can use NumPy without first converting
+        the array, because it is viewable or was converted before.
+        """
+        return is_vectorizable(self.array) or hasattr(self, "_numpy_keys")
+
+    def _numpy_array(self, np):
+        """
+        Returns the array as a flat numeric ndarray, converting it on first
+        use, or None if it does not convert without changing a value.
+        """
+        keys = getattr(self, "_numpy_keys", None)
+        if keys is None:
+            keys = vectorized.lossless(self.array)
+            # False remembers that the array cannot be converted
+            self._numpy_keys = False if keys is None else keys
+        return keys if keys is not False else None
+
+
+def _benchmark(sizes: Iterable = (10**5, 10**7, 10**8), probes: int = 10**5) -> None:
+    """
+    Compares lookups through the Eytzinger index with the classic loop.
+    The arrays hold the even numbers, and half of the probes are misses.
+    """
+    import random
+    import timeit
+
+    for n in sizes:
+        searcher = BinarySearch(range(0, 2 * n, 2), assume_sorted=True)
+        targets = [random.randrange(2 * n) for _ in range(probes)]
+
+        def run():
+            for target in targets:
+                searcher.search(target)
+
+        loop = min(timeit.repeat(run, number=1, repeat=3))
+        searcher.build_index()
+        indexed = min(timeit.repeat(run, number=1, repeat=3))
+        print(
+            f"n={n:.0e}: loop {probes / loop / 1e6:.2f}M/s, "
+            f"eytzinger {probes / indexed / 1e6:.2f}M/s ({loop / indexed:.2f}x)"
+        )
+
 
 if __name__ == "__main__":
+    import sys
+
     # Example usage
     binary_search = BinarySearch([3, 1, 2, 3, 4, 5, 6, 7, 8, 9])
     index = binary_search.search(5)
     print(f"Index of target: {index}")  # Output: Index of target: 4
     index = binary_search.search(10)
     print(f"Index of target: {index}")  # Output: Index of target: None
+    indices = binary_search.search_many([9, 3, 10, 1])
+    print(f"Indices of targets: {indices}")  # Output: [9, 2, None, 0]
+    print(f"Occurrences of 3: {binary_search.count(3)}")  # Output: 2
+    print(f"Values in [2, 5): {list(binary_search.range(2, 5))}")  # [2, 3, 3, 4]
+
+    # Benchmark the Eytzinger index, e.g. for the sizes 1e5, 1e7 and 1e8:
+    # python -m rithm.searching.binary.binary 1e5 1e7 1e8
+    if len(sys.argv) > 1:
+        _benchmark([int(float(size)) for size in sys.argv[1:]])
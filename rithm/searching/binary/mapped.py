@@ -0,0 +1,191 @@
+"""
+This module implements binary search over a memory-mapped file of sorted,
+fixed-size binary records.
+
+Instead of reading the file into a Python list, the file is mapped into memory
+with `mmap` and the keys are read straight out of the mapped pages. Opening
+the file is O(1): nothing is read until a search touches it, and a search only
+touches the O(log n) pages its probes land on. The pages live in the operating
+system's page cache, so several processes searching the same file share one
+copy of it.
+
+Each record is record_size bytes and holds its key at key_offset, encoded with
+a `struct` format such as "<Q" (little-endian unsigned 64-bit). The records
+must be sorted by key.
+
+record_size = 16, key_offset = 0, key_format = "<Q"
+| key 0 (8 bytes) | payload 0 (8 bytes) | key 1 | payload 1 | ...
+
+When the file holds nothing but native-endian keys, they are exposed as a cast
+`memoryview`, which indexes at C speed. Otherwise each key is unpacked with
+`struct.unpack_from` at i * record_size + key_offset. With NumPy installed,
+search_many reads the keys through a strided ndarray view of the same mapping,
+as long as every probe converts to the key's dtype without changing.
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+from rithm.searching.binary.binary import BinarySearch
+
+
+class MappedBinarySearch(BinarySearch):
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        key_format: str = "<Q",
+        record_size: int | None = None,
+        key_offset: int = 0,
+    ) -> None:
+        """
+        :param path: Path of the file of sorted records.
+        :param key_format: The `struct` format of the key, e.g. "<Q", "<i"
+            or ">d".
+        :param record_size: Size of each record in bytes. Defaults to the
+            size of the key, for files that hold only keys.
+        :param key_offset: Offset of the key within each record.
+        """
+        self.key_format = key_format
+        self._key = struct.Struct(key_format)
+        self.record_size: int = record_size or self._key.size
+        self.key_offset: int = key_offset
+        if key_offset + self._key.size > self.record_size:
+            raise ValueError("The key does not fit inside the record.")
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # Zero length files cannot be mapped
+            self._mmap = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            )
+        self._buffer = memoryview(self._mmap)
+        self._length = size // self.record_size
+
+        super().__init__(self._keys(), assume_sorted=True)
+
+    def _keys(self):
+        """
+        Returns an indexable view of the keys, using a cast memoryview when
+        the keys are packed back to back in native byte order.
+        """
+        code = self.key_format.lstrip("@=<>!")
+        order = self.key_format[0] if code != self.key_format else "@"
+        little = sys.byteorder == "little"
+        native = (
+            order in "@=" or (order == "<" and little) or (order in ">!" and not little)
+        )
+        if (
+            native
+            and len(code) == 1
+            and self.record_size == self._key.size
+            and struct.calcsize(code) == self._key.size
+        ):
+            return self._buffer[: self._length * self.record_size].cast(code)
+        return _RecordKeys(self)
+
+    def record(self, index: int) -> memoryview:
+        """
+        Returns the bytes of a record as a zero-copy view of the mapping.
+
+        :param index: The index of the record.
+
+        :return: A memoryview of record_size bytes.
+        """
+        if not -self._length <= index < self._length:
+            raise IndexError("Record index out of range.")
+        start = (index % self._length) * self.record_size
+        return self._buffer[start : start + self.record_size]
+
+    def _numpy_is_cheap(self) -> bool:
+        """The strided view reads the mapping in place, whatever the batch size."""
+        return True
+
+    def _numpy_array(self, np):
+        """
+        Returns a strided ndarray view of the keys, without copying them, or
+        None if NumPy has no numeric dtype for the key format.
+        """
+        keys = getattr(self, "_numpy_keys", None)
+        if keys is None:
+            keys = self._numpy_keys = self._numpy_view(np)
+        return keys if keys is not False else None
+
+    def _numpy_view(self, np):
+        """Builds the view for _numpy_array, or False if there is none."""
+        # NumPy spells network order ">", and does not know struct's "!"
+        key_format = self.key_format
+        if key_format.startswith("!"):
+            key_format = ">" + key_format[1:]
+        try:
+            dtype = np.dtype(key_format)
+        except TypeError:
+            return False
+        if dtype.kind not in "biuf" or dtype.itemsize != self._key.size:
+            return False
+        if not self._length:
+            return np.empty(0, dtype=dtype)
+        return np.ndarray(
+            shape=(self._length,),
+            dtype=dtype,
+            buffer=self._mmap,
+            offset=self.key_offset,
+            strides=(self.record_size,),
+        )
+
+    def close(self) -> None:
+        """Releases the views and unmaps the file."""
+        self._numpy_keys = None
+        self._layout = None
+        if isinstance(self.array, memoryview):
+            self.array.release()
+        self._buffer.release()
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+
+    def __enter__(self) -> "MappedBinarySearch":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _RecordKeys(object):
+    """A read-only sequence of the keys of the records in a mapped file."""
+
+    def __init__(self, searcher: MappedBinarySearch) -> None:
+        self._unpack_from = searcher._key.unpack_from
+        self._buffer = searcher._buffer
+        self._stride = searcher.record_size
+        self._offset = searcher.key_offset
+        self._length = searcher._length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Key index out of range.")
+        return self._unpack_from(self._buffer, index * self._stride + self._offset)[0]
+
+
+if __name__ == "__main__":
+    # Example usage
+    import tempfile
+
+    # Records of a uint64 key followed by a uint32 payload
+    record = struct.Struct("<QI")
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        for key in range(0, 100, 10):
+            f.write(record.pack(key, key * 2))
+
+    with MappedBinarySearch(f.name, key_format="<Q", record_size=record.size) as s:
+        index = s.search(40)
+        print(f"Index of 40: {index}")  # Output: Index of 40: 4
+        print(f"Record: {record.unpack(s.record(index))}")  # Output: (40, 80)
+        print(f"Lower bound of 45: {s.lower_bound(45)}")  # Output: 5
+        print(f"Batch: {s.search_many([90, 15, 0])}")  # Output: [9, None, 0]
+    os.remove(f.name)
@@ -0,0 +1,3 @@
+from .sorted_list import SortedList
+
+__all__ = ["SortedList"]
@@ -0,0 +1,405 @@
+"""
+This module implements a mutable sorted list.
+
+BinarySearch wraps one flat sorted array, so adding a single value means
+building a new searcher, and inserting into a flat list shifts every element
+after the insertion point, which is O(n). SortedList instead keeps its values
+in a list of sorted chunks of at most 2 * load values each, plus a list of the
+largest value of every chunk:
+
+chunks: [[1, 3, 4], [6, 8, 9], [12, 15]]
+maxes:  [4, 9, 15]
+
+Finding the chunk of a value is a binary search over maxes, and inserting or
+deleting inside a chunk shifts at most 2 * load elements, which is a small,
+bounded memmove. A chunk that grows past 2 * load is split in half, and one
+that shrinks below load / 2 is merged with its neighbour, so the chunks stay
+within a constant factor of load.
+
+Positional index:
+Indexing (sl[i]) and the bisect methods must convert between a global index
+and a (chunk, offset) pair. A Fenwick tree (binary indexed tree) over the
+chunk lengths answers both in O(log m) for m chunks, and is updated in O(log m)
+when a chunk grows or shrinks by one. Splitting or merging chunks shifts the
+chunk numbers, so the tree is then dropped and rebuilt in O(m) on the next
+positional lookup.
+
+Time Complexity:
+- add, remove, pop, sl[i]: O(log n), plus an O(load) shift inside a chunk
+- bisect_left, bisect_right, count, index: O(log n)
+- range(lo, hi): O(log n) to find the start, then O(1) per value
+- Building from unsorted values: O(n log n). Building from values that are
+  already sorted with assume_sorted=True: O(n)
+
+Example (load = 2, so chunks hold at most 4 values):
+SortedList([5, 1, 4, 2, 3], load=2)
+chunks [[1, 2], [3, 4], [5]]
+add(6): chunks [[1, 2], [3, 4], [5, 6]]
+sl[3] = 4, bisect_left(4) = 3, list(sl.range(2, 5)) = [2, 3, 4]
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+from typing import Iterable, Iterator
+
+# Default chunk size. Chunks hold between load / 2 and 2 * load values
+_LOAD = 1000
+
+
+class SortedList(object):
+    def __init__(
+        self,
+        iterable: Iterable = (),
+        assume_sorted: bool = False,
+        load: int = _LOAD,
+    ) -> None:
+        """
+        :param iterable: The initial values.
+        :param assume_sorted: If True, the values are trusted to be in
+            non-descending order already and are chunked in O(n) without
+            sorting them.
+        :param load: The chunk size. Larger chunks mean fewer chunks to search
+            but longer shifts on every insert and delete.
+        """
+        if load < 2:
+            raise ValueError("load must be at least 2.")
+        self.load = load
+        self._build(iterable if assume_sorted else sorted(iterable))
+
+    def _build(self, values: Iterable) -> None:
+        """Chunks values that are already sorted, in O(n)."""
+        values = values if isinstance(values, list) else list(values)
+        load = self.load
+        self._lists = [values[i : i + load] for i in range(0, len(values), load)]
+        self._maxes = [chunk[-1] for chunk in self._lists]
+        self._len = len(values)
+        self._tree = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator:
+        return chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    def __contains__(self, value) -> bool:
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        chunk = self._lists[i]
+        return chunk[bisect_left(chunk, value)] == value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def add(self, value) -> None:
+        """
+        Inserts a value, after any equal values already in the list.
+
+        :param value: The value to insert.
+
+        :return: None
+        """
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([value])
+            maxes.append(value)
+            self._len = 1
+            self._tree = None
+            return
+
+        i = bisect_right(maxes, value)
+        if i == len(maxes):
+            # Larger than everything, so it goes at the end of the last chunk
+            i -= 1
+            self._lists[i].append(value)
+            maxes[i] = value
+        else:
+            insort(self._lists[i], value)
+        self._len += 1
+        self._grow(i)
+
+    def update(self, iterable: Iterable) -> None:
+        """
+        Inserts many values. Large batches are merged in with one sort and a
+        rebuild, which beats inserting them one at a time.
+
+        :param iterable: The values to insert.
+
+        :return: None
+        """
+        values = iterable if isinstance(iterable, list) else list(iterable)
+        if len(values) * 4 >= self._len:
+            self._build(sorted(chain(self, values)))
+        else:
+            for value in values:
+                self.add(value)
+
+    def remove(self, value) -> None:
+        """
+        Removes one occurrence of the value.
+
+        :param value: The value to remove.
+
+        :raises ValueError: If the value is not in the list.
+
+        :return: None
+        """
+        if not self.discard(value):
+            raise ValueError(f"{value!r} is not in the list.")
+
+    def discard(self, value) -> bool:
+        """
+        Removes one occurrence of the value, if there is one.
+
+        :param value: The value to remove.
+
+        :return: True if a value was removed.
+        """
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        chunk = self._lists[i]
+        pos = bisect_left(chunk, value)
+        if chunk[pos] != value:
+            return False
+        self._delete(i, pos)
+        return True
+
+    def pop(self, index: int = -1):
+        """
+        Removes and returns the value at the index.
+
+        :param index: The position of the value, negative counting from the end.
+
+        :return: The removed value.
+        """
+        i, pos = self._locate(index)
+        value = self._lists[i][pos]
+        self._delete(i, pos)
+        return value
+
+    def clear(self) -> None:
+        self._build([])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                if start >= stop:
+                    return []
+                i, pos = self._locate(start)
+                values = chain(islice(self._lists[i], pos, None), *self._lists[i + 1 :])
+                return list(islice(values, stop - start))
+            return [self[k] for k in range(start, stop, step)]
+
+        i, pos = self._locate(index)
+        return self._lists[i][pos]
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            # Delete from the back so the earlier indices stay valid
+            for k in sorted(range(*index.indices(self._len)), reverse=True):
+                self._delete(*self._locate(k))
+            return
+        self._delete(*self._locate(index))
+
+    def bisect_left(self, value) -> int:
+        """
+        Finds the first index whose value is not less than the given value.
+
+        :param value: The value to look for.
+
+        :return: The index of the first occurrence of the value, or where it
+            would be inserted to keep the list sorted.
+        """
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._position(i, bisect_left(self._lists[i], value))
+
+    def bisect_right(self, value) -> int:
+        """
+        Finds the first index whose value is greater than the given value.
+
+        :param value: The value to look for.
+
+        :return: The index just past the last occurrence of the value.
+        """
+        i = bisect_right(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._position(i, bisect_right(self._lists[i], value))
+
+    # The same names as BinarySearch, so the two can be swapped for each other
+    lower_bound = bisect_left
+    upper_bound = bisect_right
+    bisect = bisect_right
+
+    def count(self, value) -> int:
+        """
+        :return: The number of values equal to the given value.
+        """
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value) -> int:
+        """
+        :return: The index of the first occurrence of the value.
+
+        :raises ValueError: If the value is not in the list.
+        """
+        i = self.search(value)
+        if i is None:
+            raise ValueError(f"{value!r} is not in the list.")
+        return i
+
+    def search(self, value) -> int | None:
+        """
+        :return: The index of the first occurrence of the value, or None.
+        """
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return None
+        chunk = self._lists[i]
+        pos = bisect_left(chunk, value)
+        if chunk[pos] != value:
+            return None
+        return self._position(i, pos)
+
+    def range(self, lo, hi) -> Iterator:
+        """
+        Lazily iterates over the values v with lo <= v < hi.
+
+        Only the start is searched for, so no positional lookup is needed, and
+        the values are then yielded chunk by chunk.
+
+        :param lo: The inclusive lower bound.
+        :param hi: The exclusive upper bound.
+
+        :return: An iterator over the matching values in sorted order.
+        """
+        maxes = self._maxes
+        i = bisect_left(maxes, lo)
+        if i == len(maxes):
+            return
+        pos = bisect_left(self._lists[i], lo)
+        for chunk in islice(self._lists, i, None):
+            for k in range(pos, len(chunk)):
+                value = chunk[k]
+                if not value < hi:
+                    return
+                yield value
+            pos = 0
+
+    def _grow(self, i: int) -> None:
+        """Splits chunk i if it has grown too big, else records its growth."""
+        chunk = self._lists[i]
+        if len(chunk) > 2 * self.load:
+            half = chunk[self.load :]
+            del chunk[self.load :]
+            self._lists.insert(i + 1, half)
+            self._maxes[i] = chunk[-1]
+            self._maxes.insert(i + 1, half[-1])
+            self._tree = None
+        elif self._tree is not None:
+            self._tree_add(i, 1)
+
+    def _delete(self, i: int, pos: int) -> None:
+        """Deletes chunk i's value at pos, merging or dropping small chunks."""
+        lists, maxes = self._lists, self._maxes
+        chunk = lists[i]
+        del chunk[pos]
+        self._len -= 1
+
+        if not chunk:
+            del lists[i]
+            del maxes[i]
+            self._tree = None
+        elif len(chunk) < self.load // 2 and len(lists) > 1:
+            # Merge into the previous chunk, or the next one for chunk 0
+            if i == 0:
+                i = 1
+            lists[i - 1].extend(lists[i])
+            del lists[i]
+            del maxes[i]
+            maxes[i - 1] = lists[i - 1][-1]
+            self._tree = None
+            self._grow(i - 1)
+        else:
+            maxes[i] = chunk[-1]
+            if self._tree is not None:
+                self._tree_add(i, -1)
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Converts a global index to a (chunk, offset) pair."""
+        n = self._len
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("SortedList index out of range.")
+
+        # The ends are common and need no tree
+        first = len(self._lists[0])
+        if index < first:
+            return 0, index
+        last = len(self._lists[-1])
+        if index >= n - last:
+            return len(self._lists) - 1, index - (n - last)
+
+        tree = self._index()
+        i = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = i + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                i = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return i, index
+
+    def _position(self, i: int, pos: int) -> int:
+        """Converts a (chunk, offset) pair to a global index."""
+        if i == 0:
+            return pos
+        tree = self._index()
+        total = pos
+        while i:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+    def _index(self) -> list:
+        """Returns the Fenwick tree of chunk lengths, building it if needed."""
+        tree = self._tree
+        if tree is None:
+            m = len(self._lists)
+            tree = [0] + [len(chunk) for chunk in self._lists]
+            for k in range(1, m + 1):
+                parent = k + (k & -k)
+                if parent <= m:
+                    tree[parent] += tree[k]
+            self._tree = tree
+        return tree
+
+    def _tree_add(self, i: int, delta: int) -> None:
+        tree = self._tree
+        k = i + 1
+        while k < len(tree):
+            tree[k] += delta
+            k += k & -k
+
+
+if __name__ == "__main__":
+    # Example usage
+    sorted_list = SortedList([5, 1, 4, 2, 3])
+    sorted_list.add(6)
+    sorted_list.remove(1)
+    print(sorted_list)  # Output: SortedList([2, 3, 4, 5, 6])
+    print(sorted_list[1], sorted_list.bisect_left(4))  # Output: 3 2
+    print(list(sorted_list.range(3, 6)))  # Output: [3, 4, 5]
+
+    # Bulk load keys that are already sorted in O(n)
+    keys = SortedList(range(0, 10**6, 2), assume_sorted=True)
+    print(keys.count(500_000), keys.search(500_001))  # Output: 1 None
@@ -0,0 +1,136 @@
+"""
+Helpers for sorting typed buffers in place.
+
+`array.array`, `bytearray`, `memoryview` and NumPy arrays store their numbers
+unboxed, side by side in one block of memory: an array('q') of 100M ints is
+800 MB, while a list of the same ints is 800 MB of pointers plus 28 bytes per
+int object on top. The pure Python sorters index a buffer exactly like a list,
+which boxes one number while it is compared and unboxes it again when it is
+stored, so the buffer itself never becomes a list. What has to be avoided is
+everything that builds a list of all the elements: scratch space made with
+[None] * n, slices glued together with +, or results gathered with a list
+comprehension. The helpers here make scratch space and copies of the same type
+and typecode as the input instead, so a sort that holds one scratch buffer
+peaks at about twice the size of the raw data.
+
+Slicing copies a list, an array.array or a bytearray, but only makes a view
+of a memoryview or an ndarray, so code that needs a copy of a slice must use
+`copy` rather than slicing.
+
+Example:
+array = Array("q", [3, 1, 2])
+scratch(array)       # array('q', [0, 0, 0])
+copy(array, 1)       # array('q', [1, 2])
+reverse(array, 0, 2) # array('q', [2, 1, 3])
+"""
+
+import sys
+from array import array as Array
+from typing import MutableSequence, Sequence
+
+
+def is_buffer(array) -> bool:
+    """
+    :return: True if the array is an `array.array`, a `bytearray`, a
+        `memoryview` or an ndarray, rather than a list of objects.
+    """
+    if isinstance(array, (Array, bytearray, memoryview)):
+        return True
+    # An ndarray can only exist once NumPy has been imported by someone
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(array, np.ndarray)
+
+
+def scratch(array: Sequence, n: int | None = None) -> MutableSequence:
+    """
+    Allocates an uninitialised buffer of the same type as the array.
+
+    :param array: The list or buffer to match.
+    :param n: The length of the new buffer. Defaults to the array's length.
+
+    :return: A buffer with the same type, typecode or dtype, or a list of
+        None for lists and other sequences.
+    """
+    if n is None:
+        n = len(array)
+    if isinstance(array, Array):
+        # Repeating one zeroed item avoids a temporary bytes object of size n
+        return Array(array.typecode, bytes(array.itemsize)) * n
+    if isinstance(array, bytearray):
+        return bytearray(n)
+    if isinstance(array, memoryview):
+        try:
+            return memoryview(bytearray(n * array.itemsize)).cast(array.format)
+        except (TypeError, ValueError):
+            # Only native single character formats can be cast to
+            return [None] * n
+    if is_buffer(array):
+        return sys.modules["numpy"].empty(n, dtype=array.dtype)
+    return [None] * n
+
+
+def copy(array: Sequence, low: int = 0, high: int | None = None) -> MutableSequence:
+    """
+    Copies array[low:high] into a new buffer of the same type. Unlike slicing,
+    this also copies memoryviews and ndarrays.
+
+    :param array: The list or buffer to copy from.
+    :param low: The first index to copy.
+    :param high: The index to stop before. Defaults to the array's length.
+
+    :return: The copy.
+    """
+    if high is None:
+        high = len(array)
+    if isinstance(array, memoryview):
+        result = scratch(array, max(high - low, 0))
+        result[:] = array[low:high]
+        return result
+    if isinstance(array, (list, Array, bytearray)) or not is_buffer(array):
+        return array[low:high]
+    return array[low:high].copy()
+
+
+def reverse(array: MutableSequence, low: int, high: int) -> None:
+    """Reverses array[low:high + 1] in place, for lists and all buffers."""
+    if low >= high:
+        return
+    if low == 0 and high == len(array) - 1 and hasattr(array, "reverse"):
+        # Lists, array.array and bytearray reverse without any copy
+        array.reverse()
+        return
+    # Every type copes with the source overlapping the destination, and
+    # memoryviews and ndarrays do so without copying more than once
+    array[low : high + 1] = array[high : low - 1 if low else None : -1]
+
+
+def gather(items: Sequence, order: Sequence[int], reverse: bool = False):
+    """
+    Gathers items in the order of an index column.
+
+    :param items: The list or buffer to gather from.
+    :param order: The indices of the items, in the order they go in.
+    :param reverse: If True, the gathered items are stored back to front.
+
+    :return: A new list, or a new buffer of the same type for buffers.
+    """
+    if not is_buffer(items):
+        result = [items[i] for i in order]
+        if reverse:
+            result.reverse()
+        return result
+
+    result = scratch(items, len(order))
+    slots = range(len(order) - 1, -1, -1) if reverse else range(len(order))
+    for slot, i in zip(slots, order):
+        result[slot] = items[i]
+    return result
+
+
+if __name__ == "__main__":
+    # Example usage
+    array = Array("q", [3, 1, 2])
+    print(scratch(array), copy(array, 1))  # array('q', [0, 0, 0]) array('q', [1, 2])
+    reverse(array, 0, 2)
+    print(array)  # array('q', [2, 1, 3])
+    print(gather(bytearray(b"cab"), [1, 2, 0]))  # bytearray(b'abc')
@@ -0,0 +1,83 @@
+"""
+Helpers for sorting by a key function.
+
+Sorting by key uses decorate-sort-undecorate. The key of every element is
+computed exactly once into a key column. The sorters then sort that column,
+applying every move to a parallel column of the elements' original indices as
+well, so comparisons only ever touch the cached keys. Finally the elements are
+gathered in the order of the index column.
+
+When every key is an int that fits in 64 bits, or every key is a float, the
+key column is packed into an array('q') or array('d'). The keys are then
+stored unboxed in one block of memory instead of as a list of objects.
+Typed buffers sorted without a key are copied into a key column of their own
+type, and the result is gathered into a buffer of their own type as well (see
+`rithm.sorting._buffer`), so no list of the elements is built.
+
+reverse=True decorates the elements back to front, sorts ascending and reverses
+the result. For a stable sort this keeps equal elements in their original
+order, the same as sorted(..., reverse=True).
+"""
+
+from array import array as Array
+from typing import Callable, MutableSequence, Sequence
+
+from rithm.sorting import _buffer
+
+
+def decorate(
+    items: Sequence, key: Callable | None, reverse: bool
+) -> tuple[MutableSequence, Array]:
+    """
+    Builds the key column and the index column for items.
+
+    :param items: The elements to sort.
+    :param key: Function computing the key of an element, or None to use the
+        elements themselves.
+    :param reverse: If True, the columns are built back to front.
+
+    :return: The (keys, order) columns.
+    """
+    n = len(items)
+    indices = range(n - 1, -1, -1) if reverse else range(n)
+    if key is None and _buffer.is_buffer(items):
+        keys = _buffer.copy(items)
+        if reverse:
+            _buffer.reverse(keys, 0, n - 1)
+        return keys, Array("q", indices)
+    if key is None:
+        keys = [items[i] for i in indices]
+    else:
+        keys = [key(items[i]) for i in indices]
+    return pack(keys), Array("q", indices)
+
+
+def undecorate(items: Sequence, order: Sequence[int], reverse: bool):
+    """
+    Gathers items in the order of a sorted index column.
+
+    :param items: The elements that were decorated.
+    :param order: The sorted index column.
+    :param reverse: Must match the value passed to `decorate`.
+
+    :return: A new list of the sorted elements, or a new buffer of the same
+        type if items is a typed buffer.
+    """
+    return _buffer.gather(items, order, reverse)
+
+
+def pack(values: list) -> MutableSequence:
+    """Packs the values into an array('q') or array('d') if they allow it."""
+    if values and all(type(value) is int for value in values):
+        try:
+            return Array("q", values)
+        except OverflowError:
+            return values
+    if values and all(type(value) is float for value in values):
+        return Array("d", values)
+    return values
+
+
+def scratch(column: MutableSequence) -> MutableSequence:
+    """Allocates an uninitialised column of the same type and length."""
+    return _buffer.scratch(column)
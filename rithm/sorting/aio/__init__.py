@@ -0,0 +1,3 @@
+from .aio import asort
+
+__all__ = ["asort"]
@@ -0,0 +1,164 @@
+"""
+This module implements sorting that cooperates with an asyncio event loop.
+
+A sort called from a coroutine runs on the event loop's thread, so nothing
+else on the loop runs until it returns. Sorting a few hundred thousand items
+in pure Python takes seconds, which stalls every other request for that long.
+asort avoids this in one of two ways:
+
+Cooperative (the default): the bottom-up merge sort is run in time slices.
+MergeSort's bottom-up merge is driven step by step, and once a slice has used
+up its time budget the coroutine awaits asyncio.sleep(0), which lets the loop
+run other callbacks before the sort continues. Long merges are split into
+pieces, so no slice runs much over its budget however wide the runs get. The
+sort still takes as much CPU time as before, but it is spread out in small
+slices instead of one long stall.
+
+Executor: the sort runs in a concurrent.futures executor. A ThreadPoolExecutor
+keeps the loop responsive between the GIL switches of the sorting thread. A
+ProcessPoolExecutor sorts on another core, at the cost of pickling the array
+both ways.
+
+Cancellation:
+A cooperative sort can be cancelled at any slice boundary. The array then
+still holds all of its elements, in a partly sorted order. Cancelling an
+executor sort stops the wait, and a job that has not started yet is dropped,
+but a thread that is already sorting runs to the end.
+
+Progress:
+progress(done, total) is called after every slice with the number of elements
+merged so far and the total for the whole sort, n * ceil(log2(n)) for the
+cooperative sort. Executor sorts report only (0, n) and (n, n).
+
+Example:
+async def handler(items):
+    await asort(items, slice_seconds=0.002, progress=print)
+    return items
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable
+
+from rithm.sorting.merge import MergeSort
+
+# Time a cooperative sort may run before it yields to the event loop
+_SLICE_SECONDS = 0.005
+# Elements merged between two checks of the clock
+_STEP = 1024
+
+
+async def asort(
+    array: list,
+    key: Callable | None = None,
+    reverse: bool = False,
+    executor: Executor | None = None,
+    slice_seconds: float = _SLICE_SECONDS,
+    progress: Callable[[int, int], None] | None = None,
+) -> list:
+    """
+    Sorts a list in place without blocking the event loop. The sort is
+    stable, like list.sort.
+
+    :param array: The list to sort.
+    :param key: Optional function computing the key to sort each element by.
+        Each key is computed once. Keys are computed before the first slice,
+        so an expensive key function still runs in one go.
+    :param reverse: If True, sorts in descending order.
+    :param executor: Optional executor to sort in. If None, the sort runs
+        cooperatively on the event loop's thread.
+    :param slice_seconds: How long a cooperative sort may run before it
+        yields to the event loop.
+    :param progress: Optional function called as progress(done, total).
+
+    :return: The sorted array.
+    """
+    n = len(array)
+    if executor is not None:
+        return await _sort_in_executor(array, key, reverse, executor, progress)
+
+    if key is None and not reverse:
+        column = array
+    else:
+        # (key, position) pairs are sorted instead of the elements. Equal
+        # keys stay in position order, both through the index and through
+        # the stable merge, which is all that is left when keys only define
+        # __lt__. For reverse the pairs are built back to front and the
+        # result flipped, which puts equal keys back in their original order.
+        items = array[::-1] if reverse else array
+        keys = items if key is None else [key(item) for item in items]
+        column = [(k, i) for i, k in enumerate(keys)]
+
+    passes = (n - 1).bit_length() if n > 1 else 0
+    total = n * passes
+    loop = asyncio.get_running_loop()
+    steps = MergeSort(column)._bottom_up_steps(_STEP)
+    try:
+        deadline = loop.time() + slice_seconds
+        for done in steps:
+            if loop.time() >= deadline:
+                if progress is not None:
+                    progress(done, total)
+                await asyncio.sleep(0)
+                deadline = loop.time() + slice_seconds
+    finally:
+        # On cancellation this puts the array back together before unwinding
+        steps.close()
+
+    if column is not array:
+        result = [items[i] for _, i in column]
+        if reverse:
+            result.reverse()
+        array[:] = result
+    if progress is not None:
+        progress(total, total)
+    return array
+
+
+async def _sort_in_executor(
+    array: list,
+    key: Callable | None,
+    reverse: bool,
+    executor: Executor,
+    progress: Callable[[int, int], None] | None,
+) -> list:
+    n = len(array)
+    if progress is not None:
+        progress(0, n)
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(executor, _sort, array, key, reverse)
+    # A process sorts a pickled copy, so its result is copied back
+    if result is not array:
+        array[:] = result
+    if progress is not None:
+        progress(n, n)
+    return array
+
+
+def _sort(array: list, key: Callable | None, reverse: bool) -> list:
+    """Runs in the executor. Module level so that it can be pickled."""
+    return MergeSort(array).adaptive_sort(key=key, reverse=reverse)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    async def main() -> None:
+        array = [random.random() for _ in range(200_000)]
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        beat = asyncio.create_task(heartbeat())
+        start = time.perf_counter()
+        await asort(array)
+        elapsed = time.perf_counter() - start
+        beat.cancel()
+        print(f"Sorted {len(array)} items in {elapsed:.2f}s, loop ticked {ticks} times")
+
+    asyncio.run(main())
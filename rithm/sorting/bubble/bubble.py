@@ -30,47 +30,121 @@ arr = [64, 34, 25, 12, 22, 11, 90]
 
 Bubble Sort is not the most efficient sorting algorithm for large datasets,
 but it is easy to understand and implement.
+
+Cocktail shaker passes:
+sort alternates forward passes, which carry the largest element up, with
+backward passes, which carry the smallest element down, and bounds every pass
+by the position of the last swap of the pass before, since everything beyond
+it is already in place. A small element at the end, which the plain passes
+above move one step per pass, goes down in a single backward pass, and sorted
+input is done after one pass. The kernel lives in `rithm.sorting.small`, where
+QuickSort and MergeSort can use it as their base case for small slices.
 """
 
+from typing import Callable
+
+from rithm.backend import use_numpy, vectorized
+from rithm.sorting._keyed import decorate, undecorate
+from rithm.sorting.small import cocktail_sort
+from rithm.sorting.stats import SortStats
+
 
 class BubbleSort(object):
     def __init__(self, array: list) -> None:
         self.array: list = array
 
-    def sort(self, debug: bool = False) -> None:
+    def sort(
+        self,
+        debug: bool = False,
+        key: Callable | None = None,
+        reverse: bool = False,
+        stats: SortStats | None = None,
+        backend: str | None = None,
+    ) -> None:
         """
         Sorts the array using the bubble sort algorithm.
 
         This method is an inplace sorting algorithm that repeatedly steps through
         the list, compares adjacent elements, and swaps them if they are in the
-        wrong order. The pass through the list is repeated until the list is sorted.
+        wrong order. The passes go alternately forwards and backwards (cocktail
+        shaker sort), each bounded by the last swap of the one before, until a
+        pass makes no swap.
+
+        :param debug: If True, prints every swap.
+        :param key: Optional function computing the key to sort each element
+            by. Each key is computed once and cached.
+        :param reverse: If True, sorts in descending order.
+        :param stats: Optional SortStats that counts comparisons and swaps.
+            Not used when sorting by key.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
 
         :return: None
         """
-        n = len(self.array)
+        if use_numpy(self.array, backend, key, stats, debug):
+            vectorized.sort(self.array, "stable", reverse)
+            return
+        if key is not None or reverse:
+            keys, order = decorate(self.array, key, reverse)
+            self._sort_keyed(keys, order)
+            self.array[:] = undecorate(self.array, order, reverse)
+            return
 
-        # Loop through the array n times
+        stats = SortStats.resolve(stats, debug)
+        if stats is not None:
+            return self._sort_instrumented(stats)
+
+        cocktail_sort(self.array)
+
+    def _sort_instrumented(self, stats: SortStats) -> None:
+        """
+        The passes of `cocktail_sort`, swapping neighbours one at a time and
+        counting comparisons and swaps into stats.
+        """
+        array = self.array
+        lo, hi = 0, len(array) - 1
+        index = 0
+        while lo < hi:
+            last = lo
+            for j in range(lo, hi):
+                stats.comparisons += 1
+                if array[j + 1] < array[j]:
+                    stats.swaps += 1
+                    stats.emit("swap", i=j, j=j + 1, values=(array[j], array[j + 1]))
+                    array[j], array[j + 1] = array[j + 1], array[j]
+                    last = j
+            hi = last
+            stats.emit("pass", index=index, direction="forward", bound=hi)
+            index += 1
+            if lo >= hi:
+                break
+
+            last = hi
+            for j in range(hi, lo, -1):
+                stats.comparisons += 1
+                if array[j] < array[j - 1]:
+                    stats.swaps += 1
+                    stats.emit("swap", i=j - 1, j=j, values=(array[j - 1], array[j]))
+                    array[j - 1], array[j] = array[j], array[j - 1]
+                    last = j
+            lo = last
+            stats.emit("pass", index=index, direction="backward", bound=lo)
+            index += 1
+
+    @staticmethod
+    def _sort_keyed(keys: list, order: list) -> None:
+        """
+        Bubble sorts the key column, making the same swaps in the index
+        column.
+        """
+        n = len(keys)
         for i in range(n):
-            # Additional early exit optimization
-            # Track if a swap was made
             swapped = False
-
-            # Loop through the array up to the last unsorted element
-            # Each pass places the largest unsorted element at the end
-            # of the unsorted section
             for j in range(0, n - i - 1):
-                # Compare adjacent elements
-                if self.array[j] > self.array[j + 1]:
-                    if debug:
-                        print(self.array)
-                        print(
-                            f"Swapping {self.array[j]} and {self.array[j + 1]} at indices {j} and {j + 1}"
-                        )
-                    # Swap if they are in the wrong order
-                    self.array[j], self.array[j + 1] = self.array[j + 1], self.array[j]
+                if keys[j] > keys[j + 1]:
+                    keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                    order[j], order[j + 1] = order[j + 1], order[j]
                     swapped = True
-
-            # If no two elements were swapped, the array is sorted
             if not swapped:
                 break
 
@@ -0,0 +1,3 @@
+from .external import ExternalSort
+
+__all__ = ["ExternalSort"]
@@ -0,0 +1,226 @@
+"""
+This module implements an external (out-of-core) merge sort.
+
+External sorting is used when the data does not fit in memory. It works in two
+phases:
+1. The input is read as a stream and cut into chunks that fit in a fixed
+   memory budget. Each chunk is sorted in memory and spilled to a temporary
+   file, called a run.
+2. The runs are merged back together with a lazy k-way merge
+   (`rithm.sorting.merge.kway_merge`). A heap holds the current head of every
+   run, so each output item costs O(log k) comparisons and only one block per
+   run needs to be in memory at a time.
+
+If there are more runs than can be merged at once, the merge is done in
+several passes: groups of runs are merged into longer runs until few enough
+remain for the final merge.
+
+Time Complexity:
+- O(n log n) comparisons
+- O(n log_k(n / m)) I/O, where m is the number of items per chunk
+
+Space Complexity:
+- O(m) memory, set by the memory budget, regardless of the input size
+- O(n) temporary disk space
+
+Example:
+memory for 3 items, input = [9, 4, 7, 1, 8, 2, 6, 3]
+chunk [9, 4, 7] -> run 0: [4, 7, 9]
+chunk [1, 8, 2] -> run 1: [1, 2, 8]
+chunk [6, 3]    -> run 2: [3, 6]
+heap of heads: 4 (run 0), 1 (run 1), 3 (run 2)
+pop 1, push 2 from run 1 -> heads 4, 2, 3
+pop 2, push 8 from run 1 -> heads 4, 8, 3
+pop 3, push 6 from run 2 -> heads 4, 8, 6
+...
+[1, 2, 3, 4, 6, 7, 8, 9]
+"""
+
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from typing import Iterable, Iterator
+
+from rithm.sorting.merge import MergeSort, kway_merge
+
+
+class ExternalSort(object):
+    def __init__(
+        self,
+        source: Iterable | str | os.PathLike,
+        memory_limit: int = 64 * 1024 * 1024,
+        max_fan_in: int = 64,
+        buffer_size: int = 1024 * 1024,
+        block_size: int = 1024,
+        tmp_dir: str | None = None,
+    ) -> None:
+        """
+        :param source: An iterable of comparable, picklable items, or the path
+            of a file whose lines (as bytes) should be sorted.
+        :param memory_limit: Approximate number of bytes of items to hold in
+            memory before a chunk is sorted and spilled to disk.
+        :param max_fan_in: Maximum number of runs merged at once. If there are
+            more runs, they are merged in several passes.
+        :param buffer_size: Size in bytes of the I/O buffer for each run file.
+        :param block_size: Number of items pickled together in a run file.
+        :param tmp_dir: Directory for the run files. Defaults to the system
+            temporary directory.
+        """
+        if max_fan_in < 2:
+            raise ValueError("max_fan_in must be at least 2.")
+
+        self.source = source
+        self.memory_limit = memory_limit
+        self.max_fan_in = max_fan_in
+        self.buffer_size = buffer_size
+        self.block_size = block_size
+        self.tmp_dir = tmp_dir
+
+    def sort(
+        self, output: str | os.PathLike | None = None, debug: bool = False
+    ) -> Iterator | None:
+        """
+        Sorts the source using a bounded amount of memory.
+
+        The sort is stable. Items from earlier in the source come first when
+        keys are equal: chunks are sorted with a stable merge sort, runs are
+        numbered in source order and every merge pass takes groups of
+        neighbouring runs, and kway_merge breaks ties by input index using
+        only < on the items.
+
+        :param output: Optional path of a file to write the sorted items to.
+            Items must be bytes, as when sorting the lines of a file.
+        :param debug: If True, prints debug information.
+
+        :return: A generator of the sorted items, or None if output is given.
+            The generator does the work lazily and removes its temporary files
+            once it is exhausted or closed.
+        """
+        merged = self._sort(debug=debug)
+        if output is None:
+            return merged
+
+        with open(output, "wb", buffering=self.buffer_size) as f:
+            f.writelines(merged)
+        return None
+
+    def _sort(self, debug: bool = False) -> Iterator:
+        run_dir = tempfile.mkdtemp(prefix="rithm-", dir=self.tmp_dir)
+        try:
+            runs = []
+            chunk = None
+            for chunk in self._chunks():
+                if not runs and chunk.complete:
+                    # Everything fit in memory, so there is nothing to spill
+                    break
+                runs.append(self._spill(chunk, run_dir, len(runs)))
+                if debug:
+                    print(f"Spilled run {len(runs) - 1} with {len(chunk)} items")
+                chunk = None
+
+            if chunk is not None:
+                yield from chunk
+                return
+
+            # Merge groups of runs into longer runs until one pass is enough
+            level = 0
+            while len(runs) > self.max_fan_in:
+                level += 1
+                if debug:
+                    print(f"Pass {level}: merging {len(runs)} runs")
+                merged_runs = []
+                for i in range(0, len(runs), self.max_fan_in):
+                    group = runs[i : i + self.max_fan_in]
+                    path = os.path.join(run_dir, f"run-{level}-{len(merged_runs)}")
+                    self._write_run(
+                        path, kway_merge(*[self._read_run(p) for p in group])
+                    )
+                    for p in group:
+                        os.remove(p)
+                    merged_runs.append(path)
+                runs = merged_runs
+
+            if debug:
+                print(f"Final pass: merging {len(runs)} runs")
+            yield from kway_merge(*[self._read_run(p) for p in runs])
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+    def _chunks(self) -> Iterator["_Chunk"]:
+        """
+        Yields sorted chunks of the source that fit in the memory budget. The
+        last chunk is flagged as complete.
+        """
+        chunk = _Chunk()
+        size = 0
+        for item in self._read_source():
+            chunk.append(item)
+            # Count the item itself plus its pointer in the chunk list
+            size += sys.getsizeof(item) + 8
+            if size >= self.memory_limit:
+                MergeSort(chunk).adaptive_sort()
+                yield chunk
+                chunk = _Chunk()
+                size = 0
+
+        MergeSort(chunk).adaptive_sort()
+        chunk.complete = True
+        yield chunk
+
+    def _read_source(self) -> Iterator:
+        if not isinstance(self.source, (str, os.PathLike)):
+            yield from self.source
+            return
+
+        with open(self.source, "rb", buffering=self.buffer_size) as f:
+            for line in f:
+                # Terminate the last line so it sorts and writes like the rest
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                yield line
+
+    def _spill(self, chunk: list, run_dir: str, index: int) -> str:
+        path = os.path.join(run_dir, f"run-0-{index}")
+        self._write_run(path, chunk)
+        return path
+
+    def _write_run(self, path: str, items: Iterable) -> None:
+        """Writes items to a run file as a sequence of pickled blocks."""
+        with open(path, "wb", buffering=self.buffer_size) as f:
+            block = []
+            for item in items:
+                block.append(item)
+                if len(block) >= self.block_size:
+                    pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    block = []
+            if block:
+                pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _read_run(self, path: str) -> Iterator:
+        """Yields the items of a run file one block at a time."""
+        with open(path, "rb", buffering=self.buffer_size) as f:
+            while True:
+                try:
+                    block = pickle.load(f)
+                except EOFError:
+                    return
+                yield from block
+
+
+class _Chunk(list):
+    """A sorted chunk of the source, flagged when it is the last one."""
+
+    complete = False
+
+
+if __name__ == "__main__":
+    # Example usage
+    import random
+
+    data = [random.randint(0, 1000) for _ in range(20)]
+    print("Input:", data)
+    # A tiny memory budget and fan-in force several runs and a multi-pass merge
+    sorter = ExternalSort(data, memory_limit=200, max_fan_in=2)
+    print("Sorted:", list(sorter.sort(debug=True)))
@@ -1,3 +1,4 @@
+from .kway import kway_merge
 from .merge import MergeSort
 
-__all__ = ["MergeSort"]
+__all__ = ["MergeSort", "kway_merge"]
@@ -0,0 +1,240 @@
+"""
+This module implements a lazy k-way merge of sorted iterables.
+
+`MergeSort.merge` takes two lists and builds the merged list in memory.
+kway_merge instead takes any number of sorted iterables, such as file readers
+or database cursors, and yields the merged items one at a time. Only the
+current head of each input is held, so memory is O(k) for k inputs no matter
+how long they are.
+
+Heap merge:
+The heads sit in a binary heap ordered by key, then input index. Each output item
+is popped from the top and replaced by the next item of the same input, which
+costs O(log k) comparisons. Ties go to the earlier input, and items from the
+same input keep their order, so the merge is stable. Once a single input is
+left its remaining items are yielded directly.
+
+Two inputs:
+Merging two runs needs no heap. The runs are read in blocks and their heads
+compared one pair at a time, as in `MergeSort.merge`. Once one run has won
+seven times in a row it is likely to keep winning, so the merge starts
+galloping: a binary search finds how many items of one block go before the
+head of the other run, and that whole stretch is yielded at once. While one
+run dominates, whole blocks go out after a single search and the block size
+doubles (up to a cap). When the stretches get short again the merge returns to
+pairwise comparisons. This is the galloping mode of Timsort applied to
+streams.
+
+Galloping, once left has been winning:
+left:  [1, 2, 3, 4, 5, 6, 9]   right: [7, 8, 10]
+search left for 7  -> yield 1, 2, 3, 4, 5, 6 at once
+search right for 9 -> yield 7, 8
+search left for 10 -> yield 9, then the rest of right
+
+Time Complexity:
+- O(n log k) comparisons for n items in total
+- O(n) comparisons for two inputs, and far fewer when one run dominates
+
+Space Complexity:
+- O(k) for the heap, or O(block) for the two-input merge
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+# Items read from each input at a time by the two-input merge
+_MIN_BLOCK = 16
+_MAX_BLOCK = 1024
+# Consecutive wins by one run before the two-input merge starts galloping
+_MIN_GALLOP = 7
+
+
+def kway_merge(
+    *iterables: Iterable,
+    key: Callable | None = None,
+    reverse: bool = False,
+) -> Iterator:
+    """
+    Lazily merges sorted iterables into one sorted stream.
+
+    :param iterables: The inputs, each sorted by the same key and direction.
+    :param key: Optional function computing the key each input is sorted by.
+        It is called once per item.
+    :param reverse: If True, the inputs are sorted in descending order and so
+        is the output.
+
+    :return: An iterator over all the items in sorted order. Equal items come
+        out in input order, earlier inputs first.
+    """
+    if reverse:
+        key = _descending(key)
+    if len(iterables) == 2:
+        return _merge_two(iterables[0], iterables[1], key)
+    return _merge_heap(iterables, key)
+
+
+def _merge_heap(iterables: tuple, key: Callable | None) -> Iterator:
+    """Merges any number of inputs through a heap of their heads."""
+    heap = []
+    for index, iterable in enumerate(iterables):
+        it = iter(iterable)
+        for item in it:
+            heap.append(_Entry(item if key is None else key(item), index, item, it))
+            break
+    heapq.heapify(heap)
+
+    # Entries are updated in place, so nothing is allocated per item
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry.item
+        for item in entry.it:
+            entry.key = item if key is None else key(item)
+            entry.item = item
+            heapq.heapreplace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)
+    if heap:
+        yield heap[0].item
+        yield from heap[0].it
+
+
+def _merge_two(first: Iterable, second: Iterable, key: Callable | None) -> Iterator:
+    """
+    Merges two inputs block by block, switching between pairwise comparisons
+    and galloping like Timsort. Ties go to the first input.
+    """
+    left, right = iter(first), iter(second)
+    a, ka = _read(left, _MIN_BLOCK, key)
+    b, kb = _read(right, _MIN_BLOCK, key)
+    i = j = 0
+    if not a or not b:
+        yield from b if not a else a
+        yield from right if not a else left
+        return
+
+    while True:
+        # Compare one pair at a time while the runs interleave
+        wins_a = wins_b = 0
+        while wins_a < _MIN_GALLOP and wins_b < _MIN_GALLOP:
+            if kb[j] < ka[i]:
+                yield b[j]
+                j += 1
+                wins_b += 1
+                wins_a = 0
+                if j == len(b):
+                    b, kb = _read(right, _MIN_BLOCK, key)
+                    j = 0
+                    if not b:
+                        yield from a[i:]
+                        yield from left
+                        return
+            else:
+                yield a[i]
+                i += 1
+                wins_a += 1
+                wins_b = 0
+                if i == len(a):
+                    a, ka = _read(left, _MIN_BLOCK, key)
+                    i = 0
+                    if not a:
+                        yield from b[j:]
+                        yield from right
+                        return
+
+        # One run is winning, so find whole stretches of it by binary search
+        # until the stretches get short again
+        size = _MIN_BLOCK
+        while True:
+            # Everything in a up to the head of b
+            cut = bisect_right(ka, kb[j], i)
+            stretch = cut - i
+            yield from a[i:cut]
+            i = cut
+            if i == len(a):
+                size = min(2 * size, _MAX_BLOCK)
+                a, ka = _read(left, size, key)
+                i = 0
+                if not a:
+                    yield from b[j:]
+                    yield from right
+                    return
+                continue
+
+            # Everything in b strictly below the head of a
+            cut = bisect_left(kb, ka[i], j)
+            stretch += cut - j
+            yield from b[j:cut]
+            j = cut
+            if j == len(b):
+                size = min(2 * size, _MAX_BLOCK)
+                b, kb = _read(right, size, key)
+                j = 0
+                if not b:
+                    yield from a[i:]
+                    yield from left
+                    return
+                continue
+
+            if stretch < _MIN_GALLOP:
+                break
+
+
+def _read(it: Iterator, size: int, key: Callable | None) -> tuple[list, list]:
+    """Reads the next block of up to size items and their keys."""
+    block = list(islice(it, size))
+    return block, block if key is None else list(map(key, block))
+
+
+class _Entry(object):
+    """
+    The head of one input in the heap. Entries are ordered by key and then by
+    input index, using only < on the keys: a tuple or list would test the keys
+    with == first, which for items that only define __lt__ falls back to
+    identity and lets the tie-break be skipped.
+    """
+
+    __slots__ = ("key", "index", "item", "it")
+
+    def __init__(self, key, index: int, item, it: Iterator) -> None:
+        self.key = key
+        self.index = index
+        self.item = item
+        self.it = it
+
+    def __lt__(self, other: "_Entry") -> bool:
+        if self.key < other.key:
+            return True
+        if other.key < self.key:
+            return False
+        return self.index < other.index
+
+
+class _Descending(object):
+    """Wraps a key so that comparing wrapped keys reverses the order."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: "_Descending") -> bool:
+        return self.value == other.value
+
+
+def _descending(key: Callable | None) -> Callable:
+    if key is None:
+        return _Descending
+    return lambda item: _Descending(key(item))
+
+
+if __name__ == "__main__":
+    # Example usage
+    print(list(kway_merge([1, 4, 7], [2, 5, 8], [3, 6, 9])))  # [1, 2, ..., 9]
+    print(list(kway_merge(["b", "d"], ["A", "C"], key=str.lower)))  # A b C d
+    print(list(kway_merge([9, 5, 1], [8, 2], reverse=True)))  # [9, 8, 5, 2, 1]
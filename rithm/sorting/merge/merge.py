@@ -35,41 +35,167 @@ Sort [3, 11] <> [4, 5]
 [3, 4, 5, 11]
 Finally, merge [8, 9, 12] <> [3, 4, 5, 11]
 [3, 4, 5, 8, 9, 11, 12]
+
+Bottom-up merge sort:
+The recursive sort above creates a new MergeSort object, two slices and a new
+merged list for every call, which is O(n log n) short lived allocations. The
+bottom-up variant skips the recursion entirely. It first merges neighbouring
+runs of width 1, then width 2, 4, 8 and so on, ping-ponging between the array
+and a single auxiliary buffer of size n allocated up front.
+
+Base case:
+Merging runs of one or two elements costs more in loop overhead than it saves.
+Both sort and bottom_up_sort therefore sort blocks of up to `cutoff` elements
+with a small stable kernel, binary insertion sort by default, and only merge
+from there. The kernel and the cutoff are pluggable and tuned by benchmarking,
+see `rithm.sorting.small`.
+
+Adaptive merge sort:
+Both variants above do the full O(n log n) work even when the input is already
+mostly in order. The adaptive variant follows Timsort instead:
+- The array is scanned for natural runs. Non-descending runs are kept as they
+  are and strictly descending runs are reversed in place.
+- Runs shorter than minrun (a value between 32 and 64 chosen so the number of
+  runs is close to a power of two) are extended with binary insertion sort.
+- Runs are pushed onto a stack and merged while the invariants
+  len(A) > len(B) + len(C) and len(B) > len(C) are broken, which keeps merges
+  balanced.
+- Merging switches to galloping (exponential search) when one run keeps
+  winning, so long stretches are copied in one go.
+Presorted input is a single run and is sorted in O(n).
+
+All variants are stable: when two keys are equal the one from the left run is
+taken first, so equal elements keep their original order.
+
+Sorting by key:
+With a key function every variant decorates the array once into a key column
+and an index column, merge sorts the two bottom-up in lockstep comparing only
+the keys, and then gathers the elements by index. All variants are stable, so
+they give the same result for the same key.
+
+Typed buffers:
+`array.array`, `bytearray`, `memoryview` and NumPy arrays are sorted as they
+are, without being turned into a list. The auxiliary buffer of the bottom-up
+sort and the run copies of the adaptive sort are allocated with the same type
+and typecode as the input, so sorting an array('q') in place peaks at about
+twice its raw size. sort returns a sorted copy of the same type, made with
+one copy and an adaptive sort, rather than a list built from slices.
+reverse=True without a key reverses the buffer, sorts it and reverses it
+again, which keeps equal elements in order without an index column.
 """
 
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterable, Iterator
+
+from rithm.backend import use_numpy, vectorized
+from rithm.sorting._buffer import copy, is_buffer, reverse as reverse_range
+from rithm.sorting._keyed import decorate, scratch, undecorate
+from rithm.sorting.merge.kway import kway_merge
+from rithm.sorting.small import resolve_base_case
+from rithm.sorting.stats import SortStats
+
+# Arrays shorter than this are sorted with binary insertion alone
+_MIN_MERGE = 64
+# Number of consecutive wins by one run before merging starts galloping
+_MIN_GALLOP = 7
+
 
 class MergeSort(object):
     def __init__(self, array: list) -> None:
         self.array: list = array
 
-    def sort(self, debug: bool = False) -> list:
+    def sort(
+        self,
+        debug: bool = False,
+        key: Callable | None = None,
+        reverse: bool = False,
+        stats: SortStats | None = None,
+        backend: str | None = None,
+        base_case: str | Callable | None = None,
+        cutoff: int | None = None,
+        _depth: int = 0,
+    ) -> list:
         """
         Sorts the array using the merge sort algorithm.
 
         This method recursively divides the array into halves, sorts each half,
         and then merges the sorted halves back together.
 
-        :param debug: If True, prints debug information.
+        :param debug: If True, prints every merge.
+        :param key: Optional function computing the key to sort each element
+            by. Each key is computed once and cached.
+        :param reverse: If True, sorts in descending order.
+        :param stats: Optional SortStats that counts comparisons, allocated
+            lists, recursion depth and merge sizes. Not used when sorting by
+            key.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+        :param base_case: The stable kernel that sorts arrays of at most
+            `cutoff` elements instead of splitting them: a name from
+            `rithm.sorting.small.STABLE` or a function called as
+            kernel(array, low, high). Defaults to the tuned kernel.
+        :param cutoff: Arrays of at most this many elements go to the base
+            case. Defaults to the tuned cutoff.
 
         :return: A new sorted list containing the elements of the original array.
+            A typed buffer gives a sorted copy of the same type instead.
         """
+        if use_numpy(self.array, backend, key, stats, debug):
+            return vectorized.sorted_copy(self.array, "stable", reverse)
+        if key is None and is_buffer(self.array):
+            # One copy of the same type, sorted in place, instead of slices
+            return MergeSort(copy(self.array)).adaptive_sort(
+                debug=debug, reverse=reverse, stats=stats, backend="python"
+            )
+        if key is not None or reverse:
+            return self._sort_keyed(key, reverse)
+
         if len(self.array) <= 1:
             return self.array
 
+        stats = SortStats.resolve(stats, debug)
+        kernel, cutoff = resolve_base_case("merge", base_case, cutoff)
+        if len(self.array) <= cutoff:
+            result = self.array[:]
+            if stats is not None:
+                stats.allocations += 1
+                stats.record_depth(_depth)
+                stats.emit("base_case", array=result)
+            kernel(result, 0, len(result))
+            return result
+
         _mid = len(self.array) // 2
 
         L = self.array[:_mid]
         R = self.array[_mid:]
 
-        if debug:
-            print(self.array)
-            # print(L, R)
-        _left = MergeSort(L).sort(debug=debug)
-        _right = MergeSort(R).sort(debug=debug)
+        if stats is not None:
+            stats.allocations += 2
+            stats.record_depth(_depth)
+        _left = MergeSort(L).sort(
+            stats=stats,
+            backend="python",
+            base_case=kernel,
+            cutoff=cutoff,
+            _depth=_depth + 1,
+        )
+        _right = MergeSort(R).sort(
+            stats=stats,
+            backend="python",
+            base_case=kernel,
+            cutoff=cutoff,
+            _depth=_depth + 1,
+        )
 
-        return self.merge(_left, _right, debug=debug)
+        return self.merge(_left, _right, stats=stats)
 
-    def merge(self, left: list, right: list, debug: bool = False) -> list:
+    def merge(
+        self,
+        left: list,
+        right: list,
+        debug: bool = False,
+        stats: SortStats | None = None,
+    ) -> list:
         """
         Merges two sorted lists into one sorted list.
 
@@ -81,18 +207,22 @@ class MergeSort(object):
 
         :param left: The first sorted list.
         :param right: The second sorted list.
-        :param debug: If True, prints debug information.
+        :param debug: If True, prints the merged lists.
+        :param stats: Optional SortStats that counts comparisons and the
+            allocated result list.
 
         :return: A new sorted list containing all elements from both input lists.
         """
+        stats = SortStats.resolve(stats, debug)
+        if stats is not None:
+            return self._merge_instrumented(left, right, stats)
+
         sorted_array = []
         i = j = 0
 
-        if debug:
-            print("Merging:", left, right)
-
         while i < len(left) and j < len(right):
-            if left[i] < right[j]:
+            # Take from the left on ties so equal keys keep their order
+            if left[i] <= right[j]:
                 sorted_array.append(left[i])
                 i += 1
             else:
@@ -101,15 +231,721 @@ class MergeSort(object):
 
         sorted_array.extend(left[i:])
         sorted_array.extend(right[j:])
+        return sorted_array
 
-        if debug:
-            print("Merged:", sorted_array)
+    @staticmethod
+    def _merge_instrumented(left: list, right: list, stats: SortStats) -> list:
+        """The loop of `merge`, counting comparisons into stats."""
+        sorted_array = []
+        i = j = 0
+        stats.allocations += 1
+        stats.partition_sizes.append(len(left) + len(right))
+
+        while i < len(left) and j < len(right):
+            stats.comparisons += 1
+            if left[i] <= right[j]:
+                sorted_array.append(left[i])
+                i += 1
+            else:
+                sorted_array.append(right[j])
+                j += 1
+
+        sorted_array.extend(left[i:])
+        sorted_array.extend(right[j:])
+        stats.emit("merge", left=left, right=right, merged=sorted_array)
         return sorted_array
 
+    @staticmethod
+    def imerge(
+        *iterables: Iterable, key: Callable | None = None, reverse: bool = False
+    ) -> Iterator:
+        """
+        Lazily merges any number of sorted iterables, holding only the head of
+        each. This is the streaming form of `merge`; see
+        `rithm.sorting.merge.kway` for how it works.
+
+        :param iterables: The inputs, each sorted by the same key and direction.
+        :param key: Optional function computing the key each input is sorted by.
+        :param reverse: If True, the inputs and the output are in descending
+            order.
+
+        :return: An iterator over the merged items. Equal items come out in
+            input order, so the merge is stable.
+        """
+        return kway_merge(*iterables, key=key, reverse=reverse)
+
+    def bottom_up_sort(
+        self,
+        out: list | None = None,
+        debug: bool = False,
+        key: Callable | None = None,
+        reverse: bool = False,
+        stats: SortStats | None = None,
+        backend: str | None = None,
+        base_case: str | Callable | None = None,
+        cutoff: int | None = None,
+    ) -> list:
+        """
+        Sorts the array using an iterative, bottom-up merge sort.
+
+        Blocks of `cutoff` elements are first sorted with the base case
+        kernel. Runs of width cutoff, 2 * cutoff, 4 * cutoff, ... are then
+        merged pairwise, alternating between the array and one auxiliary
+        buffer of size n, so the only allocation is that buffer. The sort is
+        stable.
+
+        :param out: Optional list to sort into. The array is copied into it
+            and sorted there, leaving `self.array` untouched. If None, the
+            array is sorted in place.
+        :param debug: If True, prints the array after each pass.
+        :param key: Optional function computing the key to sort each element
+            by. Each key is computed once and cached.
+        :param reverse: If True, sorts in descending order.
+        :param stats: Optional SortStats that counts comparisons, the
+            auxiliary buffer and the merge sizes. Comparisons made by the base
+            case are not counted. Not used when sorting by key.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+        :param base_case: The stable kernel that sorts the initial blocks: a
+            name from `rithm.sorting.small.STABLE` or a function called as
+            kernel(array, low, high). Defaults to the tuned kernel. Pass
+            cutoff=1 to merge from single elements up.
+        :param cutoff: The size of the initial blocks. Defaults to the tuned
+            cutoff.
+
+        :return: The sorted list, which is either `self.array` or `out`.
+        """
+        if use_numpy(self.array, backend, key, stats, debug):
+            array = self.array
+            if out is not None:
+                out[:] = self.array
+                array = out
+            vectorized.sort(array, "stable", reverse)
+            return array
+        if key is None and reverse and is_buffer(self.array):
+            if out is not None:
+                out[:] = self.array
+                return MergeSort(out).bottom_up_sort(
+                    debug=debug,
+                    reverse=True,
+                    stats=stats,
+                    backend="python",
+                    base_case=base_case,
+                    cutoff=cutoff,
+                )
+            return self._sort_reversed(
+                lambda: self.bottom_up_sort(
+                    debug=debug,
+                    stats=stats,
+                    backend="python",
+                    base_case=base_case,
+                    cutoff=cutoff,
+                )
+            )
+        if key is not None or reverse:
+            array = self.array if out is None else out
+            array[:] = self._sort_keyed(key, reverse)
+            return array
+
+        if out is None:
+            array = self.array
+        else:
+            out[:] = self.array
+            array = out
+
+        n = len(array)
+        if n <= 1:
+            return array
+
+        stats = SortStats.resolve(stats, debug)
+        kernel, width = resolve_base_case("merge", base_case, cutoff)
+        if width > 1:
+            for low in range(0, n, width):
+                kernel(array, low, min(low + width, n))
+            if stats is not None:
+                stats.emit("base_case", width=width, array=array)
+        if width >= n:
+            return array
+
+        if stats is not None:
+            stats.allocations += 1
+        src = array
+        dst = scratch(array)
+        while width < n:
+            for low in range(0, n, 2 * width):
+                mid = min(low + width, n)
+                high = min(low + 2 * width, n)
+                if stats is None:
+                    self._merge_into(src, dst, low, mid, high)
+                else:
+                    self._merge_into_instrumented(src, dst, low, mid, high, stats)
+
+            if stats is not None:
+                stats.emit("pass", width=width, array=dst)
+            src, dst = dst, src
+            width *= 2
+
+        # After an odd number of passes the result is in the auxiliary buffer
+        if src is not array:
+            array[:] = src
+        return array
+
+    def adaptive_sort(
+        self,
+        debug: bool = False,
+        key: Callable | None = None,
+        reverse: bool = False,
+        stats: SortStats | None = None,
+        backend: str | None = None,
+    ) -> list:
+        """
+        Sorts the array in place using a natural-run adaptive merge sort
+        (Timsort).
+
+        The array is split into its natural ascending or strictly descending
+        runs, short runs are extended to minrun with binary insertion, and runs
+        are merged with galloping while maintaining the run stack invariants.
+        Input that is already sorted is handled in O(n). The sort is stable.
+
+        :param debug: If True, prints every run and merge.
+        :param key: Optional function computing the key to sort each element
+            by. Each key is computed once and cached, and the key column is
+            merge sorted bottom-up.
+        :param reverse: If True, sorts in descending order.
+        :param stats: Optional SortStats that records the run stack depth,
+            the merge sizes and the temporary run copies. Comparisons made
+            while galloping are not counted. Not used when sorting by key.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+
+        :return: The sorted array (`self.array`).
+        """
+        if use_numpy(self.array, backend, key, stats, debug):
+            vectorized.sort(self.array, "stable", reverse)
+            return self.array
+        if key is None and reverse and is_buffer(self.array):
+            return self._sort_reversed(
+                lambda: self.adaptive_sort(debug=debug, stats=stats, backend="python")
+            )
+        if key is not None or reverse:
+            self.array[:] = self._sort_keyed(key, reverse)
+            return self.array
+
+        array = self.array
+        n = len(array)
+        if n < 2:
+            return array
+
+        stats = SortStats.resolve(stats, debug)
+        minrun = self._min_run(n)
+        runs = []
+        self._min_gallop = _MIN_GALLOP
+
+        low = 0
+        while low < n:
+            run_len = self._count_run(low, n)
+            if run_len < minrun:
+                forced = min(minrun, n - low)
+                self._binary_insertion_sort(low, low + forced, low + run_len)
+                run_len = forced
+
+            runs.append((low, run_len))
+            if stats is not None:
+                stats.record_depth(len(runs))
+                stats.emit("run", low=low, length=run_len)
+            self._merge_collapse(runs, stats=stats)
+            low += run_len
+
+        self._merge_force_collapse(runs, stats=stats)
+        return array
+
+    def _sort_reversed(self, sort: Callable[[], list]) -> list:
+        """
+        Sorts a typed buffer in descending order by reversing it, sorting it
+        ascending with sort() and reversing it back. Equal elements are
+        reversed twice around a stable sort, so they keep their order.
+        """
+        array = self.array
+        reverse_range(array, 0, len(array) - 1)
+        sort()
+        reverse_range(array, 0, len(array) - 1)
+        return array
+
+    @staticmethod
+    def _min_run(n: int) -> int:
+        """
+        Returns the minimum run length for an array of length n. Taking the
+        top six bits of n, plus one if any of the remaining bits are set, makes
+        n / minrun a power of two or just under one.
+        """
+        r = 0
+        while n >= _MIN_MERGE:
+            r |= n & 1
+            n >>= 1
+        return n + r
+
+    def _count_run(self, low: int, high: int) -> int:
+        """
+        Returns the length of the run starting at low, reversing it in place
+        if it is strictly descending. Descending runs must be strict so that
+        reversing them cannot reorder equal elements.
+        """
+        array = self.array
+        i = low + 1
+        if i == high:
+            return 1
+
+        if array[i] < array[i - 1]:
+            i += 1
+            while i < high and array[i] < array[i - 1]:
+                i += 1
+            self._reverse(low, i - 1)
+        else:
+            i += 1
+            while i < high and not array[i] < array[i - 1]:
+                i += 1
+        return i - low
+
+    def _reverse(self, low: int, high: int) -> None:
+        reverse_range(self.array, low, high)
+
+    def _binary_insertion_sort(self, low: int, high: int, start: int) -> None:
+        """
+        Sorts array[low:high] given that array[low:start] is already sorted,
+        finding each insertion point with a binary search. Inserting after any
+        equal keys keeps the sort stable.
+        """
+        array = self.array
+        for i in range(start, high):
+            pivot = array[i]
+            pos = bisect_right(array, pivot, low, i)
+            if pos != i:
+                array[pos + 1 : i + 1] = array[pos:i]
+                array[pos] = pivot
+
+    def _merge_collapse(self, runs: list, stats: SortStats | None = None) -> None:
+        """
+        Merges runs at the top of the stack until the invariants
+        len(A) > len(B) + len(C) and len(B) > len(C) hold for the top
+        four runs.
+        """
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or (
+                n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]
+            ):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self._merge_at(runs, n, stats=stats)
+
+    def _merge_force_collapse(self, runs: list, stats: SortStats | None = None) -> None:
+        """Merges all remaining runs on the stack into one."""
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self._merge_at(runs, n, stats=stats)
+
+    def _merge_at(self, runs: list, i: int, stats: SortStats | None = None) -> None:
+        """Merges the adjacent runs at positions i and i + 1 of the stack."""
+        array = self.array
+        base_a, len_a = runs[i]
+        base_b, len_b = runs[i + 1]
+        runs[i] = (base_a, len_a + len_b)
+        del runs[i + 1]
+
+        if stats is not None:
+            stats.partition_sizes.append(len_a + len_b)
+            stats.emit("merge_runs", base_a=base_a, len_a=len_a, len_b=len_b)
+
+        # Elements of A that are <= B[0] are already in their final place
+        k = self._gallop_right(array[base_b], array, base_a, len_a, 0)
+        base_a += k
+        len_a -= k
+        if len_a == 0:
+            return
+
+        # Elements of B that are >= A[-1] are already in their final place
+        len_b = self._gallop_left(
+            array[base_a + len_a - 1], array, base_b, len_b, len_b - 1
+        )
+        if len_b == 0:
+            return
+
+        # Copy the smaller run out and merge into the space it leaves
+        if stats is not None:
+            stats.allocations += 1
+        if len_a <= len_b:
+            self._merge_lo(base_a, len_a, base_b, len_b)
+        else:
+            self._merge_hi(base_a, len_a, base_b, len_b)
+
+    def _merge_lo(self, base_a: int, len_a: int, base_b: int, len_b: int) -> None:
+        """
+        Merges run A into the space it shares with run B, working from the left.
+        A is copied to a temporary buffer, so it should be the smaller run.
+        """
+        array = self.array
+        tmp = copy(array, base_a, base_a + len_a)
+        i, j, dest = 0, base_b, base_a
+        end_b = base_b + len_b
+        min_gallop = self._min_gallop
+
+        while i < len_a and j < end_b:
+            # Compare one pair at a time until a run wins min_gallop times
+            count_a = count_b = 0
+            while (
+                i < len_a
+                and j < end_b
+                and count_a < min_gallop
+                and count_b < min_gallop
+            ):
+                if array[j] < tmp[i]:
+                    array[dest] = array[j]
+                    j += 1
+                    count_a = 0
+                    count_b += 1
+                else:
+                    array[dest] = tmp[i]
+                    i += 1
+                    count_a += 1
+                    count_b = 0
+                dest += 1
+
+            # Gallop, copying whole stretches, while it keeps paying off
+            while i < len_a and j < end_b:
+                count_a = self._gallop_right(array[j], tmp, i, len_a - i, 0)
+                array[dest : dest + count_a] = tmp[i : i + count_a]
+                dest += count_a
+                i += count_a
+                if i == len_a:
+                    break
+
+                count_b = self._gallop_left(tmp[i], array, j, end_b - j, 0)
+                array[dest : dest + count_b] = array[j : j + count_b]
+                dest += count_b
+                j += count_b
+
+                if count_a < _MIN_GALLOP and count_b < _MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+
+        # Anything left in A goes at the end, anything left in B is in place
+        array[dest : dest + len_a - i] = tmp[i:]
+        self._min_gallop = min_gallop
+
+    def _merge_hi(self, base_a: int, len_a: int, base_b: int, len_b: int) -> None:
+        """
+        Merges run B into the space it shares with run A, working from the
+        right. B is copied to a temporary buffer, so it should be the smaller
+        run.
+        """
+        array = self.array
+        tmp = copy(array, base_b, base_b + len_b)
+        i = base_a + len_a - 1
+        j = len_b - 1
+        dest = base_b + len_b - 1
+        min_gallop = self._min_gallop
+
+        while i >= base_a and j >= 0:
+            # Compare one pair at a time until a run wins min_gallop times
+            count_a = count_b = 0
+            while (
+                i >= base_a and j >= 0 and count_a < min_gallop and count_b < min_gallop
+            ):
+                if tmp[j] < array[i]:
+                    array[dest] = array[i]
+                    i -= 1
+                    count_a += 1
+                    count_b = 0
+                else:
+                    array[dest] = tmp[j]
+                    j -= 1
+                    count_a = 0
+                    count_b += 1
+                dest -= 1
+
+            # Gallop, copying whole stretches, while it keeps paying off
+            while i >= base_a and j >= 0:
+                k = self._gallop_right(
+                    tmp[j], array, base_a, i - base_a + 1, i - base_a
+                )
+                count_a = i - base_a + 1 - k
+                array[dest - count_a + 1 : dest + 1] = array[base_a + k : i + 1]
+                dest -= count_a
+                i -= count_a
+                if i < base_a:
+                    break
+
+                k = self._gallop_left(array[i], tmp, 0, j + 1, j)
+                count_b = j + 1 - k
+                array[dest - count_b + 1 : dest + 1] = tmp[k : j + 1]
+                dest -= count_b
+                j -= count_b
+
+                if count_a < _MIN_GALLOP and count_b < _MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+
+        # Anything left in B goes at the front, anything left in A is in place
+        array[dest - j : dest + 1] = tmp[: j + 1]
+        self._min_gallop = min_gallop
+
+    @staticmethod
+    def _gallop_left(key, a, base: int, n: int, hint: int) -> int:
+        """
+        Returns k such that a[base + k - 1] < key <= a[base + k], searching
+        a[base:base + n] outwards from base + hint in steps of 1, 3, 7, 15, ...
+        before finishing with a binary search.
+        """
+        last_ofs, ofs = 0, 1
+        if a[base + hint] < key:
+            max_ofs = n - hint
+            while ofs < max_ofs and a[base + hint + ofs] < key:
+                last_ofs = ofs
+                ofs = (ofs << 1) + 1
+            ofs = min(ofs, max_ofs)
+            last_ofs, ofs = hint + last_ofs, hint + ofs
+        else:
+            max_ofs = hint + 1
+            while ofs < max_ofs and not a[base + hint - ofs] < key:
+                last_ofs = ofs
+                ofs = (ofs << 1) + 1
+            ofs = min(ofs, max_ofs)
+            last_ofs, ofs = hint - ofs, hint - last_ofs
+
+        # Now a[base + last_ofs] < key <= a[base + ofs]
+        return bisect_left(a, key, base + last_ofs + 1, base + ofs) - base
+
+    @staticmethod
+    def _gallop_right(key, a, base: int, n: int, hint: int) -> int:
+        """
+        Returns k such that a[base + k - 1] <= key < a[base + k], searching
+        a[base:base + n] outwards from base + hint in steps of 1, 3, 7, 15, ...
+        before finishing with a binary search.
+        """
+        last_ofs, ofs = 0, 1
+        if key < a[base + hint]:
+            max_ofs = hint + 1
+            while ofs < max_ofs and key < a[base + hint - ofs]:
+                last_ofs = ofs
+                ofs = (ofs << 1) + 1
+            ofs = min(ofs, max_ofs)
+            last_ofs, ofs = hint - ofs, hint - last_ofs
+        else:
+            max_ofs = n - hint
+            while ofs < max_ofs and not key < a[base + hint + ofs]:
+                last_ofs = ofs
+                ofs = (ofs << 1) + 1
+            ofs = min(ofs, max_ofs)
+            last_ofs, ofs = hint + last_ofs, hint + ofs
+
+        # Now a[base + last_ofs] <= key < a[base + ofs]
+        return bisect_right(a, key, base + last_ofs + 1, base + ofs) - base
+
+    def _bottom_up_steps(self, step: int = 4096) -> Iterator[int]:
+        """
+        The bottom-up merge sort as a generator, for callers that must not
+        block for the whole sort, such as `rithm.sorting.aio.asort`.
+
+        The array is sorted in place, and after roughly every `step` elements
+        merged the generator yields the number merged so far. Merges longer
+        than `step` are split, so the work between two yields is bounded no
+        matter how wide the runs get. A full sort merges n elements per pass
+        over ceil(log2(n)) passes.
+
+        If the generator is closed before it finishes, the array still holds
+        every one of its elements, in a partly sorted order.
+
+        :param step: The number of elements to merge between yields.
+
+        :return: An iterator over the running count of merged elements.
+        """
+        array = self.array
+        n = len(array)
+        if n <= 1:
+            return
+
+        src = array
+        dst = scratch(array)
+        done = pending = 0
+        try:
+            width = 1
+            while width < n:
+                for low in range(0, n, 2 * width):
+                    mid = min(low + width, n)
+                    high = min(low + 2 * width, n)
+                    i, j, k = low, mid, low
+                    while k < high:
+                        start = k
+                        stop = min(k + step - pending, high)
+                        while k < stop and i < mid and j < high:
+                            if src[j] < src[i]:
+                                dst[k] = src[j]
+                                j += 1
+                            else:
+                                dst[k] = src[i]
+                                i += 1
+                            k += 1
+
+                        # One run is used up, so copy the next piece of the other
+                        if k < stop:
+                            if i < mid:
+                                dst[k:stop] = src[i : i + stop - k]
+                                i += stop - k
+                            else:
+                                dst[k:stop] = src[j : j + stop - k]
+                                j += stop - k
+                            k = stop
+
+                        pending += k - start
+                        if pending >= step:
+                            done += pending
+                            pending = 0
+                            yield done
+
+                src, dst = dst, src
+                width *= 2
+            if pending:
+                yield done + pending
+        finally:
+            # The source of the current pass always holds a full copy
+            if src is not array:
+                array[:] = src
+
+    def _sort_keyed(self, key: Callable | None, reverse: bool) -> list:
+        """
+        Decorates the array, merge sorts the key and index columns bottom-up
+        and returns a new list of the elements in sorted order.
+        """
+        keys, order = decorate(self.array, key, reverse)
+        n = len(keys)
+
+        src_keys, src_order = keys, order
+        dst_keys, dst_order = scratch(keys), scratch(order)
+        width = 1
+        while width < n:
+            for low in range(0, n, 2 * width):
+                mid = min(low + width, n)
+                high = min(low + 2 * width, n)
+
+                i, j, k = low, mid, low
+                while i < mid and j < high:
+                    if src_keys[i] <= src_keys[j]:
+                        dst_keys[k] = src_keys[i]
+                        dst_order[k] = src_order[i]
+                        i += 1
+                    else:
+                        dst_keys[k] = src_keys[j]
+                        dst_order[k] = src_order[j]
+                        j += 1
+                    k += 1
+                while i < mid:
+                    dst_keys[k] = src_keys[i]
+                    dst_order[k] = src_order[i]
+                    i += 1
+                    k += 1
+                while j < high:
+                    dst_keys[k] = src_keys[j]
+                    dst_order[k] = src_order[j]
+                    j += 1
+                    k += 1
+
+            src_keys, dst_keys = dst_keys, src_keys
+            src_order, dst_order = dst_order, src_order
+            width *= 2
+
+        return undecorate(self.array, src_order, reverse)
+
+    @staticmethod
+    def _merge_into(src: list, dst: list, low: int, mid: int, high: int) -> None:
+        """
+        Merges the sorted runs src[low:mid] and src[mid:high] into
+        dst[low:high] without allocating.
+        """
+        i, j, k = low, mid, low
+        while i < mid and j < high:
+            if src[i] <= src[j]:
+                dst[k] = src[i]
+                i += 1
+            else:
+                dst[k] = src[j]
+                j += 1
+            k += 1
+
+        # At most one of the runs has elements left over
+        while i < mid:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+        while j < high:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+
+    @staticmethod
+    def _merge_into_instrumented(
+        src: list, dst: list, low: int, mid: int, high: int, stats: SortStats
+    ) -> None:
+        """The loop of `_merge_into`, counting comparisons into stats."""
+        stats.partition_sizes.append(high - low)
+        i, j, k = low, mid, low
+        while i < mid and j < high:
+            stats.comparisons += 1
+            if src[i] <= src[j]:
+                dst[k] = src[i]
+                i += 1
+            else:
+                dst[k] = src[j]
+                j += 1
+            k += 1
+
+        # Copy the leftover run in one slice assignment
+        if i < mid:
+            dst[k:high] = src[i:mid]
+        elif j < high:
+            dst[k:high] = src[j:high]
+
+
+def _benchmark(n: int = 100_000, repeat: int = 3) -> None:
+    """
+    Compares the recursive sort with the adaptive sort on mostly sorted
+    input: a sorted prefix with a shuffled tail of 1% of the elements.
+    """
+    import random
+    import timeit
+
+    data = list(range(n))
+    tail = data[-n // 100 :]
+    random.shuffle(tail)
+    data[-n // 100 :] = tail
+
+    recursive = min(
+        timeit.repeat(lambda: MergeSort(data[:]).sort(), number=1, repeat=repeat)
+    )
+    adaptive = min(
+        timeit.repeat(
+            lambda: MergeSort(data[:]).adaptive_sort(), number=1, repeat=repeat
+        )
+    )
+    print(f"Mostly sorted input, n={n}")
+    print(f"  sort:          {recursive:.4f}s")
+    print(f"  adaptive_sort: {adaptive:.4f}s ({recursive / adaptive:.1f}x faster)")
+
 
 if __name__ == "__main__":
     # Example usage
     array = [12, 8, 9, 3, 11, 5, 4]
     merge_sort = MergeSort(array)
-    sorted_array = merge_sort.sort(debug=True)
+    # cutoff=1 merges all the way down to single elements, as in the example
+    sorted_array = merge_sort.sort(debug=True, cutoff=1)
     print("Sorted array:", sorted_array)
+    # Sort in place with a single auxiliary buffer instead:
+    merge_sort.bottom_up_sort()
+    print("Sorted array (bottom-up):", array)
+
+    _benchmark()
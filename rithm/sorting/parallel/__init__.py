@@ -0,0 +1,3 @@
+from .parallel import ParallelSort
+
+__all__ = ["ParallelSort"]
@@ -0,0 +1,349 @@
+"""
+This module implements a parallel sort that spreads the work across cores.
+
+Python threads cannot sort in parallel because of the GIL, so the work is
+split between worker processes from a `concurrent.futures.ProcessPoolExecutor`.
+Two strategies are available:
+
+Merge: the input is cut into P contiguous partitions, each worker sorts one,
+and the sorted partitions are combined with a heap-based k-way merge. The final
+merge runs in the parent process and costs O(n log P).
+
+Sample sort: P - 1 splitters are picked from a random sample of the input so
+that they divide it into P buckets of roughly equal size. Workers distribute
+their partition into the buckets and then sort one bucket each. Every item in
+bucket i is less than every item in bucket i + 1, so the sorted buckets are
+simply concatenated and no final merge is needed.
+
+Lists, and arrays of a typecode that cannot be shared such as "u", are sent to
+the workers by pickling. Numeric `array.array` inputs are instead copied once into `multiprocessing.shared_memory`, and every worker
+sorts its slice of that block in place, so no data is pickled.
+
+Inputs smaller than the threshold are sorted serially, as starting the pool
+costs more than it saves.
+
+Time Complexity:
+- O((n / P) log(n / P)) per worker, plus O(n log P) for the merge or the
+  bucketing
+
+Space Complexity:
+- O(n) for the copies sent to the workers or placed in shared memory
+
+Example:
+array = [9, 4, 7, 1, 8, 2, 6, 3], P = 2
+merge:  worker 0 sorts [9, 4, 7, 1] -> [1, 4, 7, 9]
+        worker 1 sorts [8, 2, 6, 3] -> [2, 3, 6, 8]
+        k-way merge -> [1, 2, 3, 4, 6, 7, 8, 9]
+sample: splitter 5 from the sample [7, 2, 4, 8]
+        bucket 0 = [4, 1, 2, 3], bucket 1 = [9, 7, 8, 6]
+        sorted buckets concatenated -> [1, 2, 3, 4, 6, 7, 8, 9]
+"""
+
+import os
+import random
+from array import array as Array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from rithm.sorting.merge import MergeSort, kway_merge
+
+# Typecodes that can be cast to a memoryview and shared between processes
+_SHAREABLE_TYPECODES = "bBhHiIlLqQfd"
+# Sample size per partition used to pick sample sort splitters
+_OVERSAMPLE = 32
+
+
+class ParallelSort(object):
+    def __init__(
+        self,
+        array: list | Array,
+        workers: int | None = None,
+        threshold: int = 100_000,
+    ) -> None:
+        """
+        :param array: The list or `array.array` to sort.
+        :param workers: Number of worker processes, and so of partitions.
+            Defaults to the number of CPUs.
+        :param threshold: Inputs with fewer elements than this are sorted
+            serially without starting a pool.
+        """
+        self.array = array
+        self.workers: int = workers or os.cpu_count() or 1
+        self.threshold: int = threshold
+
+    def sort(self, method: str = "merge", debug: bool = False) -> list | Array:
+        """
+        Sorts the array using a pool of worker processes.
+
+        The sort is stable for lists. The input is left unchanged.
+
+        :param method: "merge" to sort contiguous partitions and k-way merge
+            them, or "sample" to bucket the input around sampled splitters and
+            concatenate the sorted buckets.
+        :param debug: If True, prints debug information.
+
+        :return: A new sorted list, or a new `array.array` with the same
+            typecode for any array input, shared or pickled.
+        """
+        if method not in ("merge", "sample"):
+            raise ValueError(f"Unknown method {method!r}, use 'merge' or 'sample'.")
+
+        n = len(self.array)
+        typecode = self.array.typecode if isinstance(self.array, Array) else None
+        shared = typecode is not None and typecode in _SHAREABLE_TYPECODES
+        if n < max(self.threshold, self.workers) or self.workers == 1:
+            if debug:
+                print(f"Sorting {n} items serially")
+            result = MergeSort(list(self.array)).adaptive_sort()
+            return result if typecode is None else Array(typecode, result)
+
+        bounds = self._bounds(n, self.workers)
+        if debug:
+            print(f"Sorting {n} items with {self.workers} workers using {method}")
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            if shared:
+                if method == "merge":
+                    return self._shared_merge_sort(executor, bounds)
+                return self._shared_sample_sort(executor, bounds)
+
+            # Lists and arrays that cannot be shared, such as unicode arrays,
+            # are pickled to the workers
+            chunks = [self.array[lo:hi] for lo, hi in bounds]
+            if method == "merge":
+                runs = list(executor.map(_sort_chunk, chunks))
+                result = list(kway_merge(*runs))
+            else:
+                splitters = self._splitters(self.workers)
+                partitioned = list(
+                    executor.map(_partition_chunk, chunks, [splitters] * len(chunks))
+                )
+                # Bucket i from every chunk, in chunk order, keeps the sort stable
+                buckets = [
+                    [bucket[i] for bucket in partitioned]
+                    for i in range(len(splitters) + 1)
+                ]
+                result = []
+                for run in executor.map(_sort_buckets, buckets):
+                    result.extend(run)
+        return result if typecode is None else Array(typecode, result)
+
+    def _shared_merge_sort(self, executor: ProcessPoolExecutor, bounds: list) -> Array:
+        typecode = self.array.typecode
+        n = len(self.array)
+        shm = _share(self.array)
+        try:
+            list(
+                executor.map(
+                    _sort_shared,
+                    *zip(*[(shm.name, typecode, n, lo, hi) for lo, hi in bounds]),
+                )
+            )
+            view = _view(shm, typecode, n)
+            try:
+                return Array(typecode, kway_merge(*(view[lo:hi] for lo, hi in bounds)))
+            finally:
+                view.release()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _shared_sample_sort(self, executor: ProcessPoolExecutor, bounds: list) -> Array:
+        typecode = self.array.typecode
+        n = len(self.array)
+        splitters = self._splitters(self.workers)
+        buckets = len(splitters) + 1
+
+        src = _share(self.array)
+        dst = SharedMemory(create=True, size=max(1, n * self.array.itemsize))
+        try:
+            tasks = [(src.name, typecode, n, lo, hi, splitters) for lo, hi in bounds]
+            counts = list(executor.map(_count_buckets, *zip(*tasks)))
+
+            # Prefix sums over (bucket, chunk) give each chunk a slot per bucket
+            offsets = [[0] * buckets for _ in bounds]
+            edges = [0]
+            position = 0
+            for b in range(buckets):
+                for c in range(len(bounds)):
+                    offsets[c][b] = position
+                    position += counts[c][b]
+                edges.append(position)
+
+            list(
+                executor.map(
+                    _scatter_shared,
+                    *zip(
+                        *[
+                            (src.name, dst.name, typecode, n, lo, hi, splitters, offset)
+                            for (lo, hi), offset in zip(bounds, offsets)
+                        ]
+                    ),
+                )
+            )
+            list(
+                executor.map(
+                    _sort_shared,
+                    *zip(
+                        *[
+                            (dst.name, typecode, n, edges[b], edges[b + 1])
+                            for b in range(buckets)
+                        ]
+                    ),
+                )
+            )
+
+            result = Array(typecode)
+            result.frombytes(dst.buf[: n * self.array.itemsize])
+            return result
+        finally:
+            for shm in (src, dst):
+                shm.close()
+                shm.unlink()
+
+    def _splitters(self, partitions: int) -> list:
+        """Picks partitions - 1 evenly spaced splitters from a sorted sample."""
+        n = len(self.array)
+        size = min(n, partitions * _OVERSAMPLE)
+        sample = [self.array[i] for i in random.sample(range(n), size)]
+        MergeSort(sample).adaptive_sort()
+        return [sample[i * size // partitions] for i in range(1, partitions)]
+
+    @staticmethod
+    def _bounds(n: int, partitions: int) -> list:
+        """Splits range(n) into contiguous (lo, hi) partitions of near equal size."""
+        return [
+            (i * n // partitions, (i + 1) * n // partitions) for i in range(partitions)
+        ]
+
+
+def _sort_chunk(chunk: list) -> list:
+    return MergeSort(chunk).adaptive_sort()
+
+
+def _partition_chunk(chunk: list, splitters: list) -> list:
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    for item in chunk:
+        buckets[bisect_right(splitters, item)].append(item)
+    return buckets
+
+
+def _sort_buckets(parts: list) -> list:
+    bucket = [item for part in parts for item in part]
+    return MergeSort(bucket).adaptive_sort()
+
+
+def _share(array: Array) -> SharedMemory:
+    """Copies an array into a new shared memory block."""
+    nbytes = len(array) * array.itemsize
+    shm = SharedMemory(create=True, size=max(1, nbytes))
+    shm.buf[:nbytes] = memoryview(array).cast("B")
+    return shm
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Attaches to a shared memory block created by the parent. Pool workers
+    share the parent's resource tracker, so the block stays registered once
+    and is unlinked by the parent alone.
+    """
+    return SharedMemory(name=name)
+
+
+def _view(shm: SharedMemory, typecode: str, n: int) -> memoryview:
+    return shm.buf[: n * Array(typecode).itemsize].cast(typecode)
+
+
+def _sort_shared(name: str, typecode: str, n: int, lo: int, hi: int) -> None:
+    shm = _attach(name)
+    view = _view(shm, typecode, n)
+    chunk = view[lo:hi]
+    try:
+        # The slice is a view of the shared block, so it is sorted where it
+        # lies: by NumPy when it is installed, otherwise by the typed buffer
+        # path of MergeSort, and never unpacked into a list
+        MergeSort(chunk).adaptive_sort()
+    finally:
+        chunk.release()
+        view.release()
+        shm.close()
+
+
+def _count_buckets(
+    name: str, typecode: str, n: int, lo: int, hi: int, splitters: list
+) -> list:
+    shm = _attach(name)
+    view = _view(shm, typecode, n)
+    try:
+        counts = [0] * (len(splitters) + 1)
+        for item in view[lo:hi]:
+            counts[bisect_right(splitters, item)] += 1
+        return counts
+    finally:
+        view.release()
+        shm.close()
+
+
+def _scatter_shared(
+    src_name: str,
+    dst_name: str,
+    typecode: str,
+    n: int,
+    lo: int,
+    hi: int,
+    splitters: list,
+    offsets: list,
+) -> None:
+    src, dst = _attach(src_name), _attach(dst_name)
+    src_view, dst_view = _view(src, typecode, n), _view(dst, typecode, n)
+    try:
+        offsets = list(offsets)
+        for item in src_view[lo:hi]:
+            b = bisect_right(splitters, item)
+            dst_view[offsets[b]] = item
+            offsets[b] += 1
+    finally:
+        src_view.release()
+        dst_view.release()
+        src.close()
+        dst.close()
+
+
+def _benchmark(n: int = 1_000_000, repeat: int = 3) -> None:
+    """Reports sort throughput as the number of workers grows."""
+    import timeit
+
+    data = [random.randint(0, n) for _ in range(n)]
+    typed = Array("q", data)
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+
+    print(f"n={n}, throughput in million items per second")
+    print(
+        f"{'workers':>8} {'list merge':>12} {'list sample':>12} {'shm merge':>12} {'shm sample':>12}"
+    )
+    for workers in counts:
+        rates = []
+        for values in (data, typed):
+            for method in ("merge", "sample"):
+                sorter = ParallelSort(values, workers=workers, threshold=0)
+                seconds = min(
+                    timeit.repeat(
+                        lambda: sorter.sort(method=method), number=1, repeat=repeat
+                    )
+                )
+                rates.append(n / seconds / 1e6)
+        print(f"{workers:>8} " + " ".join(f"{rate:>12.2f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    # Example usage
+    array = [random.randint(0, 100) for _ in range(20)]
+    print("Input:", array)
+    sorter = ParallelSort(array, workers=2, threshold=0)
+    print("Sorted (merge):", sorter.sort(debug=True))
+    print("Sorted (sample):", sorter.sort(method="sample", debug=True))
+
+    _benchmark()
@@ -54,15 +54,79 @@ so we choose 1 as pivot
 none are less than or equal so 0 operations
 so 1 goes into index 0
 [1, 2, 3, 5, 7] -> sorted
+
+Introsort:
+The recursive inplace sort above always picks the last element as pivot, so
+already sorted or reverse sorted input hits the O(n^2) worst case and recurses
+n levels deep. The introsort engine avoids both problems:
+- The pivot is the median-of-three (or Tukey's ninther for larger slices), so
+  ordered input is split down the middle.
+- Partitioning is three-way (Dutch national flag), so runs of equal keys are
+  grouped around the pivot and never partitioned again.
+- Small slices, 48 elements or fewer by default, are finished with binary
+  insertion sort. The kernel and the cutoff are pluggable and tuned by
+  benchmarking, see `rithm.sorting.small`.
+- An explicit stack replaces recursion. The smaller side is sorted first and
+  the larger side is pushed, so the stack never holds more than O(log n) slices.
+- Once the partition depth exceeds 2 * log2(n) the slice is heapsorted, which
+  bounds the worst case at O(n log n).
+
+Selection:
+Finding the k-th smallest element does not need a full sort. After a partition
+the pivot is in its final position, so only the side that holds index k has to
+be partitioned further (quickselect). This takes O(n) time on average. If the
+partitions keep coming out lopsided, the pivot is instead chosen with the
+median of medians, which always leaves at least 30% of the elements on each
+side and so bounds the worst case at O(n) (introselect). partial_sort,
+nsmallest and nlargest select first and then sort only the k elements they
+return, in O(n + k log k).
+
+Sorting by key:
+With a key function, the slice is decorated once into a key column and an
+index column. The introsort engine sorts the two in lockstep, comparing only
+the keys, and the elements are then gathered back by index.
+
+Typed buffers:
+`array.array`, `bytearray`, `memoryview` and NumPy arrays are partitioned in
+place exactly like lists, one element at a time, so they are never turned into
+a list. Concatenating sublists would box every element, so non_inplace_sort
+instead copies a buffer once into a buffer of the same type and typecode and
+sorts the copy in place with the introsort engine, which peaks at about twice
+the raw size of the data. reverse=True without a key sorts a buffer ascending
+and then reverses it in place, since the sort is not stable anyway.
 """
 
+import heapq
+from typing import Callable
+
+from rithm.backend import use_numpy, vectorized
+from rithm.sorting._buffer import copy, is_buffer, reverse as reverse_range
+from rithm.sorting._keyed import decorate, undecorate
+from rithm.sorting.small import insertion_sort, resolve_base_case
+from rithm.sorting.stats import SortStats
+
+# Slices at or below this size are finished with insertion sort by select and
+# the keyed introsort. intro_sort takes its cutoff from rithm.sorting.small
+_INSERTION_THRESHOLD = 16
+# Slices above this size use Tukey's ninther instead of median-of-three
+_NINTHER_THRESHOLD = 40
+
 
 class QuickSort(object):
     def __init__(self, array: list) -> None:
         self.array: list = array
 
     def inplace_sort(
-        self, low: int, high: int, debug=False, _partition_count=0
+        self,
+        low: int,
+        high: int,
+        debug=False,
+        _partition_count=0,
+        introsort: bool = False,
+        key: Callable | None = None,
+        reverse: bool = False,
+        stats: SortStats | None = None,
+        backend: str | None = None,
     ) -> None:
         """
         This is an inplace sorting method that sorts the array in place.
@@ -73,31 +137,69 @@ class QuickSort(object):
         :param low: The starting index of the array to sort.
         :param high: The ending index of the array to sort.
         :param debug: If True, prints debug information during sorting.
+        :param introsort: If True, sorts with the iterative introsort engine
+            (see `intro_sort`) instead of recursive Lomuto partitioning.
+        :param key: Optional function computing the key to sort each element
+            by. Each key is computed once and cached, and the keys are sorted
+            with the introsort engine.
+        :param reverse: If True, sorts in descending order.
+        :param stats: Optional SortStats that counts comparisons, swaps,
+            recursion depth and partition sizes.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
 
         :return: None
         """
+        if use_numpy(self.array, backend, key, stats, debug):
+            return vectorized.sort(self.array, "quicksort", reverse, low, high)
+        if key is not None or reverse:
+            return self.intro_sort(
+                low,
+                high,
+                debug=debug,
+                key=key,
+                reverse=reverse,
+                stats=stats,
+                backend="python",
+            )
+        stats = SortStats.resolve(stats, debug)
+        if introsort:
+            return self.intro_sort(low, high, stats=stats, backend="python")
+
         if low < high:
-            if debug:
-                print(
-                    f"\nPartition count: {_partition_count}, low: {low}, high: {high}"
-                )
-                print(self.array, f"Sub-array: {self.array[low : high + 1]}")
+            if stats is not None:
+                stats.record_depth(_partition_count)
+                stats.partition_sizes.append(high - low + 1)
 
             # Partition the array and get the pivot index
-            pivot_index = self.partition(low, high, debug=debug)
-            if debug:
-                print(
-                    f"Pivot index: {pivot_index}, Pivot value: {self.array[pivot_index]}"
+            pivot_index = self.partition(low, high, stats=stats)
+            if stats is not None:
+                stats.emit(
+                    "partition",
+                    low=low,
+                    high=high,
+                    pivot_index=pivot_index,
+                    depth=_partition_count,
                 )
             _partition_count += 1
             self.inplace_sort(
-                low, pivot_index - 1, debug=debug, _partition_count=_partition_count
+                low,
+                pivot_index - 1,
+                _partition_count=_partition_count,
+                stats=stats,
+                backend="python",
             )
             self.inplace_sort(
-                pivot_index + 1, high, debug=debug, _partition_count=_partition_count
+                pivot_index + 1,
+                high,
+                _partition_count=_partition_count,
+                stats=stats,
+                backend="python",
             )
 
-    def partition(self, low: int, high: int, debug=False) -> int:
+    def partition(
+        self, low: int, high: int, debug=False, stats: SortStats | None = None
+    ) -> int:
         """
         This is the core method for inplace quick sort.
         It partitions the array into two halves based on the pivot element.
@@ -113,10 +215,15 @@ class QuickSort(object):
 
         :param low: The starting index of the array to partition.
         :param high: The ending index of the array to partition.
-        :param debug: If True, prints debug information during partitioning.
+        :param debug: If True, prints every swap during partitioning.
+        :param stats: Optional SortStats that counts comparisons and swaps.
 
         :return: The index of the pivot element after partitioning.
         """
+        stats = SortStats.resolve(stats, debug)
+        if stats is not None:
+            return self._partition_instrumented(low, high, stats)
+
         # Start with the last element as the pivot and move all elements
         # less than or equal to the pivot to the left of it
         pivot = self.array[high]
@@ -131,29 +238,513 @@ class QuickSort(object):
             # current element
             if self.array[j] <= pivot:
                 i += 1
-                if debug:
-                    print(
-                        f"Element {self.array[j]} at index {j} is less than or equal to pivot {pivot}. "
-                        f"Incrementing index i to {i}."
-                    )
-                    print(
-                        f"Swapping {self.array[i]} and {self.array[j]} at indices {i} and {j}"
-                    )
                 self.array[i], self.array[j] = self.array[j], self.array[i]
 
         # After the loop, swap the pivot element with the first element
         # greater than it to place the pivot in its correct position
-        if debug:
-            print(
-                f"Placing pivot {pivot} at index {i + 1}. Swapping with {self.array[high]} at index {high}."
-            )
         self.array[i + 1], self.array[high] = self.array[high], self.array[i + 1]
         return i + 1
 
+    def _partition_instrumented(self, low: int, high: int, stats: SortStats) -> int:
+        """The loop of `partition`, counting comparisons and swaps into stats."""
+        array = self.array
+        pivot = array[high]
+        i = low - 1
+        for j in range(low, high):
+            stats.comparisons += 1
+            if array[j] <= pivot:
+                i += 1
+                stats.swaps += 1
+                stats.emit("swap", i=i, j=j, values=(array[i], array[j]))
+                array[i], array[j] = array[j], array[i]
+
+        stats.swaps += 1
+        stats.emit("place_pivot", pivot=pivot, index=i + 1)
+        array[i + 1], array[high] = array[high], array[i + 1]
+        return i + 1
+
+    def intro_sort(
+        self,
+        low: int = 0,
+        high: int | None = None,
+        debug: bool = False,
+        key: Callable | None = None,
+        reverse: bool = False,
+        stats: SortStats | None = None,
+        backend: str | None = None,
+        base_case: str | Callable | None = None,
+        cutoff: int | None = None,
+    ) -> None:
+        """
+        Sorts the array in place using an iterative introsort.
+
+        Each slice is split with `three_way_partition` around a median-of-three
+        (or ninther) pivot. The larger side is pushed onto an explicit stack
+        while the smaller side is processed straight away, so the stack depth
+        is O(log n). Slices of at most `cutoff` elements are finished with
+        the base case kernel and slices that exceed the depth limit are
+        heapsorted, giving O(n log n) time in the worst case.
+
+        :param low: The starting index of the array to sort.
+        :param high: The ending index of the array to sort. Defaults to the
+            last index of the array.
+        :param debug: If True, prints debug information during sorting.
+        :param key: Optional function computing the key to sort each element
+            by. Each key is computed once and cached.
+        :param reverse: If True, sorts in descending order.
+        :param stats: Optional SortStats that records the stack depth and the
+            partition sizes.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+        :param base_case: The kernel that sorts small slices: a name from
+            `rithm.sorting.small.KERNELS` or a function called as
+            kernel(array, low, high) that sorts array[low:high] in place.
+            Defaults to the tuned kernel (see `rithm.sorting.small.tuning`).
+            Not used when sorting by key.
+        :param cutoff: Slices of at most this many elements go to the base
+            case. Defaults to the tuned cutoff.
+
+        :return: None
+        """
+        if high is None:
+            high = len(self.array) - 1
+        if high <= low:
+            return
+        if use_numpy(self.array, backend, key, stats, debug):
+            return vectorized.sort(self.array, "quicksort", reverse, low, high)
+        stats = SortStats.resolve(stats, debug)
+
+        if key is None and reverse and is_buffer(self.array):
+            self.intro_sort(
+                low,
+                high,
+                stats=stats,
+                backend="python",
+                base_case=base_case,
+                cutoff=cutoff,
+            )
+            reverse_range(self.array, low, high)
+            return
+        if key is not None or reverse:
+            items = copy(self.array, low, high + 1)
+            keys, order = decorate(items, key, reverse)
+            self._intro_sort_keyed(keys, order, stats, low)
+            self.array[low : high + 1] = undecorate(items, order, reverse)
+            return
+
+        kernel, cutoff = resolve_base_case("quick", base_case, cutoff)
+        array = self.array
+        max_depth = 2 * (high - low + 1).bit_length()
+        stack = [(low, high, max_depth)]
+
+        while stack:
+            if stats is not None:
+                stats.record_depth(len(stack))
+            low, high, depth = stack.pop()
+
+            while high - low >= cutoff:
+                if depth == 0:
+                    if stats is not None:
+                        stats.emit("heapsort", low=low, high=high)
+                    self._heap_sort(low, high)
+                    break
+                depth -= 1
+
+                pivot = self._choose_pivot(low, high)
+                lt, gt = self.three_way_partition(low, high, pivot)
+                if stats is not None:
+                    stats.partition_sizes.append(high - low + 1)
+                    stats.emit(
+                        "partition", low=low, high=high, pivot=pivot, lt=lt, gt=gt
+                    )
+
+                # Push the larger side and keep working on the smaller one
+                if lt - low < high - gt:
+                    stack.append((gt + 1, high, depth))
+                    high = lt - 1
+                else:
+                    stack.append((low, lt - 1, depth))
+                    low = gt + 1
+            else:
+                if stats is not None and low < high:
+                    stats.emit("base_case", low=low, high=high)
+                kernel(array, low, high + 1)
+
+    def _intro_sort_keyed(
+        self,
+        keys: list,
+        order: list,
+        stats: SortStats | None = None,
+        offset: int = 0,
+    ) -> None:
+        """
+        Introsorts the key column, making the same moves in the index column.
+        Mirrors `intro_sort` with median-of-three pivots. Positions are
+        reported to stats shifted by offset, the start of the sorted slice.
+        """
+        n = len(keys)
+        stack = [(0, n - 1, 2 * n.bit_length())]
+
+        while stack:
+            if stats is not None:
+                stats.record_depth(len(stack))
+            low, high, depth = stack.pop()
+
+            while high - low >= _INSERTION_THRESHOLD:
+                if depth == 0:
+                    if stats is not None:
+                        stats.emit("heapsort", low=low + offset, high=high + offset)
+                    self._heap_sort_keyed(keys, order, low, high)
+                    break
+                depth -= 1
+
+                pivot = self._median(keys[low], keys[(low + high) // 2], keys[high])
+                lt = i = low
+                gt = high
+                while i <= gt:
+                    value = keys[i]
+                    if value < pivot:
+                        keys[lt], keys[i] = value, keys[lt]
+                        order[lt], order[i] = order[i], order[lt]
+                        lt += 1
+                        i += 1
+                    elif pivot < value:
+                        keys[i], keys[gt] = keys[gt], value
+                        order[i], order[gt] = order[gt], order[i]
+                        gt -= 1
+                    else:
+                        i += 1
+
+                if stats is not None:
+                    stats.partition_sizes.append(high - low + 1)
+                    stats.emit(
+                        "partition",
+                        low=low + offset,
+                        high=high + offset,
+                        pivot=pivot,
+                        lt=lt + offset,
+                        gt=gt + offset,
+                    )
+
+                if lt - low < high - gt:
+                    stack.append((gt + 1, high, depth))
+                    high = lt - 1
+                else:
+                    stack.append((low, lt - 1, depth))
+                    low = gt + 1
+            else:
+                if stats is not None and low < high:
+                    stats.emit("base_case", low=low + offset, high=high + offset)
+                for i in range(low + 1, high + 1):
+                    value, index = keys[i], order[i]
+                    j = i - 1
+                    while j >= low and value < keys[j]:
+                        keys[j + 1] = keys[j]
+                        order[j + 1] = order[j]
+                        j -= 1
+                    keys[j + 1] = value
+                    order[j + 1] = index
+
+    @staticmethod
+    def _heap_sort_keyed(keys: list, order: list, low: int, high: int) -> None:
+        """Heapsorts a slice of the key column along with the index column."""
+
+        def sift_down(root: int, size: int) -> None:
+            value, index = keys[low + root], order[low + root]
+            while True:
+                child = 2 * root + 1
+                if child >= size:
+                    break
+                if child + 1 < size and keys[low + child] < keys[low + child + 1]:
+                    child += 1
+                if not value < keys[low + child]:
+                    break
+                keys[low + root] = keys[low + child]
+                order[low + root] = order[low + child]
+                root = child
+            keys[low + root] = value
+            order[low + root] = index
+
+        size = high - low + 1
+        for root in range(size // 2 - 1, -1, -1):
+            sift_down(root, size)
+        for end in range(size - 1, 0, -1):
+            keys[low], keys[low + end] = keys[low + end], keys[low]
+            order[low], order[low + end] = order[low + end], order[low]
+            sift_down(0, end)
+
+    def three_way_partition(self, low: int, high: int, pivot=None) -> tuple[int, int]:
+        """
+        Partitions the array into three bands around the pivot value using
+        Dijkstra's Dutch national flag scheme.
+
+        Elements less than the pivot end up in [low, lt), elements equal to the
+        pivot in [lt, gt] and elements greater than the pivot in (gt, high].
+        Grouping the equal keys means duplicate heavy input does not degrade
+        to O(n^2) the way Lomuto partitioning does.
+
+        :param low: The starting index of the array to partition.
+        :param high: The ending index of the array to partition.
+        :param pivot: The pivot value. Defaults to the last element.
+
+        :return: The (lt, gt) bounds of the band equal to the pivot.
+        """
+        array = self.array
+        if pivot is None:
+            pivot = array[high]
+
+        lt = i = low
+        gt = high
+        while i <= gt:
+            value = array[i]
+            if value < pivot:
+                array[lt], array[i] = value, array[lt]
+                lt += 1
+                i += 1
+            elif pivot < value:
+                array[i], array[gt] = array[gt], value
+                gt -= 1
+            else:
+                i += 1
+        return lt, gt
+
+    def _choose_pivot(self, low: int, high: int):
+        """
+        Returns the median-of-three of the first, middle and last elements,
+        or Tukey's ninther (the median of three medians) for larger slices.
+        """
+        array = self.array
+        mid = (low + high) // 2
+        if high - low < _NINTHER_THRESHOLD:
+            return self._median(array[low], array[mid], array[high])
+
+        step = (high - low) // 8
+        return self._median(
+            self._median(array[low], array[low + step], array[low + 2 * step]),
+            self._median(array[mid - step], array[mid], array[mid + step]),
+            self._median(array[high - 2 * step], array[high - step], array[high]),
+        )
+
+    @staticmethod
+    def _median(a, b, c):
+        if a < b:
+            if b < c:
+                return b
+            return c if a < c else a
+        if a < c:
+            return a
+        return c if b < c else b
+
+    def _insertion_sort(self, low: int, high: int) -> None:
+        insertion_sort(self.array, low, high + 1)
+
+    def _heap_sort(self, low: int, high: int) -> None:
+        array = self.array
+        size = high - low + 1
+
+        # Build a max heap over the slice, then repeatedly move the root to
+        # the end of the shrinking heap
+        for root in range(size // 2 - 1, -1, -1):
+            self._sift_down(low, root, size)
+        for end in range(size - 1, 0, -1):
+            array[low], array[low + end] = array[low + end], array[low]
+            self._sift_down(low, 0, end)
+
+    def _sift_down(self, offset: int, root: int, size: int) -> None:
+        array = self.array
+        value = array[offset + root]
+        while True:
+            child = 2 * root + 1
+            if child >= size:
+                break
+            if child + 1 < size and array[offset + child] < array[offset + child + 1]:
+                child += 1
+            if not value < array[offset + child]:
+                break
+            array[offset + root] = array[offset + child]
+            root = child
+        array[offset + root] = value
+
+    def select(
+        self, k: int, low: int = 0, high: int | None = None, backend: str | None = None
+    ):
+        """
+        Finds the k-th smallest element (counting from 0) with introselect.
+
+        The array is rearranged in place so that array[k] holds the element
+        that would be there if the array was sorted, everything before it is
+        less than or equal to it, and everything after it is greater than or
+        equal to it. Pivots come from the median-of-three and the `partition`
+        method. Once the partitions have cost more than 4n comparisons in
+        total, the pivot is chosen with the median of medians and the array is
+        split with `three_way_partition` instead, so duplicate heavy input is
+        handled as well. Expected and worst case time are both O(n).
+
+        :param k: The index of the element to select.
+        :param low: The starting index of the slice to select from.
+        :param high: The ending index of the slice to select from. Defaults to
+            the last index of the array.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+
+        :return: The k-th smallest element, as a Python number for ndarrays.
+        """
+        if use_numpy(self.array, backend):
+            return vectorized.select(self.array, k, low, high)
+
+        array = self.array
+        if high is None:
+            high = len(array) - 1
+        if not low <= k <= high:
+            raise IndexError("k is out of bounds.")
+
+        budget = 4 * (high - low + 1)
+        while low < high:
+            if high - low < _INSERTION_THRESHOLD:
+                self._insertion_sort(low, high)
+                break
+
+            if budget > 0:
+                budget -= high - low + 1
+                pivot_index = self._median_index(low, (low + high) // 2, high)
+                array[pivot_index], array[high] = array[high], array[pivot_index]
+                lt = gt = self.partition(low, high)
+            else:
+                pivot = array[self._median_of_medians(low, high)]
+                lt, gt = self.three_way_partition(low, high, pivot)
+
+            if k < lt:
+                high = lt - 1
+            elif k > gt:
+                low = gt + 1
+            else:
+                break
+        if getattr(array, "dtype", None) is not None:
+            # An ndarray gives a NumPy scalar, the numpy backend a Python number
+            return array[k].item()
+        return array[k]
+
+    def partial_sort(self, k: int, backend: str | None = None) -> list:
+        """
+        Sorts only the first k positions of the array in place. They end up
+        holding the k smallest elements in order, and the rest of the array is
+        left in no particular order. Takes O(n + k log k) time.
+
+        :param k: The number of positions to sort.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+
+        :return: The array.
+        """
+        n = len(self.array)
+        if k >= n:
+            self.intro_sort(backend=backend)
+        elif k > 0:
+            self.select(k - 1, backend=backend)
+            self.intro_sort(0, k - 2, backend=backend)
+        return self.array
+
+    def nsmallest(self, k: int, backend: str | None = None) -> list:
+        """
+        Returns the k smallest elements in ascending order.
+
+        Lists are copied and handled with `partial_sort` in O(n + k log k).
+        Any other iterable is treated as a stream and consumed once while
+        keeping a bounded heap of k elements, in O(n log k) time and O(k)
+        memory, except ndarrays, whose elements are first converted to Python
+        numbers. The array itself is not modified.
+
+        :param k: The number of elements to return.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+
+        :return: A new list of the k smallest elements.
+        """
+        if k <= 0:
+            return []
+        if use_numpy(self.array, backend):
+            return vectorized.smallest(self.array, k)
+        if not isinstance(self.array, list):
+            return heapq.nsmallest(k, _scalars(self.array))
+        copy = QuickSort(self.array[:])
+        return copy.partial_sort(k)[:k]
+
+    def nlargest(self, k: int, backend: str | None = None) -> list:
+        """
+        Returns the k largest elements in descending order.
+
+        Lists are copied, partitioned with `select` and only the k largest
+        elements sorted, in O(n + k log k). Any other iterable is consumed once
+        as a stream with a bounded heap, in O(n log k) time and O(k) memory,
+        ndarrays after converting their elements to Python numbers. The array
+        itself is not modified.
+
+        :param k: The number of elements to return.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+
+        :return: A new list of the k largest elements.
+        """
+        if k <= 0:
+            return []
+        if use_numpy(self.array, backend):
+            return vectorized.largest(self.array, k)
+        if not isinstance(self.array, list):
+            return heapq.nlargest(k, _scalars(self.array))
+
+        n = len(self.array)
+        copy = QuickSort(self.array[:])
+        if k < n:
+            copy.select(n - k)
+        largest = QuickSort(copy.array[max(n - k, 0) :])
+        largest.intro_sort()
+        largest.array.reverse()
+        return largest.array
+
+    def _median_index(self, i: int, j: int, k: int) -> int:
+        """Returns whichever of the indices i, j and k holds the median value."""
+        array = self.array
+        a, b, c = array[i], array[j], array[k]
+        if a < b:
+            if b < c:
+                return j
+            return k if a < c else i
+        if a < c:
+            return i
+        return k if b < c else j
+
+    def _median_of_medians(self, low: int, high: int) -> int:
+        """
+        Returns the index of an approximate median of the slice, found as the
+        median of the medians of groups of five. The medians are gathered at
+        the start of the slice and their median is found with `select`.
+        """
+        array = self.array
+        if high - low < 5:
+            self._insertion_sort(low, high)
+            return (low + high) // 2
+
+        dest = low
+        for start in range(low, high + 1, 5):
+            end = min(start + 4, high)
+            self._insertion_sort(start, end)
+            mid = (start + end) // 2
+            array[dest], array[mid] = array[mid], array[dest]
+            dest += 1
+
+        mid = (low + dest - 1) // 2
+        self.select(mid, low, dest - 1)
+        return mid
+
     def non_inplace_sort(
         self,
         pivot_index: int | None = None,
         debug: bool = False,
+        key: Callable | None = None,
+        reverse: bool = False,
+        stats: SortStats | None = None,
+        backend: str | None = None,
+        _depth: int = 0,
     ) -> list:
         """
         This is a non-inplace sorting method that returns a new sorted list.
@@ -165,9 +756,33 @@ class QuickSort(object):
 
         :param pivot_index: The pivot index to use for sorting.
         :param debug: If True, prints debug information during sorting.
-
-        :return: A new sorted list.
+        :param key: Optional function computing the key to sort each element
+            by. Each key is computed once and cached, and the keys are sorted
+            with the introsort engine.
+        :param reverse: If True, sorts in descending order.
+        :param stats: Optional SortStats that counts the lists allocated, the
+            recursion depth and the partition sizes.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+
+        :return: A new sorted list. A typed buffer gives a sorted copy of the
+            same type instead.
         """
+        if use_numpy(self.array, backend, key, stats, debug):
+            return vectorized.sorted_copy(self.array, "quicksort", reverse)
+        if key is None and is_buffer(self.array):
+            # One copy of the same type, sorted in place, instead of sublists
+            stats = SortStats.resolve(stats, debug)
+            if stats is not None:
+                stats.allocations += 1
+            result = copy(self.array)
+            QuickSort(result).intro_sort(reverse=reverse, stats=stats, backend="python")
+            return result
+        if key is not None or reverse:
+            keys, order = decorate(self.array, key, reverse)
+            self._intro_sort_keyed(keys, order)
+            return undecorate(self.array, order, reverse)
+
         # Early exit
         # If the array is empty, return an empty list
         if not self.array:
@@ -184,21 +799,35 @@ class QuickSort(object):
         if pivot_index < 0 or pivot_index >= len(self.array):
             raise ValueError("Pivot index is out of bounds.")
 
+        stats = SortStats.resolve(stats, debug)
         pivot = self.array[pivot_index]
         rest = self.array[:pivot_index] + self.array[pivot_index + 1 :]
         _low = [x for x in rest if x <= pivot]
         _high = [x for x in rest if x > pivot]
 
-        if debug:
-            print(_low, [pivot], _high)
+        if stats is not None:
+            # The slices, their concatenation, both halves and the result
+            stats.allocations += 6
+            stats.comparisons += 2 * len(rest)
+            stats.record_depth(_depth)
+            stats.partition_sizes.append(len(self.array))
+            stats.emit("partition", low=_low, pivot=pivot, high=_high, depth=_depth)
 
         return (
-            QuickSort(_low).non_inplace_sort(debug=debug)
+            QuickSort(_low).non_inplace_sort(stats=stats, _depth=_depth + 1)
             + [pivot]
-            + QuickSort(_high).non_inplace_sort(debug=debug)
+            + QuickSort(_high).non_inplace_sort(stats=stats, _depth=_depth + 1)
         )
 
 
+def _scalars(array):
+    """
+    Returns the array, or for an ndarray a list of its elements as Python
+    numbers, as the numpy backend returns them.
+    """
+    return array.tolist() if hasattr(array, "dtype") else array
+
+
 if __name__ == "__main__":
     array = [3, 6, 8, 10, 1, 2, 1]
     quick_sort = QuickSort(array)
@@ -207,3 +836,9 @@ if __name__ == "__main__":
     # For inplace sorting, you can use:
     # quick_sort.inplace_sort(0, len(array) - 1, debug=True)
     # print("Sorted array (inplace):", quick_sort.array)
+    # Sorted or reverse sorted input is best handled by the introsort engine:
+    # quick_sort.inplace_sort(0, len(array) - 1, introsort=True)
+
+    # Select the median and the smallest elements without a full sort:
+    print("Median:", QuickSort(array[:]).select(len(array) // 2))
+    print("Three smallest:", QuickSort(array).nsmallest(3))
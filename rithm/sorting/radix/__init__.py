@@ -0,0 +1,3 @@
+from .radix import RadixSort
+
+__all__ = ["RadixSort"]
@@ -0,0 +1,235 @@
+"""
+This module implements non-comparison sorts for integers: LSD radix sort and
+counting sort.
+
+Comparison sorts need O(n log n) comparisons. Integer keys can instead be
+sorted by looking at their digits, which takes time linear in n.
+
+Counting sort counts how many times each key occurs, then writes each key back
+out as many times as it was counted. It takes O(n + k) time for a key range of
+size k, so it suits keys from a small range.
+
+LSD (least significant digit) radix sort makes one stable counting pass per
+digit, starting from the lowest. For every pass, the counts per digit are
+turned into bucket offsets with a prefix sum, and the elements are scattered
+into a scratch buffer at those offsets. After the pass for digit d the
+elements are sorted by their lowest d digits, and because each pass is stable
+the order from earlier passes is kept for equal digits. The array and one
+scratch buffer swap roles after every pass. With b-bit digits and w-bit keys
+it takes O((w / b) * (n + 2^b)) time.
+
+Negative numbers are handled by subtracting the minimum from every key first,
+which also cuts the number of passes when the keys are large but close
+together.
+
+Time Complexity:
+- Counting sort: O(n + k) for a key range of size k
+- Radix sort: O(p * (n + 2^b)) for p passes of b-bit digits
+
+Space Complexity:
+- Counting sort: O(k) for the counts
+- Radix sort: O(n + 2^b) for the scratch buffer and the counts
+
+Example (radix sort with 1 decimal digit per pass):
+array = [170, 45, 75, 90, 2, 802, 24, 66]
+ones:     [170, 90, 2, 802, 24, 45, 75, 66]
+tens:     [2, 802, 24, 45, 66, 170, 75, 90]
+hundreds: [2, 24, 45, 66, 75, 90, 170, 802] -> sorted
+"""
+
+from array import array as Array
+from typing import Iterable, MutableSequence, Sequence
+
+from rithm._optional import numpy
+from rithm.backend import is_vectorizable, use_numpy, vectorized
+from rithm.sorting._buffer import scratch
+
+
+class RadixSort(object):
+    def __init__(self, array: MutableSequence[int]) -> None:
+        """
+        :param array: A list, integer `array.array` or integer NumPy array.
+        """
+        self.array = array
+
+    def sort(
+        self, digit_bits: int = 8, debug: bool = False, backend: str | None = None
+    ) -> MutableSequence[int]:
+        """
+        Sorts the array in place, choosing counting sort or radix sort by
+        comparing their cost for the range of the keys.
+
+        Counting sort costs about 2n + k steps for a key range of size k,
+        radix sort about p * (2n + 2^b) for p passes of b-bit digits, so
+        counting sort is picked when the keys span a small enough range.
+
+        :param digit_bits: The digit width for radix sort, in bits.
+        :param debug: If True, prints debug information.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`). NumPy's stable sort is itself a radix sort
+            for integers of up to 16 bits, and Timsort for wider ones.
+
+        :return: The sorted array.
+        """
+        n = len(self.array)
+        if n < 2:
+            return self.array
+        if use_numpy(self.array, backend, debug=debug):
+            if not is_vectorizable(self.array):
+                self._key_range()
+            elif numpy().asarray(self.array).dtype.kind not in "iub":
+                raise TypeError("Radix and counting sort only support integer keys.")
+            vectorized.sort(self.array, "stable")
+            return self.array
+
+        lo, hi = self._key_range()
+        span = hi - lo + 1
+        passes = -(-(hi - lo).bit_length() // digit_bits)
+        counting_cost = 2 * n + span
+        radix_cost = passes * (2 * n + (1 << digit_bits))
+
+        if debug:
+            print(
+                f"Key range {lo}..{hi}: counting sort cost {counting_cost}, "
+                f"radix sort cost {radix_cost} ({passes} passes)"
+            )
+        if counting_cost <= radix_cost:
+            return self.counting_sort(debug=debug)
+        return self.radix_sort(digit_bits=digit_bits, debug=debug)
+
+    def counting_sort(self, debug: bool = False) -> MutableSequence[int]:
+        """
+        Sorts the array in place with counting sort, which is best when the
+        keys come from a small range. Lists holding subclasses of int, such
+        as bools or IntEnum members, are radix sorted instead, which keeps the
+        elements themselves.
+
+        :param debug: If True, prints debug information.
+
+        :return: The sorted array.
+        """
+        array = self.array
+        if len(array) < 2:
+            return array
+
+        lo, hi = self._key_range()
+        if not _plain_ints(array):
+            # Counting sort writes back new ints, which would turn bool or
+            # IntEnum keys into plain ints, while radix sort moves the keys
+            return self.radix_sort(debug=debug)
+
+        counts = [0] * (hi - lo + 1)
+        for value in _ints(array):
+            counts[value - lo] += 1
+        if debug:
+            print(f"Counted {len(array)} keys in the range {lo}..{hi}")
+
+        i = 0
+        for offset, count in enumerate(counts):
+            value = lo + offset
+            for _ in range(count):
+                array[i] = value
+                i += 1
+        return array
+
+    def radix_sort(
+        self, digit_bits: int = 8, debug: bool = False
+    ) -> MutableSequence[int]:
+        """
+        Sorts the array in place with an LSD radix sort, making one stable
+        counting pass per digit between the array and one scratch buffer.
+
+        :param digit_bits: The digit width in bits. Wider digits mean fewer
+            passes but more buckets per pass.
+        :param debug: If True, prints debug information.
+
+        :return: The sorted array.
+        """
+        if digit_bits < 1:
+            raise ValueError("digit_bits must be at least 1.")
+
+        array = self.array
+        n = len(array)
+        if n < 2:
+            return array
+
+        lo, hi = self._key_range()
+        radix = 1 << digit_bits
+        mask = radix - 1
+        src, dst = array, scratch(array)
+
+        shift = 0
+        while (hi - lo) >> shift:
+            counts = [0] * radix
+            for value in _ints(src):
+                counts[((value - lo) >> shift) & mask] += 1
+
+            # All keys share this digit, so the pass would not move anything
+            if max(counts) == n:
+                shift += digit_bits
+                continue
+
+            # Turn the counts into the offset each bucket starts at
+            total = 0
+            for digit in range(radix):
+                counts[digit], total = total, total + counts[digit]
+
+            for value in _ints(src):
+                digit = ((value - lo) >> shift) & mask
+                dst[counts[digit]] = value
+                counts[digit] += 1
+
+            if debug:
+                print(f"Pass on bits {shift}..{shift + digit_bits - 1}:", list(dst))
+            src, dst = dst, src
+            shift += digit_bits
+
+        # After an odd number of passes the result is in the scratch buffer
+        if src is not array:
+            array[:] = src
+        return array
+
+    def _key_range(self) -> tuple[int, int]:
+        """
+        Returns the smallest and largest key, checking that every key is an
+        integer before any of them is counted or moved.
+        """
+        array = self.array
+        if isinstance(array, Array) and array.typecode in "fdu":
+            raise TypeError("Radix and counting sort only support integer keys.")
+        dtype = getattr(array, "dtype", None)
+        if dtype is not None and dtype.kind not in "iub":
+            raise TypeError("Radix and counting sort only support integer keys.")
+        if dtype is None and not isinstance(array, Array):
+            # Checking the types once each is cheaper than checking every key
+            if not all(issubclass(kind, int) for kind in set(map(type, array))):
+                raise TypeError("Radix and counting sort only support integer keys.")
+
+        return int(min(array)), int(max(array))
+
+
+def _ints(values: Sequence[int]) -> Iterable[int]:
+    """
+    Iterates over the values as Python ints. The elements of an ndarray are
+    NumPy scalars, whose fixed width arithmetic would overflow or wrap around
+    in value - lo and the shifts, so they are converted one at a time.
+    """
+    return values if getattr(values, "dtype", None) is None else map(int, values)
+
+
+def _plain_ints(values: Sequence[int]) -> bool:
+    """Checks that the values hold nothing but ints, and no subclasses of int."""
+    if isinstance(values, (Array, bytearray, memoryview)) or hasattr(values, "dtype"):
+        return True
+    return all(type(value) is int for value in values)
+
+
+if __name__ == "__main__":
+    # Example usage
+    array = [170, 45, 75, 90, -2, 802, 24, 66]
+    RadixSort(array).radix_sort(digit_bits=4, debug=True)
+    print("Sorted array (radix):", array)
+
+    ids = Array("q", [5, 3, 9, 3, 1, 7, 5])
+    RadixSort(ids).sort(debug=True)
+    print("Sorted array (auto):", ids.tolist())
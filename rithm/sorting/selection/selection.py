@@ -26,52 +26,131 @@ found 11, swap to front
 [4, 11, 12, 22, 25, 64]
 When rest is sorted then it continues to loop over and min index won't change
 so nothing gets swapped.
+
+Double-ended selection:
+sort finds the minimum and the maximum of the unsorted middle in the same pass
+and swaps them to its two ends, so the middle shrinks from both sides and
+n / 2 passes are enough instead of n.
+[64, 25, 12, 22, 11, 4]
+min 4, max 64 -> [4, 25, 12, 22, 11, 64]
+min 11, max 25 -> [4, 11, 12, 22, 25, 64]
+min 12, max 22 -> sorted
+The kernel lives in `rithm.sorting.small`, where QuickSort can use it as the
+base case for small slices.
 """
 
+from typing import Callable
+
+from rithm.backend import use_numpy, vectorized
+from rithm.sorting._keyed import decorate, undecorate
+from rithm.sorting.small import double_selection_sort
+from rithm.sorting.stats import SortStats
+
 
 class SelectionSort(object):
     def __init__(self, array: list) -> None:
         self.array: list = array
 
-    def sort(self, dubug: bool = False) -> list:
+    def sort(
+        self,
+        dubug: bool = False,
+        key: Callable | None = None,
+        reverse: bool = False,
+        stats: SortStats | None = None,
+        backend: str | None = None,
+    ) -> list:
         """
         Sorts the array using the selection sort algorithm.
 
         Selection sort is an in-place comparison sorting algorithm. It divides
         the input list into two parts: a sorted and an unsorted part. The
-        sorted part is built up from left to right, and the unsorted part is
-        reduced by selecting the smallest (or largest) element from the
-        unsorted part and moving it to the end of the sorted part.
+        sorted part is built up from both ends, and the unsorted part is
+        reduced by selecting its smallest and largest elements in one pass and
+        moving them to its two ends.
+
+        :param dubug: If True, prints every new minimum and swap.
+        :param key: Optional function computing the key to sort each element
+            by. Each key is computed once and cached.
+        :param reverse: If True, sorts in descending order.
+        :param stats: Optional SortStats that counts comparisons and swaps.
+            Not used when sorting by key.
+        :param backend: "auto", "python" or "numpy", or None for the default
+            (see `rithm.backend`).
+
+        :return: The sorted array.
         """
-        n = len(self.array)
+        if use_numpy(self.array, backend, key, stats, dubug):
+            vectorized.sort(self.array, "quicksort", reverse)
+            return self.array
+        if key is not None or reverse:
+            keys, order = decorate(self.array, key, reverse)
+            self._sort_keyed(keys, order)
+            self.array[:] = undecorate(self.array, order, reverse)
+            return self.array
+
+        stats = SortStats.resolve(stats, dubug)
+        if stats is not None:
+            return self._sort_instrumented(stats)
 
-        # Loop through the array
+        double_selection_sort(self.array)
+        return self.array
+
+    def _sort_instrumented(self, stats: SortStats) -> list:
+        """
+        The passes of `double_selection_sort`, counting comparisons and swaps
+        into stats.
+        """
+        array = self.array
+        lo, hi = 0, len(array) - 1
+        while lo < hi:
+            min_index = max_index = lo
+            for j in range(lo + 1, hi + 1):
+                stats.comparisons += 1
+                if array[j] < array[min_index]:
+                    stats.emit("new_min", index=j, value=array[j], previous=min_index)
+                    min_index = j
+                else:
+                    stats.comparisons += 1
+                    if array[max_index] < array[j]:
+                        stats.emit(
+                            "new_max", index=j, value=array[j], previous=max_index
+                        )
+                        max_index = j
+
+            if min_index != lo:
+                stats.swaps += 1
+                stats.emit(
+                    "swap", i=lo, j=min_index, values=(array[lo], array[min_index])
+                )
+                array[lo], array[min_index] = array[min_index], array[lo]
+                # If the maximum was at lo, the swap moved it to min_index
+                if max_index == lo:
+                    max_index = min_index
+            if max_index != hi:
+                stats.swaps += 1
+                stats.emit(
+                    "swap", i=hi, j=max_index, values=(array[hi], array[max_index])
+                )
+                array[hi], array[max_index] = array[max_index], array[hi]
+            lo += 1
+            hi -= 1
+        return array
+
+    @staticmethod
+    def _sort_keyed(keys: list, order: list) -> None:
+        """
+        Selection sorts the key column, making the same swaps in the index
+        column.
+        """
+        n = len(keys)
         for i in range(n):
-            # Set the minimum index to the current index
             min_index = i
-            # Loop through the unsorted part of the array
             for j in range(i + 1, n):
-                # If the current element is smaller than the current minimum,
-                # update the minimum index. Therefore moving the smallest
-                # element to the front of the unsorted part.
-                if self.array[j] < self.array[min_index]:
-                    if dubug:
-                        print(
-                            f"Found new minimum {self.array[j]} at index {j}, "
-                            f"previous minimum was {self.array[min_index]} at index {min_index}"
-                        )
+                if keys[j] < keys[min_index]:
                     min_index = j
             if min_index != i:
-                if dubug:
-                    print(self.array)
-                    print(
-                        f"Swapping {self.array[i]} at index {i} with {self.array[min_index]} at index {min_index}"
-                    )
-                self.array[i], self.array[min_index] = (
-                    self.array[min_index],
-                    self.array[i],
-                )
-        return self.array
+                keys[i], keys[min_index] = keys[min_index], keys[i]
+                order[i], order[min_index] = order[min_index], order[i]
 
 
 if __name__ == "__main__":
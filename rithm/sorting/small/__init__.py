@@ -0,0 +1,23 @@
+from .small import (
+    KERNELS,
+    STABLE,
+    binary_insertion_sort,
+    cocktail_sort,
+    double_selection_sort,
+    insertion_sort,
+)
+from .tuning import SORTERS, get_base_case, resolve_base_case, set_base_case, tune
+
+__all__ = [
+    "KERNELS",
+    "SORTERS",
+    "STABLE",
+    "binary_insertion_sort",
+    "cocktail_sort",
+    "double_selection_sort",
+    "get_base_case",
+    "insertion_sort",
+    "resolve_base_case",
+    "set_base_case",
+    "tune",
+]
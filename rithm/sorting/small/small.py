@@ -0,0 +1,204 @@
+"""
+This module implements sorting kernels for small slices.
+
+Divide-and-conquer sorters spend most of their calls on tiny slices, where the
+bookkeeping of another partition or merge costs more than the work itself.
+Below a cutoff they hand the slice to one of these quadratic kernels instead,
+which have no setup cost and touch only a few neighbouring elements. Every
+kernel sorts array[low:high] in place, works on lists and typed buffers alike,
+and keeps the array, its bounds and the values it is carrying in local
+variables, so the inner loops do no attribute lookups and read each element
+only once.
+
+Insertion sort:
+Each element is moved left past the larger elements before it. Best on small
+or nearly sorted slices, as sorted input costs a single comparison per element.
+
+Binary insertion sort:
+The insertion point is found with a binary search, and everything after it is
+shifted in one slice assignment, a single memmove, rather than one element at
+a time. This needs O(n log n) comparisons instead of O(n^2), which pays off when
+comparisons are expensive, e.g. for strings or tuples.
+
+Cocktail shaker sort:
+Bubble sort passes alternately left to right, carrying the largest element up,
+and right to left, carrying the smallest element down. The position of the
+last swap of a pass bounds the next pass, since everything beyond it is
+already in place, so sorted input takes one pass and a few elements out of
+place take a few short ones. Small elements near the end, which plain bubble
+sort moves only one step per pass, go down in a single backward pass.
+
+[3, 1, 2, 5, 4]
+forward:  [1, 2, 3, 4, 5], last swap at 3 -> only [0:4] can be unsorted
+backward: no swaps -> sorted
+
+Double-ended selection sort:
+Each pass finds both the minimum and the maximum of the unsorted middle and
+swaps them to its two ends, so n / 2 passes are enough instead of n. It makes
+at most n swaps, which suits arrays where moving an element is expensive.
+
+Stability:
+Insertion, binary insertion and cocktail shaker sort never move an element
+past an equal one, so they are stable and can be the base case of a merge
+sort. Selection sort swaps elements over long distances and is not stable.
+"""
+
+from bisect import bisect_right
+from typing import Callable, MutableSequence
+
+
+def insertion_sort(
+    array: MutableSequence, low: int = 0, high: int | None = None
+) -> None:
+    """
+    Sorts array[low:high] in place with insertion sort. Stable.
+
+    :param array: The list or buffer to sort.
+    :param low: The first index of the slice.
+    :param high: The index to stop before. Defaults to the array's length.
+
+    :return: None
+    """
+    if high is None:
+        high = len(array)
+    for i in range(low + 1, high):
+        value = array[i]
+        j = i - 1
+        while j >= low and value < array[j]:
+            array[j + 1] = array[j]
+            j -= 1
+        array[j + 1] = value
+
+
+def binary_insertion_sort(
+    array: MutableSequence, low: int = 0, high: int | None = None, start: int = 0
+) -> None:
+    """
+    Sorts array[low:high] in place with binary insertion sort. Stable.
+
+    :param array: The list or buffer to sort.
+    :param low: The first index of the slice.
+    :param high: The index to stop before. Defaults to the array's length.
+    :param start: array[low:start] is known to be sorted already, so
+        insertion starts at start.
+
+    :return: None
+    """
+    if high is None:
+        high = len(array)
+    bisect = bisect_right
+    for i in range(max(start, low + 1), high):
+        value = array[i]
+        # Inserting after any equal elements keeps the sort stable
+        pos = bisect(array, value, low, i)
+        if pos != i:
+            array[pos + 1 : i + 1] = array[pos:i]
+            array[pos] = value
+
+
+def cocktail_sort(
+    array: MutableSequence, low: int = 0, high: int | None = None
+) -> None:
+    """
+    Sorts array[low:high] in place with cocktail shaker sort, bounding every
+    pass by the last swap of the pass before. Stable.
+
+    :param array: The list or buffer to sort.
+    :param low: The first index of the slice.
+    :param high: The index to stop before. Defaults to the array's length.
+
+    :return: None
+    """
+    if high is None:
+        high = len(array)
+    # array[lo:hi + 1] is the part that may still be unsorted
+    lo, hi = low, high - 1
+    while lo < hi:
+        # Carry the largest element up, swapping only on strict inversions
+        last = lo
+        carried = array[lo]
+        for j in range(lo + 1, hi + 1):
+            value = array[j]
+            if value < carried:
+                array[j - 1] = value
+                array[j] = carried
+                last = j - 1
+            else:
+                carried = value
+        hi = last
+        if lo >= hi:
+            break
+
+        # Carry the smallest element down
+        last = hi
+        carried = array[hi]
+        for j in range(hi - 1, lo - 1, -1):
+            value = array[j]
+            if carried < value:
+                array[j + 1] = value
+                array[j] = carried
+                last = j + 1
+            else:
+                carried = value
+        lo = last
+
+
+def double_selection_sort(
+    array: MutableSequence, low: int = 0, high: int | None = None
+) -> None:
+    """
+    Sorts array[low:high] in place with a selection sort that places both the
+    minimum and the maximum on every pass. Not stable.
+
+    :param array: The list or buffer to sort.
+    :param low: The first index of the slice.
+    :param high: The index to stop before. Defaults to the array's length.
+
+    :return: None
+    """
+    if high is None:
+        high = len(array)
+    lo, hi = low, high - 1
+    while lo < hi:
+        smallest = largest = array[lo]
+        i_small = i_large = lo
+        for j in range(lo + 1, hi + 1):
+            value = array[j]
+            # The minimum is never above the maximum, so one test is enough
+            if value < smallest:
+                smallest, i_small = value, j
+            elif largest < value:
+                largest, i_large = value, j
+
+        array[i_small] = array[lo]
+        array[lo] = smallest
+        # If the maximum was at lo, the swap above moved it to i_small
+        if i_large == lo:
+            i_large = i_small
+        array[i_large] = array[hi]
+        array[hi] = largest
+        lo += 1
+        hi -= 1
+
+
+KERNELS: dict[str, Callable] = {
+    "insertion": insertion_sort,
+    "binary_insertion": binary_insertion_sort,
+    "cocktail": cocktail_sort,
+    "double_selection": double_selection_sort,
+}
+# The kernels that keep equal elements in order
+STABLE = ("insertion", "binary_insertion", "cocktail")
+
+
+if __name__ == "__main__":
+    # Example usage
+    for name, kernel in KERNELS.items():
+        array = [5, 2, 9, 1, 5, 6, 3]
+        kernel(array)
+        print(f"{name}:", array)  # [1, 2, 3, 5, 5, 6, 9]
+
+    # Only a slice of the array is sorted
+    array = [9, 8, 7, 3, 1, 2, 0]
+    cocktail_sort(array, 3, 6)
+    print("cocktail [3:6]:", array)  # [9, 8, 7, 1, 2, 3, 0]
@@ -0,0 +1,3 @@
+from .stats import SortStats
+
+__all__ = ["SortStats"]
@@ -0,0 +1,93 @@
+"""
+This module implements instrumentation for the sorters.
+
+A SortStats object is passed to a sort method with stats=... and collects
+counters while the sort runs:
+- comparisons: element comparisons made by the inner loops
+- swaps: element swaps
+- allocations: lists or buffers allocated while sorting
+- max_depth: deepest recursion level, or the largest explicit stack for the
+  iterative engines
+- partition_sizes: sizes of the slices that were partitioned or merged
+
+Not every sorter fills every counter: the introsort and Timsort engines
+record their stack depth and partition or merge sizes but leave the element
+comparisons, which happen in insertion sort, heapsort and galloping, uncounted.
+
+An optional callback is also told about notable events, such as a swap or a
+finished partition, as callback(event, data) with data a dict.
+
+The sorters check for stats once per call and then run either their plain
+loop or an instrumented copy of it, so sorting without stats costs nothing
+extra per iteration. debug=True is a shortcut for stats that print every event.
+
+Example:
+stats = SortStats()
+BubbleSort([3, 1, 2]).sort(stats=stats)
+stats.as_dict()
+{'comparisons': 3, 'swaps': 2, 'allocations': 0, 'max_depth': 0, ...}
+"""
+
+from typing import Callable
+
+
+class SortStats(object):
+    def __init__(self, callback: Callable[[str, dict], None] | None = None) -> None:
+        """
+        :param callback: Optional function called as callback(event, data)
+            for every event the sorters emit.
+        """
+        self.callback = callback
+        self.reset()
+
+    def reset(self) -> None:
+        """Sets all counters back to zero."""
+        self.comparisons: int = 0
+        self.swaps: int = 0
+        self.allocations: int = 0
+        self.max_depth: int = 0
+        self.partition_sizes: list = []
+
+    def emit(self, event: str, **data) -> None:
+        """
+        Passes an event to the callback, if there is one.
+
+        :param event: The name of the event.
+        :param data: Details of the event.
+        """
+        if self.callback is not None:
+            self.callback(event, data)
+
+    def record_depth(self, depth: int) -> None:
+        """Records a recursion or stack depth, keeping the maximum."""
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def as_dict(self) -> dict:
+        """
+        Exports the counters, e.g. for a metrics pipeline.
+
+        :return: A dict of the counters.
+        """
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "allocations": self.allocations,
+            "max_depth": self.max_depth,
+            "partitions": len(self.partition_sizes),
+            "partition_sizes": list(self.partition_sizes),
+        }
+
+    @classmethod
+    def resolve(cls, stats: "SortStats | None", debug: bool) -> "SortStats | None":
+        """
+        Returns the stats a sort call should use: the given stats, or stats
+        that print every event when debug is set and none were given.
+        """
+        if stats is None and debug:
+            return cls(callback=_print_event)
+        return stats
+
+
+def _print_event(event: str, data: dict) -> None:
+    print(f"{event}: " + ", ".join(f"{name}={value}" for name, value in data.items()))
@@ -0,0 +1,149 @@
+import asyncio
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from rithm.searching.binary import BinarySearch
+from rithm.sorting.aio import asort
+
+
+class Record(object):
+    """Defines only __lt__, so equal keys expose the order of the tags."""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def _values(n, seed=0):
+    rng = random.Random(seed)
+    return [rng.randrange(n or 1) for _ in range(n)]
+
+
+def _records(n, seed=0):
+    rng = random.Random(seed)
+    return [Record(rng.randrange(4), i) for i in range(n)]
+
+
+def _tags(records):
+    return [(r.key, r.tag) for r in records]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 1000, 5000])
+def test_asort_orders_in_place(n):
+    data = _values(n, n)
+    array = data[:]
+    assert asyncio.run(asort(array, slice_seconds=0)) is array
+    assert array == sorted(data)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize(
+    "key", [None, lambda r: r.key, lambda r: r], ids=["none", "int", "record"]
+)
+def test_asort_is_stable(reverse, key):
+    records = _records(3000)
+    array = records[:]
+    asyncio.run(asort(array, key=key, reverse=reverse, slice_seconds=0))
+    expected = sorted(records, key=lambda r: r.key, reverse=reverse)
+    assert _tags(array) == _tags(expected)
+
+
+def test_asort_key_and_reverse():
+    words = ["pear", "fig", "banana", "kiwi", "apple", "date"]
+    array = words[:]
+    asyncio.run(asort(array, key=len, reverse=True))
+    assert array == sorted(words, key=len, reverse=True)
+
+
+def test_asort_yields_to_other_tasks_and_reports_progress():
+    data = _values(20000)
+    calls = []
+    ticks = []
+
+    async def main():
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asort(array, slice_seconds=0, progress=lambda *p: calls.append(p))
+        task.cancel()
+
+    array = data[:]
+    asyncio.run(main())
+    assert array == sorted(data)
+    assert len(ticks) > 1
+    total = calls[-1][1]
+    assert calls[-1] == (total, total) and total == 20000 * 15
+    assert [done for done, _ in calls] == sorted(done for done, _ in calls)
+
+
+def test_cancelled_asort_keeps_every_element():
+    data = _values(20000, 1)
+    array = data[:]
+
+    async def main():
+        task = asyncio.create_task(asort(array, slice_seconds=0))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert array != sorted(data)
+    assert sorted(array) == sorted(data)
+
+
+@pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_asort_in_executor(executor_type):
+    data = _values(2000, 2)
+    array = data[:]
+    calls = []
+
+    async def main():
+        with executor_type(max_workers=1) as executor:
+            return await asort(
+                array,
+                reverse=True,
+                executor=executor,
+                progress=lambda *p: calls.append(p),
+            )
+
+    assert asyncio.run(main()) is array
+    assert array == sorted(data, reverse=True)
+    assert calls == [(0, 2000), (2000, 2000)]
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 10_000])
+def test_asearch_many_in_batches(batch_size):
+    searcher = BinarySearch(list(range(0, 100, 2)), assume_sorted=True)
+    targets = list(range(-1, 101))
+    calls = []
+    result = asyncio.run(
+        searcher.asearch_many(
+            iter(targets),
+            missing=-1,
+            batch_size=batch_size,
+            progress=lambda *p: calls.append(p),
+        )
+    )
+    assert result == searcher.search_many(targets, missing=-1)
+    assert calls[-1] == (len(targets), len(targets))
+    assert len(calls) == -(-len(targets) // batch_size)
+
+
+def test_asearch_many_in_executor():
+    searcher = BinarySearch([1, 3, 3, 7], assume_sorted=True)
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await searcher.asearch_many([7, 5, 3], executor=executor)
+
+    assert asyncio.run(main()) == [3, None, 1]
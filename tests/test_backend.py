@@ -0,0 +1,117 @@
+import random
+from array import array as Array
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rithm.backend import vectorized
+from rithm.sorting.merge import MergeSort
+from rithm.sorting.quick import QuickSort
+
+BIG = 2**53 + 1
+
+
+def _sort(data, method, backend):
+    array = list(data)
+    sorter = MergeSort(array) if method == "merge" else QuickSort(array)
+    if method == "merge":
+        result = sorter.sort(backend=backend)
+    elif method == "adaptive":
+        result = MergeSort(array).adaptive_sort(backend=backend)
+    else:
+        result = sorter.intro_sort(backend=backend)
+    return array if result is None else result
+
+
+LOSSY = [
+    [BIG, float(2**53), BIG],
+    [BIG, 2**53, float(2**53), 1.5, -BIG],
+    [2**64, 1, -1],
+    ["b", "a", "c", "a"],
+    [(2, 1), (1, 2), (1, 1)],
+]
+
+
+@pytest.mark.parametrize("data", LOSSY)
+@pytest.mark.parametrize("method", ["merge", "adaptive", "intro"])
+def test_lossy_lists_sort_like_python(data, method):
+    expected = _sort(data, method, "python")
+    result = _sort(data, method, "numpy")
+    assert result == expected == sorted(data)
+    assert [type(v) for v in result] == [type(v) for v in expected]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_lossy_sort_keeps_equal_elements_in_order(reverse):
+    data = [float(2**53 + 2), BIG, 2**53 + 2, BIG, 2**53 + 2.0]
+    result = MergeSort(data[:]).sort(reverse=reverse, backend="numpy")
+    expected = sorted(data, reverse=reverse)
+    assert [(v, type(v)) for v in result] == [(v, type(v)) for v in expected]
+
+
+@pytest.mark.parametrize("data", LOSSY[:3])
+def test_lossy_select_and_top_k(data):
+    n = len(data)
+    for k in range(n):
+        assert QuickSort(data[:]).select(k, backend="numpy") == sorted(data)[k]
+    for k in range(1, n + 1):
+        assert QuickSort(data).nsmallest(k, backend="numpy") == sorted(data)[:k]
+        largest = QuickSort(data).nlargest(k, backend="numpy")
+        assert largest == sorted(data, reverse=True)[:k]
+
+
+def test_lossless():
+    assert vectorized.lossless([1, 2, 3]).dtype.kind == "i"
+    assert vectorized.lossless([1, 2.5]).dtype.kind == "f"
+    assert vectorized.lossless([BIG, 1.0]) is None
+    assert vectorized.lossless(["a"]) is None
+    assert vectorized.lossless([[1], [2]]) is None
+    assert vectorized.lossless(Array("q", [1, 2]), np.int8) is not None
+    assert vectorized.lossless(Array("q", [1, 300]), np.int8) is None
+    assert vectorized.lossless(np.array([1, 2], np.int8), np.int64) is not None
+
+
+@pytest.mark.parametrize("method", ["nsmallest", "nlargest"])
+@pytest.mark.parametrize("dtype", ["int8", "int64", "float64"])
+def test_top_k_types_match_across_backends(method, dtype):
+    rng = random.Random(0)
+    array = np.array([rng.randrange(100) for _ in range(50)], dtype=dtype)
+    results = {
+        backend: getattr(QuickSort(array), method)(5, backend=backend)
+        for backend in ("python", "numpy")
+    }
+    assert results["python"] == results["numpy"]
+    assert [type(v) for v in results["python"]] == [type(v) for v in results["numpy"]]
+    assert all(type(v) in (int, float) for v in results["python"])
+
+
+@pytest.mark.parametrize("dtype", ["int16", "float32"])
+def test_select_types_match_across_backends(dtype):
+    array = np.array([5, 3, 9, 1], dtype=dtype)
+    results = [
+        QuickSort(array.copy()).select(1, backend=backend)
+        for backend in ("python", "numpy")
+    ]
+    assert results[0] == results[1] == 3
+    assert type(results[0]) is type(results[1])
+
+
+@pytest.mark.parametrize("method", ["merge", "adaptive", "intro"])
+@pytest.mark.parametrize("typecode", ["b", "q", "d"])
+def test_buffers_sort_the_same_across_backends(method, typecode):
+    rng = random.Random(1)
+    data = [rng.randrange(-100, 100) for _ in range(200)]
+    results = []
+    for backend in ("python", "numpy"):
+        array = Array(typecode, data)
+        sorter = MergeSort(array) if method != "intro" else QuickSort(array)
+        if method == "merge":
+            result = sorter.sort(backend=backend)
+        elif method == "adaptive":
+            result = sorter.adaptive_sort(backend=backend)
+        else:
+            result = sorter.intro_sort(backend=backend)
+        results.append(array if result is None else result)
+    assert type(results[0]) is type(results[1])
+    assert results[0].tolist() == results[1].tolist() == sorted(data)
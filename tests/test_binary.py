@@ -0,0 +1,86 @@
+import struct
+
+import pytest
+
+from rithm.backend import use_backend
+from rithm.searching.binary import BinarySearch, MappedBinarySearch
+
+np = pytest.importorskip("numpy")
+
+BIG = 2**63
+
+CASES = [
+    # Keys above the int64 range, which NumPy would otherwise turn into floats
+    ([1, 5, BIG + 1, BIG + 3], [BIG + 3, 5, BIG + 2]),
+    # Ints beyond 2**53 mixed with floats lose precision as float64
+    ([0.5, 2**53, 2**53 + 1, 2**60 + 1], [2**53 + 1, 2**60 + 1, 2**60, 0.5]),
+    ([1, 2, 3], [2**53 + 1, 1.0, 2.5, 3]),
+    # Tuples are no numbers at all
+    ([(1, 2), (3, 4), (5, 6)], [(3, 4), (1, 2), (0, 0)]),
+    ([1, 3, 3, 7], [7, 5, 1, -(2**70)]),
+    (list(range(0, 200, 2)), np.array([4, 5, 198], dtype=np.int16)),
+    (np.array([1, 2, 3], dtype=np.uint64), [-1, 2, BIG]),
+    (np.array([1, 2, 3], dtype=np.int32), np.array([1.0, 2.5, 3.0])),
+]
+
+
+@pytest.mark.parametrize("array, targets", CASES)
+@pytest.mark.parametrize("backend", ["auto", "numpy"])
+def test_search_many_matches_python_backend(array, targets, backend):
+    expected = BinarySearch(array, backend="python").search_many(targets)
+    assert BinarySearch(array, backend=backend).search_many(targets) == expected
+
+
+@pytest.mark.parametrize(
+    "key_format, targets",
+    [
+        ("<Q", [-1, 500, 501, 2**64 + 500, 500.5]),
+        ("!Q", [0, 10, 11, BIG]),
+        ("!i", [-10, 0, 10, 2**40]),
+        ("<d", [2.0, 2**53 + 1, 7.5]),
+    ],
+)
+def test_mapped_search_many_matches_python_backend(tmp_path, key_format, targets):
+    path = tmp_path / "keys.bin"
+    key = struct.Struct(key_format)
+    keys = [-10, 0, 2, 10, 500, 501] if "i" in key_format else [0, 2, 10, 500, 501]
+    path.write_bytes(b"".join(key.pack(k) for k in keys))
+
+    with MappedBinarySearch(path, key_format=key_format) as searcher:
+        with use_backend("python"):
+            expected = searcher.search_many(targets)
+        assert expected == [keys.index(t) if t in keys else None for t in targets]
+        assert searcher.search_many(targets) == expected
+        assert searcher._numpy_array(np) is not None
+
+
+def test_search_many_converts_a_list_only_for_large_batches():
+    array = list(range(0, 2000, 2))
+    searcher = BinarySearch(array, assume_sorted=True, backend="auto")
+    assert searcher.search_many([4, 5]) == [2, None]
+    assert not hasattr(searcher, "_numpy_keys")
+
+    # A batch of an eighth of the array pays for the conversion
+    targets = list(range(0, 250))
+    expected = [t // 2 if t % 2 == 0 else None for t in targets]
+    assert searcher.search_many(targets) == expected
+    assert isinstance(searcher._numpy_keys, np.ndarray)
+    # Once converted, small batches use the kept keys
+    assert searcher.search_many([1998, 3]) == [999, None]
+
+
+def test_search_many_numpy_backend_always_converts():
+    searcher = BinarySearch(list(range(100)), assume_sorted=True, backend="numpy")
+    assert searcher.search_many([3]) == [3]
+    assert isinstance(searcher._numpy_keys, np.ndarray)
+
+
+def test_search_many_python_backend_never_converts():
+    searcher = BinarySearch(list(range(100)), assume_sorted=True, backend="python")
+    assert searcher.search_many(list(range(100))) == list(range(100))
+    assert not hasattr(searcher, "_numpy_keys")
+
+
+def test_search_many_small_batch_from_a_generator():
+    searcher = BinarySearch(list(range(100)), assume_sorted=True)
+    assert searcher.search_many(t for t in (7, 200)) == [7, None]
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from rithm.sorting.external import ExternalSort
+
+
+class Record(object):
+    """Defines only __lt__, and unpickled copies are never identical."""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def _records(n, seed=0):
+    rng = random.Random(seed)
+    return [Record(rng.randrange(4), i) for i in range(n)]
+
+
+def _expected(records):
+    return [(r.key, r.tag) for r in sorted(records, key=lambda r: r.key)]
+
+
+@pytest.mark.parametrize("max_fan_in", [2, 3, 64])
+def test_sort_across_runs_is_stable(tmp_path, max_fan_in):
+    records = _records(300)
+    # A budget of a few records per chunk spills dozens of run files
+    sorter = ExternalSort(
+        records,
+        memory_limit=400,
+        max_fan_in=max_fan_in,
+        block_size=4,
+        tmp_dir=str(tmp_path),
+    )
+    result = [(r.key, r.tag) for r in sorter.sort()]
+    assert result == _expected(records)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sort_in_memory():
+    data = [5, 3, 9, 1, 3]
+    assert list(ExternalSort(data).sort()) == [1, 3, 3, 5, 9]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2])
+def test_edge_sizes(n):
+    data = list(range(n, 0, -1))
+    assert list(ExternalSort(data, memory_limit=1).sort()) == sorted(data)
+
+
+def test_sort_lines_of_a_file(tmp_path):
+    rng = random.Random(2)
+    lines = [b"%d\n" % rng.randrange(1000) for _ in range(500)]
+    source = tmp_path / "in.txt"
+    source.write_bytes(b"".join(lines).rstrip(b"\n"))
+    output = tmp_path / "out.txt"
+    ExternalSort(str(source), memory_limit=2000, max_fan_in=4).sort(str(output))
+    assert output.read_bytes() == b"".join(sorted(lines))
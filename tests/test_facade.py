@@ -0,0 +1,150 @@
+import subprocess
+import sys
+from array import array as Array
+
+import pytest
+
+import rithm
+from rithm.backend import vectorized
+from rithm.sorting.merge import MergeSort
+from rithm.sorting.radix import RadixSort
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Records which sorter the facade hands the array to."""
+    seen = []
+    for cls, name in ((MergeSort, "adaptive_sort"), (RadixSort, "sort")):
+        original = getattr(cls, name)
+
+        def spy(self, *args, _original=original, _name=cls.__name__, **kwargs):
+            seen.append(_name)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(cls, name, spy)
+    return seen
+
+
+def test_import_loads_no_submodule():
+    code = (
+        "import sys, rithm; "
+        "print(sorted(m for m in sys.modules if m.startswith('rithm') or m == 'numpy'))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "['rithm']"
+
+
+def test_lazy_names_are_the_submodule_objects():
+    from rithm.searching.binary import BinarySearch
+    from rithm.sorting.quick import QuickSort
+
+    assert rithm.QuickSort is QuickSort
+    assert rithm.BinarySearch is BinarySearch
+    assert rithm.sorting.quick.QuickSort is QuickSort
+    assert set(rithm.__all__) <= set(dir(rithm))
+    with pytest.raises(AttributeError):
+        rithm.NoSuchSort
+
+
+def test_sort_list_uses_list_sort(calls):
+    data = [3, 1, 2]
+    assert rithm.sort(data) is data and data == [1, 2, 3]
+    assert rithm.sort(["bb", "a", "ccc"], key=len) == ["a", "bb", "ccc"]
+    assert calls == []
+
+
+def test_sort_copies_other_iterables():
+    assert rithm.sort(x for x in (3, 1, 2)) == [1, 2, 3]
+    assert rithm.sort((2, 1), reverse=True) == [2, 1]
+
+
+@pytest.mark.parametrize("typecode", ["b", "H", "q"])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_large_integer_buffer_uses_radix_sort(calls, typecode, reverse):
+    lo = -100 if typecode.islower() else 0
+    data = [(i * 7919) % 200 + lo for i in range(2000)]
+    array = Array(typecode, data)
+    assert rithm.sort(array, reverse=reverse, backend="python") is array
+    assert array.tolist() == sorted(data, reverse=reverse)
+    assert calls == ["RadixSort"]
+
+
+@pytest.mark.parametrize(
+    "array",
+    [Array("q", range(100, 0, -1)), Array("d", range(2000, 0, -1))],
+)
+def test_sort_other_buffers_use_adaptive_sort(calls, array):
+    expected = sorted(array)
+    assert rithm.sort(array, backend="python") is array
+    assert array.tolist() == expected
+    assert calls == ["MergeSort"]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2])
+def test_sort_edge_sizes(calls, n):
+    array = Array("q", range(n, 0, -1))
+    assert rithm.sort(array).tolist() == list(range(1, n + 1))
+    assert rithm.sort(list(range(n, 0, -1))) == list(range(1, n + 1))
+
+
+def test_search_single_targets():
+    array = [(1, 2), (3, 4), (3, 4), (5, 6)]
+    # A tuple is one target, not a batch of two
+    assert rithm.search(array, (3, 4)) == 1
+    assert rithm.search(array, (4, 4)) is None
+    assert rithm.search([1, 3, 3, 7], 5, missing=-1) == -1
+
+
+def test_search_batches():
+    assert rithm.search([1, 3, 3, 7], [7, 5, 1]) == [3, None, 0]
+    assert rithm.search([1, 3, 3, 7], []) == []
+
+
+def test_search_list_stays_in_python(monkeypatch):
+    np = pytest.importorskip("numpy")
+    converted = []
+    original = vectorized.lossless
+
+    def spy(values, dtype=None):
+        converted.append(len(values))
+        return original(values, dtype)
+
+    monkeypatch.setattr(vectorized, "lossless", spy)
+    array = list(range(0, 200, 2))
+    targets = list(range(200))
+    expected = [t // 2 if t % 2 == 0 else None for t in targets]
+    assert rithm.search(array, targets) == expected
+    assert converted == []
+    assert rithm.search(array, targets, backend="numpy") == expected
+    assert converted != []
+    assert rithm.search(np.array(array), np.array(targets)) == expected
+
+
+def test_search_numpy_targets():
+    np = pytest.importorskip("numpy")
+    assert rithm.search([1, 3, 3, 7], np.int64(3)) == 1
+    assert rithm.search(np.array([1, 3, 3, 7]), 7) == 3
+
+
+def test_fib():
+    assert rithm.fib(0) == 0
+    assert rithm.fib(90) == 2880067194370816120
+    assert rithm.fib([10, 20]) == [55, 6765]
+    assert rithm.fib(10, 7) == 6
+    assert rithm.fib([10, 20], mod=7) == [6, 3]
+    assert rithm.fib(iter([1, 2])) == [1, 1]
+
+
+def test_fib_numpy_integers():
+    np = pytest.importorskip("numpy")
+    result = rithm.fib(np.int64(100))
+    assert result == 354224848179261915075 and type(result) is int
+    assert rithm.fib(np.uint8(10), 7) == 6
+    assert rithm.fib(np.array([10, 100])) == [55, 354224848179261915075]
+
+
+def test_fib_rejects_bools():
+    with pytest.raises(TypeError):
+        rithm.fib(True)
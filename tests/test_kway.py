@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from rithm.sorting.merge import kway_merge
+
+
+class Record(object):
+    """Defines only __lt__, so == between records falls back to identity."""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def _runs(count, n, seed=0):
+    rng = random.Random(seed)
+    runs = []
+    for r in range(count):
+        keys = sorted(rng.randrange(3) for _ in range(n))
+        runs.append([Record(k, (r, i)) for i, k in enumerate(keys)])
+    return runs
+
+
+def _expected(runs, reverse=False):
+    # sorted is stable, so the concatenated runs give the reference order
+    flat = [record for run in runs for record in run]
+    return [r.tag for r in sorted(flat, key=lambda r: r.key, reverse=reverse)]
+
+
+@pytest.mark.parametrize("count", [3, 4, 8])
+def test_merge_of_many_runs_is_stable(count):
+    runs = _runs(count, 50, count)
+    assert [r.tag for r in kway_merge(*runs)] == _expected(runs)
+
+
+@pytest.mark.parametrize("count", [2, 5])
+def test_merge_with_key_is_stable(count):
+    runs = _runs(count, 30, count)
+    merged = kway_merge(*runs, key=lambda r: r.key)
+    assert [r.tag for r in merged] == _expected(runs)
+
+
+@pytest.mark.parametrize("count", [2, 5])
+def test_reverse_merge_is_stable(count):
+    runs = [run[::-1] for run in _runs(count, 30, count)]
+    merged = kway_merge(*runs, reverse=True)
+    assert [r.tag for r in merged] == _expected(runs, reverse=True)
+
+
+def test_merge_of_numbers():
+    rng = random.Random(1)
+    runs = [sorted(rng.random() for _ in range(rng.randrange(20))) for _ in range(6)]
+    assert list(kway_merge(*runs)) == sorted(x for run in runs for x in run)
+
+
+@pytest.mark.parametrize(
+    "runs, expected",
+    [
+        ((), []),
+        (([],), []),
+        (([], [], []), []),
+        (([1, 2],), [1, 2]),
+        (([], [2], []), [2]),
+        (([1, 3], [2]), [1, 2, 3]),
+        ((iter([1, 4]), (2, 3), range(0, 6, 5)), [0, 1, 2, 3, 4, 5]),
+    ],
+)
+def test_edge_inputs(runs, expected):
+    assert list(kway_merge(*runs)) == expected
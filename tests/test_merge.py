@@ -0,0 +1,133 @@
+import functools
+import random
+from array import array as Array
+
+import pytest
+
+from rithm.sorting.merge import MergeSort
+from rithm.sorting.stats import SortStats
+
+
+@functools.total_ordering
+class Record(object):
+    """Compares by key only, so equal keys expose the order of the tags."""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def _records(n, seed=0):
+    rng = random.Random(seed)
+    return [Record(rng.randrange(4), i) for i in range(n)]
+
+
+def _tags(records):
+    return [(r.key, r.tag) for r in records]
+
+
+def _expected(records, reverse=False):
+    # sorted is stable, so it gives the reference order of the tags
+    return _tags(sorted(records, key=lambda r: r.key, reverse=reverse))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 64, 65, 1000])
+@pytest.mark.parametrize("cutoff", [1, 8, None])
+def test_bottom_up_sort_is_stable(n, cutoff):
+    records = _records(n, n)
+    array = records[:]
+    result = MergeSort(array).bottom_up_sort(cutoff=cutoff, backend="python")
+    assert result is array
+    assert _tags(array) == _expected(records)
+
+
+def test_bottom_up_sort_into_out_leaves_the_input():
+    data = [5, 3, 9, 1, 3]
+    out = [None] * len(data)
+    result = MergeSort(data).bottom_up_sort(out=out, backend="python")
+    assert result is out and out == [1, 3, 3, 5, 9]
+    assert data == [5, 3, 9, 1, 3]
+
+
+def test_bottom_up_sort_allocates_one_buffer():
+    stats = SortStats()
+    MergeSort(list(range(1000, 0, -1))).bottom_up_sort(stats=stats, backend="python")
+    assert stats.allocations == 1
+
+
+def test_bottom_up_sort_key_and_reverse_are_stable():
+    records = _records(300, 1)
+    for reverse in (False, True):
+        array = records[:]
+        MergeSort(array).bottom_up_sort(
+            key=lambda r: r.key, reverse=reverse, backend="python"
+        )
+        assert _tags(array) == _expected(records, reverse)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 31, 64, 65, 1000, 5000])
+def test_adaptive_sort_is_stable(n):
+    records = _records(n, n)
+    array = records[:]
+    assert MergeSort(array).adaptive_sort(backend="python") is array
+    assert _tags(array) == _expected(records)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        list(range(2000)),
+        list(range(2000, 0, -1)),
+        list(range(1000)) + list(range(500)),
+        list(range(1000, 0, -1)) + list(range(1000)),
+        [random.Random(3).randrange(100) for _ in range(2000)],
+        list(range(1000)) * 3,
+    ],
+)
+def test_adaptive_sort_orders_runs(data):
+    array = data[:]
+    MergeSort(array).adaptive_sort(backend="python")
+    assert array == sorted(data)
+
+
+def test_adaptive_sort_is_linear_on_sorted_input():
+    stats = SortStats()
+    MergeSort(list(range(10_000))).adaptive_sort(stats=stats, backend="python")
+    # One run and nothing to merge
+    assert stats.partition_sizes == []
+
+
+def test_adaptive_sort_reverses_strictly_descending_runs_stably():
+    # Equal elements inside a descending stretch must not be reversed
+    records = [Record(k, i) for i, k in enumerate([5, 4, 4, 3, 2, 2, 1] * 20)]
+    array = records[:]
+    MergeSort(array).adaptive_sort(backend="python")
+    assert _tags(array) == _expected(records)
+
+
+def test_adaptive_sort_key_and_reverse_are_stable():
+    records = _records(500, 2)
+    for reverse in (False, True):
+        array = records[:]
+        MergeSort(array).adaptive_sort(
+            key=lambda r: r.key, reverse=reverse, backend="python"
+        )
+        assert _tags(array) == _expected(records, reverse)
+
+
+@pytest.mark.parametrize("method", ["bottom_up_sort", "adaptive_sort"])
+@pytest.mark.parametrize("typecode", ["B", "q", "d"])
+def test_typed_buffers_stay_typed(method, typecode):
+    rng = random.Random(4)
+    data = Array(typecode, [rng.randrange(100) for _ in range(700)])
+    for reverse in (False, True):
+        array = Array(typecode, data)
+        result = getattr(MergeSort(array), method)(reverse=reverse, backend="python")
+        assert result is array and array.typecode == typecode
+        assert array.tolist() == sorted(data, reverse=reverse)
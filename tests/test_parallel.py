@@ -0,0 +1,80 @@
+import functools
+import random
+from array import array as Array
+
+import pytest
+
+from rithm.sorting.parallel import ParallelSort
+
+
+@functools.total_ordering
+class Record(object):
+    """Compares by key only, so equal keys expose the order of the tags."""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def _values(n, seed=0):
+    rng = random.Random(seed)
+    return [rng.randrange(-500, 500) for _ in range(n)]
+
+
+@pytest.mark.parametrize("method", ["merge", "sample"])
+def test_sort_list_in_workers(method):
+    data = _values(2000)
+    result = ParallelSort(data, workers=2, threshold=10).sort(method)
+    assert type(result) is list and result == sorted(data)
+    assert data == _values(2000)
+
+
+@pytest.mark.parametrize("method", ["merge", "sample"])
+def test_sort_list_is_stable(method):
+    rng = random.Random(1)
+    records = [Record(rng.randrange(5), i) for i in range(1000)]
+    result = ParallelSort(records, workers=3, threshold=10).sort(method)
+    expected = sorted(records, key=lambda r: r.key)
+    assert [(r.key, r.tag) for r in result] == [(r.key, r.tag) for r in expected]
+
+
+@pytest.mark.parametrize("method", ["merge", "sample"])
+@pytest.mark.parametrize("typecode", ["b", "H", "q", "d"])
+def test_sort_shared_array(method, typecode):
+    data = [abs(v) % 100 for v in _values(2000)]
+    array = Array(typecode, data)
+    result = ParallelSort(array, workers=2, threshold=10).sort(method)
+    assert type(result) is Array and result.typecode == typecode
+    assert result.tolist() == sorted(array.tolist())
+    assert array.tolist() == [float(v) if typecode == "d" else v for v in data]
+
+
+@pytest.mark.parametrize("method", ["merge", "sample"])
+@pytest.mark.parametrize("threshold", [10, 10_000])
+def test_unicode_array_stays_an_array(method, threshold):
+    # "u" arrays cannot be cast to a memoryview, so they are pickled
+    array = Array("u", "the quick brown fox jumps over the lazy dog" * 10)
+    result = ParallelSort(array, workers=2, threshold=threshold).sort(method)
+    assert type(result) is Array and result.typecode == "u"
+    assert result.tounicode() == "".join(sorted(array.tounicode()))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2])
+def test_edge_sizes(n):
+    data = list(range(n, 0, -1))
+    assert ParallelSort(data, workers=2, threshold=0).sort() == sorted(data)
+    typed = Array("q", data)
+    assert ParallelSort(typed, workers=2, threshold=0).sort() == Array(
+        "q", sorted(data)
+    )
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        ParallelSort([1], workers=2).sort("bogo")
@@ -0,0 +1,93 @@
+import random
+from array import array as Array
+
+import pytest
+
+from rithm.sorting.quick import QuickSort
+from rithm.sorting.stats import SortStats
+
+
+def _inputs(n):
+    rng = random.Random(n)
+    return {
+        "random": [rng.randrange(n) for _ in range(n)],
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "few-unique": [rng.randrange(3) for _ in range(n)],
+        "organ-pipe": list(range(n // 2)) + list(range(n - n // 2, 0, -1)),
+    }
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 17, 1000])
+def test_intro_sort_orders_every_shape(n):
+    for shape, data in _inputs(n).items():
+        array = data[:]
+        QuickSort(array).intro_sort(backend="python")
+        assert array == sorted(data), shape
+
+
+def test_intro_sort_does_not_recurse_on_sorted_input():
+    # Recursive Lomuto partitioning hits the recursion limit on these
+    for data in (list(range(20_000)), list(range(20_000, 0, -1))):
+        array = data[:]
+        QuickSort(array).intro_sort(backend="python")
+        assert array == sorted(data)
+
+
+def test_inplace_sort_introsort_mode():
+    data = list(range(5000, 0, -1))
+    QuickSort(data).inplace_sort(0, len(data) - 1, introsort=True, backend="python")
+    assert data == list(range(1, 5001))
+
+
+def test_intro_sort_slice_leaves_the_rest_alone():
+    array = [9, 8, 7, 3, 1, 2, 0]
+    QuickSort(array).intro_sort(2, 5, backend="python")
+    assert array == [9, 8, 1, 2, 3, 7, 0]
+
+
+def test_intro_sort_stack_stays_logarithmic():
+    stats = SortStats()
+    QuickSort(list(range(4096))).intro_sort(stats=stats, backend="python")
+    assert stats.max_depth <= 2 * (4096).bit_length()
+
+
+def test_intro_sort_key_and_reverse():
+    rng = random.Random(1)
+    records = [(rng.randrange(5), i) for i in range(300)]
+    for reverse in (False, True):
+        array = records[:]
+        QuickSort(array).intro_sort(
+            key=lambda r: r[0], reverse=reverse, backend="python"
+        )
+        # QuickSort is not stable, so only the keys have a fixed order
+        assert sorted(array) == sorted(records)
+        keys = [r[0] for r in array]
+        assert keys == sorted(keys, reverse=reverse)
+
+
+@pytest.mark.parametrize("typecode", ["b", "q", "d"])
+def test_intro_sort_typed_buffers_in_place(typecode):
+    rng = random.Random(2)
+    data = [rng.randrange(-100, 100) for _ in range(500)]
+    for reverse in (False, True):
+        array = Array(typecode, data)
+        QuickSort(array).intro_sort(reverse=reverse, backend="python")
+        assert isinstance(array, Array) and array.typecode == typecode
+        assert array.tolist() == sorted(Array(typecode, data), reverse=reverse)
+
+
+@pytest.mark.parametrize("key, reverse", [(abs, False), (None, True), (abs, True)])
+def test_inplace_sort_forwards_stats_with_key_or_reverse(key, reverse):
+    rng = random.Random(3)
+    data = [rng.randrange(-1000, 1000) for _ in range(500)]
+    events = []
+    stats = SortStats(callback=lambda event, info: events.append((event, info)))
+    array = data[:]
+    QuickSort(array).inplace_sort(0, 499, key=key, reverse=reverse, stats=stats)
+    # Keyed QuickSort is not stable, so only the order of the keys is checked
+    keys = key or (lambda value: value)
+    assert [keys(v) for v in array] == sorted(map(keys, data), reverse=reverse)
+    assert sorted(array) == sorted(data)
+    assert stats.max_depth >= 1 and stats.partition_sizes[0] == 500
+    assert all(0 <= info["low"] <= info["high"] <= 499 for _, info in events)
@@ -0,0 +1,77 @@
+import enum
+import random
+from array import array as Array
+
+import pytest
+
+from rithm.sorting.radix import RadixSort
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    MID = 5
+    HIGH = 9
+
+
+def _values(n, lo, hi, seed=0):
+    rng = random.Random(seed)
+    return [rng.randint(lo, hi) for _ in range(n)]
+
+
+@pytest.mark.parametrize("method", ["sort", "counting_sort", "radix_sort"])
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 100, 1000])
+@pytest.mark.parametrize("lo, hi", [(0, 9), (-500, 500), (-(2**70), 2**70)])
+def test_sorts_lists(method, n, lo, hi):
+    if method == "counting_sort" and hi > 1000:
+        pytest.skip("the counts would not fit in memory")
+    data = _values(n, lo, hi, n)
+    array = data[:]
+    assert getattr(RadixSort(array), method)() is array
+    assert array == sorted(data)
+
+
+@pytest.mark.parametrize("digit_bits", [1, 3, 8, 16])
+def test_radix_sort_digit_widths(digit_bits):
+    data = _values(500, -(10**6), 10**6)
+    array = data[:]
+    RadixSort(array).radix_sort(digit_bits=digit_bits)
+    assert array == sorted(data)
+
+
+@pytest.mark.parametrize("method", ["sort", "counting_sort", "radix_sort"])
+@pytest.mark.parametrize("typecode", ["b", "B", "h", "q", "Q"])
+def test_sorts_typed_buffers_in_place(method, typecode):
+    lo = 0 if typecode.isupper() else -100
+    data = _values(300, lo, 100)
+    array = Array(typecode, data)
+    sorter = RadixSort(array)
+    kwargs = {"backend": "python"} if method == "sort" else {}
+    assert getattr(sorter, method)(**kwargs) is array
+    assert array.tolist() == sorted(data)
+
+
+@pytest.mark.parametrize("method", ["sort", "counting_sort", "radix_sort"])
+def test_keeps_int_subclasses(method):
+    data = [Level.HIGH, True, 3, Level.LOW, False, Level.MID, 1]
+    array = data[:]
+    getattr(RadixSort(array), method)()
+    expected = sorted(data)
+    assert [(v, type(v)) for v in array] == [(v, type(v)) for v in expected]
+
+
+@pytest.mark.parametrize("method", ["sort", "counting_sort", "radix_sort"])
+@pytest.mark.parametrize(
+    "data",
+    [[1, 2.5, 3], [1.0, 2, 3], [3, "a", 1], Array("d", [2.0, 1.0])],
+)
+def test_rejects_non_integer_keys_up_front(method, data):
+    array = data[:]
+    with pytest.raises(TypeError):
+        getattr(RadixSort(array), method)()
+    assert array == data
+
+
+def test_radix_sort_is_stable():
+    data = [Level.MID, 5, Level.LOW, 1, 5, Level.MID]
+    RadixSort(data).radix_sort(digit_bits=1)
+    assert [type(v) for v in data] == [Level, int, Level, int, int, Level]
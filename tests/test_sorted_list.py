@@ -0,0 +1,150 @@
+import bisect
+import random
+
+import pytest
+
+from rithm.searching.sorted_list import SortedList
+
+
+def _check(sl, model):
+    assert len(sl) == len(model)
+    assert list(sl) == model
+    assert list(reversed(sl)) == model[::-1]
+    for value in set(model) | {min(model, default=0) - 1, max(model, default=0) + 1}:
+        assert sl.bisect_left(value) == bisect.bisect_left(model, value)
+        assert sl.bisect_right(value) == bisect.bisect_right(model, value)
+        assert sl.count(value) == model.count(value)
+        assert (value in sl) == (value in model)
+
+
+@pytest.mark.parametrize("load", [2, 3, 1000])
+def test_random_operations_match_a_sorted_list(load):
+    rng = random.Random(load)
+    sl = SortedList(load=load)
+    model = []
+    for step in range(2000):
+        op = rng.random()
+        if op < 0.5 or not model:
+            value = rng.randrange(50)
+            sl.add(value)
+            bisect.insort_right(model, value)
+        elif op < 0.7:
+            value = rng.randrange(50)
+            assert sl.discard(value) == (value in model)
+            if value in model:
+                model.remove(value)
+        elif op < 0.85:
+            index = rng.randrange(-len(model), len(model))
+            assert sl.pop(index) == model.pop(index)
+        else:
+            index = rng.randrange(-len(model), len(model))
+            assert sl[index] == model[index]
+            del sl[index]
+            del model[index]
+        if step % 97 == 0:
+            _check(sl, model)
+    _check(sl, model)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 10])
+@pytest.mark.parametrize("assume_sorted", [False, True])
+def test_build(n, assume_sorted):
+    values = list(range(n)) if assume_sorted else list(range(n, 0, -1))
+    sl = SortedList(values, assume_sorted=assume_sorted, load=2)
+    _check(sl, sorted(values))
+    assert repr(sl) == f"SortedList({sorted(values)!r})"
+
+
+def test_add_keeps_equal_values_in_insertion_order():
+    class Item(object):
+        def __init__(self, key, tag):
+            self.key, self.tag = key, tag
+
+        def __lt__(self, other):
+            return self.key < other.key
+
+    sl = SortedList(load=2)
+    for tag, key in enumerate([1, 0, 1, 1, 0, 1, 1]):
+        sl.add(Item(key, tag))
+    assert [(item.key, item.tag) for item in sl] == [
+        (0, 1),
+        (0, 4),
+        (1, 0),
+        (1, 2),
+        (1, 3),
+        (1, 5),
+        (1, 6),
+    ]
+
+
+def test_index_search_and_remove():
+    sl = SortedList([5, 1, 3, 3, 9], load=2)
+    assert sl.index(3) == 1 and sl.search(3) == 1
+    assert sl.search(4) is None and sl.search(10) is None
+    with pytest.raises(ValueError):
+        sl.index(4)
+    sl.remove(3)
+    assert list(sl) == [1, 3, 5, 9]
+    with pytest.raises(ValueError):
+        sl.remove(4)
+    assert not sl.discard(10)
+
+
+def test_slices():
+    values = list(range(0, 40, 2))
+    sl = SortedList(values, load=2)
+    for s in (
+        slice(3, 11),
+        slice(None, 5),
+        slice(-4, None),
+        slice(8, 2),
+        slice(1, 15, 3),
+    ):
+        assert sl[s] == values[s]
+    del sl[2:12:2]
+    del values[2:12:2]
+    _check(sl, values)
+
+
+@pytest.mark.parametrize(
+    "lo, hi", [(2, 5), (-5, 0), (0, 100), (7, 7), (50, 60), (3, 2)]
+)
+def test_range_is_half_open(lo, hi):
+    values = [0, 1, 2, 2, 3, 4, 5, 6, 7, 8, 9]
+    sl = SortedList(values, load=2)
+    assert list(sl.range(lo, hi)) == [v for v in values if lo <= v < hi]
+
+
+@pytest.mark.parametrize("batch", [3, 50])
+def test_update(batch):
+    rng = random.Random(batch)
+    start = [rng.randrange(100) for _ in range(40)]
+    more = [rng.randrange(100) for _ in range(batch)]
+    sl = SortedList(start, load=3)
+    sl.update(iter(more))
+    _check(sl, sorted(start + more))
+
+
+def test_empty_list():
+    sl = SortedList()
+    _check(sl, [])
+    assert list(sl.range(0, 10)) == []
+    assert sl[0:3] == []
+    with pytest.raises(IndexError):
+        sl[0]
+    with pytest.raises(IndexError):
+        sl.pop()
+    sl.add(1)
+    sl.clear()
+    _check(sl, [])
+
+
+def test_bound_aliases():
+    sl = SortedList([1, 2, 2, 3])
+    assert sl.lower_bound(2) == 1
+    assert sl.upper_bound(2) == sl.bisect(2) == 3
+
+
+def test_load_must_be_at_least_two():
+    with pytest.raises(ValueError):
+        SortedList(load=1)